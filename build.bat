@@ -142,6 +142,15 @@ if not exist "assets\icon.ico" (
 )
 echo.
 
+echo [1.6/5] 编译Qt资源文件...
+pyrcc5 -o src\ui\qt_resources.py assets\resources.qrc
+if errorlevel 1 (
+    echo [警告] Qt资源编译失败，图标和样式表将从文件加载
+) else (
+    echo [OK] Qt资源已生成: src\ui\qt_resources.py
+)
+echo.
+
 echo [2/5] 清理旧的构建文件...
 if exist "build" rmdir /s /q "build"
 if exist "dist\AutoVoiceType" rmdir /s /q "dist\AutoVoiceType"
@@ -2,6 +2,7 @@
 配置管理模块
 负责加载、保存和验证应用程序配置
 """
+import copy
 import json
 import logging
 import os
@@ -22,6 +23,8 @@ class ConfigManager:
             "dashscope_api_key": "",
             "dashscope_base_websocket_url": "wss://dashscope.aliyuncs.com/api-ws/v1/inference",
             "dashscope_model": "qwen3-asr-flash-realtime",
+            "dashscope_send_batch_chunks": 2,  # audio chunks amplified and sent per frame
+            "dashscope_send_batch_max_ms": 400,  # longest a partial batch is held before sending
             # Doubao (ByteDance) settings
             "doubao_app_id": "",
             "doubao_access_token": "",
@@ -33,14 +36,15 @@ class ConfigManager:
             "sample_rate": 16000,
             "channels": 1,
             "chunk_size": 3200,
-            "format": "pcm"
+            "format": "pcm",
+            "capture_at_native_rate": False  # 以麦克风原生采样率采集并在程序内降采样（仅整数倍时生效）
         },
         "hotkey": {
             "trigger_key": "ctrl_r",  # Right Ctrl key
             "description": "Right Control Key"
         },
         "input": {
-            "preferred_method": "clipboard",  # clipboard, win32, pyautogui
+            "preferred_method": "clipboard",  # clipboard, sendinput, win32, pyautogui
             "input_delay": 0.05,              # 字符间延迟（秒）
             "paste_delay": 0.1,               # 粘贴前后延迟（秒）
             "restore_clipboard": True,        # 是否恢复剪贴板
@@ -49,7 +53,8 @@ class ConfigManager:
         "general": {
             "auto_start": False,
             "language": "zh-CN",
-            "log_level": "INFO"
+            "log_level": "INFO",
+            "overlay_opaque": False  # 录音动画使用不透明背景（减少桌面合成开销）
         },
         "recognition": {
             "semantic_punctuation_enabled": False,
@@ -98,7 +103,7 @@ class ConfigManager:
         """
         if not self.config_file.exists():
             logger.info("配置文件不存在，创建默认配置")
-            self.config = self.DEFAULT_CONFIG.copy()
+            self.config = copy.deepcopy(self.DEFAULT_CONFIG)
             self.save_config()
         else:
             try:
@@ -110,7 +115,7 @@ class ConfigManager:
                 self._merge_default_config()
             except json.JSONDecodeError as e:
                 logger.error(f"配置文件格式错误: {e}，将使用默认配置")
-                self.config = self.DEFAULT_CONFIG.copy()
+                self.config = copy.deepcopy(self.DEFAULT_CONFIG)
                 self.save_config()
             except Exception as e:
                 logger.error(f"加载配置文件失败: {e}")
@@ -124,13 +129,13 @@ class ConfigManager:
             """递归合并字典"""
             for key, value in default.items():
                 if key not in current:
-                    current[key] = value
+                    current[key] = copy.deepcopy(value)
                     logger.debug(f"添加缺失的配置项: {key}")
                 elif isinstance(value, dict) and isinstance(current[key], dict):
                     merge_dict(value, current[key])
             return current
         
-        self.config = merge_dict(self.DEFAULT_CONFIG.copy(), self.config)
+        self.config = merge_dict(self.DEFAULT_CONFIG, self.config)
     
     def save_config(self) -> bool:
         """
@@ -199,6 +204,39 @@ class ConfigManager:
             logger.error(f"设置配置项 {key_path} 失败: {e}")
             return False
     
+    def update(self, changes: dict) -> bool:
+        """
+        批量设置配置项，同一配置节下的多个键只遍历一次路径
+        
+        Args:
+            changes: 配置路径到配置值的映射，如 {"api.provider": "doubao"}
+            
+        Returns:
+            bool: 是否全部设置成功
+        """
+        # 按父路径分组：{"api": {"provider": ..., "dashscope_model": ...}, ...}
+        sections: dict = {}
+        for key_path, value in changes.items():
+            parent_path, _, key = key_path.rpartition('.')
+            sections.setdefault(parent_path, {})[key] = value
+        
+        success = True
+        for parent_path, values in sections.items():
+            config = self.config
+            try:
+                if parent_path:
+                    for key in parent_path.split('.'):
+                        config = config.setdefault(key, {})
+                config.update(values)
+            except Exception as e:
+                logger.error(f"批量设置配置节 {parent_path or '<root>'} 失败: {e}")
+                success = False
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            for key_path, value in changes.items():
+                logger.debug(f"配置项 {key_path} 已设置为: {value}")
+        return success
+    
     def validate_api_key(self) -> bool:
         """
         验证当前提供商的API密钥/凭证是否已配置且非空
@@ -8,6 +8,7 @@ import threading
 import time
 from pathlib import Path
 
+from PyQt5 import sip
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import QTimer, Qt, pyqtSignal, QObject
 
@@ -79,6 +80,7 @@ class AutoVoiceTypeApp(QObject):
 
     # 定义信号用于线程间通信
     recording_start_failed = pyqtSignal(str)  # 录音启动失败信号
+    recognition_result_received = pyqtSignal(str)  # 识别结果信号（识别线程 -> 主线程）
 
     def __init__(self, qt_app: QApplication):
         """
@@ -102,6 +104,7 @@ class AutoVoiceTypeApp(QObject):
 
         # 连接信号
         self.recording_start_failed.connect(self._on_recording_start_failed)
+        self.recognition_result_received.connect(self._handle_recognition_result)
 
         self.logger.info("=" * 60)
         self.logger.info("AutoVoiceType 应用启动")
@@ -189,7 +192,9 @@ class AutoVoiceTypeApp(QObject):
             
             # 7. 初始化录音动画窗口
             self.logger.info("正在初始化录音动画窗口...")
-            self.recording_widget = RecordingWidget()
+            self.recording_widget = RecordingWidget(
+                opaque=self.config_manager.get('general.overlay_opaque', False)
+            )
             
             # 8. 初始化系统托盘
             self.logger.info("正在初始化系统托盘...")
@@ -204,10 +209,7 @@ class AutoVoiceTypeApp(QObject):
             # 显示托盘图标
             self.tray_app.show()
             
-            # 9. 初始化设置窗口（但不显示）
-            self.logger.info("正在初始化设置窗口...")
-            self.settings_window = SettingsWindow(self.config_manager)
-            self.settings_window.config_saved.connect(self._on_config_saved)
+            # 9. 设置窗口在用户首次打开设置时才创建（见 on_settings_requested）
             
             # 10. 初始化自动启动管理器
             self.logger.info("正在初始化自动启动管理器...")
@@ -307,7 +309,16 @@ class AutoVoiceTypeApp(QObject):
     
     def on_recognition_result(self, text: str) -> None:
         """
-        识别结果回调
+        识别结果回调（在识别线程中调用，转发到主线程处理）
+        
+        Args:
+            text: 识别出的文本
+        """
+        self.recognition_result_received.emit(text)
+    
+    def _handle_recognition_result(self, text: str) -> None:
+        """
+        处理识别结果（在主线程中执行）
         
         Args:
             text: 识别出的文本
@@ -335,42 +346,63 @@ class AutoVoiceTypeApp(QObject):
                 self.logger.info(f"目标窗口: {window_title}")
                 self.logger.debug(f"窗口详细信息: {window_info}")
             
-            # 执行输入
-            success = self.text_simulator.input_text(text)
-            
-            if success:
-                self.logger.info(f"文本输入成功，已输入 {len(text)} 字符到目标窗口")
-                # 成功时不显示通知，仅记录日志
-            else:
-                self.logger.error("文本输入失败，无法将识别结果输入到当前窗口")
-                
-                # 显示失败通知
-                if self.tray_app:
-                    self.tray_app.show_message(
-                        "输入失败",
-                        "无法输入文本到当前窗口",
-                        self.tray_app.tray_icon.Warning
-                    )
+            # 在后台线程执行输入，完成后回到主线程处理结果
+            text_length = len(text)
+            self.text_simulator.input_text_async(
+                text,
+                lambda success: self._on_text_input_finished(success, text_length)
+            )
         else:
             self.logger.warning("文本输入模拟器未初始化，无法输入识别结果")
     
+    def _on_text_input_finished(self, success: bool, text_length: int) -> None:
+        """
+        文本输入完成回调（在主线程中执行）
+        
+        Args:
+            success: 是否输入成功
+            text_length: 输入文本长度
+        """
+        if success:
+            self.logger.info(f"文本输入成功，已输入 {text_length} 字符到目标窗口")
+            # 成功时不显示通知，仅记录日志
+            return
+        
+        self.logger.error("文本输入失败，无法将识别结果输入到当前窗口")
+        
+        # 显示失败通知
+        if self.tray_app:
+            self.tray_app.show_message(
+                "输入失败",
+                "无法输入文本到当前窗口",
+                self.tray_app.tray_icon.Warning
+            )
+    
     def on_settings_requested(self) -> None:
         """设置请求回调"""
         self.logger.info("设置功能被请求")
         
+        # 设置窗口延迟到首次打开时创建，未打开设置时不占用页面控件、样式表等资源
+        if self.settings_window is None or sip.isdeleted(self.settings_window):
+            try:
+                self.logger.info("正在初始化设置窗口...")
+                self.settings_window = SettingsWindow(self.config_manager)
+                self.settings_window.config_saved.connect(self._on_config_saved)
+            except Exception as e:
+                self.settings_window = None
+                self.logger.error(f"设置窗口初始化失败: {e}", exc_info=True)
+                if self.tray_app:
+                    self.tray_app.show_message(
+                        "错误",
+                        "设置窗口未正确初始化",
+                        self.tray_app.tray_icon.Warning
+                    )
+                return
+        
         # 显示设置窗口
-        if self.settings_window:
-            self.settings_window.show()
-            self.settings_window.activateWindow()  # 激活窗口
-            self.logger.info("设置窗口已打开")
-        else:
-            self.logger.error("设置窗口未初始化")
-            if self.tray_app:
-                self.tray_app.show_message(
-                    "错误",
-                    "设置窗口未正确初始化",
-                    self.tray_app.tray_icon.Warning
-                )
+        self.settings_window.show()
+        self.settings_window.activateWindow()  # 激活窗口
+        self.logger.info("设置窗口已打开")
     
     def on_quit_requested(self) -> None:
         """退出请求回调"""
@@ -0,0 +1,270 @@
+"""
+Shared PortAudio device access
+Keeps one PyAudio instance alive for the whole process so recording sessions only open and close streams,
+and provides optional in-app downsampling for capturing at the input device's native rate
+"""
+import atexit
+import logging
+import math
+import threading
+from typing import Optional, Tuple
+
+import numpy as np
+import pyaudio
+
+logger = logging.getLogger(__name__)
+
+# Peak level at which 2x amplification would clip, so amplification is skipped
+AMPLIFY_SKIP_PEAK = 16384
+# Peak level below which 4x amplification still cannot clip
+AMPLIFY_BOOST_PEAK = 8192
+
+# Shared PortAudio instance, initialized on first use and terminated at process exit
+_PA_INSTANCE: Optional[pyaudio.PyAudio] = None
+_PA_LOCK = threading.Lock()
+_PA_USERS = 0  # Recording sessions currently holding the instance for an open stream
+
+
+def _get_instance_locked() -> pyaudio.PyAudio:
+    """Create the shared instance if needed; caller must hold _PA_LOCK"""
+    global _PA_INSTANCE
+    if _PA_INSTANCE is None:
+        _PA_INSTANCE = pyaudio.PyAudio()
+        logger.debug("Shared PyAudio instance created")
+    return _PA_INSTANCE
+
+
+def get_shared_pyaudio() -> pyaudio.PyAudio:
+    """
+    Get the process-wide PyAudio instance, creating it on first use
+
+    Returns:
+        pyaudio.PyAudio: Shared PyAudio instance
+    """
+    with _PA_LOCK:
+        return _get_instance_locked()
+
+
+def acquire_shared_pyaudio() -> pyaudio.PyAudio:
+    """
+    Get the shared PyAudio instance for opening a stream
+
+    While acquired, reinitialize_shared_pyaudio() leaves the instance alone. Pair every call
+    with release_shared_pyaudio() once the stream is closed.
+
+    Returns:
+        pyaudio.PyAudio: Shared PyAudio instance
+    """
+    global _PA_USERS
+    with _PA_LOCK:
+        pa = _get_instance_locked()
+        _PA_USERS += 1
+        return pa
+
+
+def release_shared_pyaudio() -> None:
+    """Release an instance obtained with acquire_shared_pyaudio()"""
+    global _PA_USERS
+    with _PA_LOCK:
+        if _PA_USERS > 0:
+            _PA_USERS -= 1
+
+
+def reinitialize_shared_pyaudio() -> pyaudio.PyAudio:
+    """
+    Recreate the shared PyAudio instance so PortAudio rescans the device list
+
+    PortAudio only enumerates devices in Pa_Initialize, and Pa_Terminate only takes effect once every
+    initialization has been terminated, so this is the only instance that needs recreating. If a
+    recording session holds the instance, terminating it would kill the open stream; the existing
+    instance is returned unchanged instead.
+
+    Returns:
+        pyaudio.PyAudio: Shared PyAudio instance (fresh unless a stream is open)
+    """
+    global _PA_INSTANCE
+    with _PA_LOCK:
+        if _PA_USERS > 0:
+            logger.debug("Audio stream open, keeping current PyAudio instance")
+        elif _PA_INSTANCE is not None:
+            try:
+                _PA_INSTANCE.terminate()
+            except Exception as e:
+                logger.debug(f"Error terminating shared PyAudio instance: {e}")
+            _PA_INSTANCE = None
+        return _get_instance_locked()
+
+
+@atexit.register
+def terminate_shared_pyaudio() -> None:
+    """Terminate the shared PyAudio instance"""
+    global _PA_INSTANCE
+    with _PA_LOCK:
+        if _PA_INSTANCE is None:
+            return
+        try:
+            _PA_INSTANCE.terminate()
+        except Exception as e:
+            logger.debug(f"Error terminating shared PyAudio instance: {e}")
+        _PA_INSTANCE = None
+
+
+def native_rate_factor(pa: pyaudio.PyAudio, target_rate: int) -> int:
+    """
+    Get the integer decimation factor from the default input device's native rate to target_rate
+
+    Args:
+        pa: PyAudio instance
+        target_rate: Sample rate expected by the recognition service
+
+    Returns:
+        int: native_rate // target_rate when the native rate is an exact multiple of target_rate, otherwise 1
+    """
+    try:
+        native_rate = int(pa.get_default_input_device_info()['defaultSampleRate'])
+    except Exception as e:
+        logger.debug(f"Failed to query default input device sample rate: {e}")
+        return 1
+
+    if native_rate > target_rate and native_rate % target_rate == 0:
+        return native_rate // target_rate
+    return 1
+
+
+def decimate_int16(audio_data: bytes, factor: int, channels: int) -> bytes:
+    """
+    Downsample interleaved 16-bit PCM by an integer factor
+
+    Each group of `factor` frames is averaged, which acts as a simple low-pass filter against aliasing.
+
+    Args:
+        audio_data: Raw audio data (16-bit integers, interleaved channels)
+        factor: Decimation factor
+        channels: Number of interleaved channels
+
+    Returns:
+        bytes: Downsampled audio data
+    """
+    samples = np.frombuffer(audio_data, dtype=np.int16)
+    frame_count = samples.size // (factor * channels)
+    grouped = samples[:frame_count * factor * channels].reshape(frame_count, factor, channels)
+    summed = grouped.sum(axis=1, dtype=np.int32)
+    summed //= factor
+    return summed.astype(np.int16).tobytes()
+
+
+def aligned_frames_per_buffer(pa: pyaudio.PyAudio, rate: int, frames: int, multiple: int = 1) -> int:
+    """
+    Round a stream buffer size down to a multiple of the default input device's low-latency period
+
+    Drivers deliver audio in whole periods, so a buffer that is a multiple of the period avoids
+    PortAudio re-partitioning every period into our buffer size.
+
+    Args:
+        pa: PyAudio instance
+        rate: Stream sample rate
+        frames: Requested frames per buffer
+        multiple: The result is also kept a multiple of this (the decimation factor, so no frames are dropped)
+
+    Returns:
+        int: Aligned frames per buffer (never less than one step), or frames rounded to multiple if the period is unknown
+    """
+    step = multiple
+    try:
+        period = int(pa.get_default_input_device_info()['defaultLowInputLatency'] * rate)
+    except Exception as e:
+        logger.debug(f"Failed to query default input device latency: {e}")
+        period = 0
+
+    if period > 0:
+        step = period * multiple // math.gcd(period, multiple)
+    return max(step, (frames // step) * step)
+
+
+def resolve_stream_format(
+    pa: pyaudio.PyAudio, target_rate: int, chunk_frames: int, capture_at_native_rate: bool
+) -> Tuple[int, int]:
+    """
+    Choose the decimation factor and stream buffer size for a recording session
+
+    Args:
+        pa: PyAudio instance
+        target_rate: Sample rate expected by the recognition service
+        chunk_frames: Configured frames per chunk at target_rate
+        capture_at_native_rate: Whether to capture at the device's native rate and downsample in-app
+
+    Returns:
+        Tuple[int, int]: (decimation factor, frames per buffer at the capture rate); the buffer holds
+        a whole number of output frames, i.e. frames_per_buffer // factor frames at target_rate
+    """
+    factor = native_rate_factor(pa, target_rate) if capture_at_native_rate else 1
+    frames_per_buffer = aligned_frames_per_buffer(pa, target_rate * factor, chunk_frames * factor, multiple=factor)
+    effective_frames = frames_per_buffer // factor
+    if effective_frames != chunk_frames:
+        # Alignment applies whether or not capture_at_native_rate is set, so say so where the user can see it
+        logger.info(
+            f"Audio chunk size {chunk_frames} aligned to {effective_frames} frames "
+            f"to match the input device's low-latency period"
+        )
+    return factor, frames_per_buffer
+
+
+class AdaptiveAmplifier:
+    """
+    Peak-adaptive gain for 16-bit PCM
+
+    Quiet audio (peak below AMPLIFY_BOOST_PEAK) is amplified 4x, normal audio 2x, and audio whose
+    peak is already at or above AMPLIFY_SKIP_PEAK is returned unchanged without any copy. Given those
+    thresholds the int16 product cannot overflow, so samples are multiplied directly into a reused
+    int16 buffer with no widening or clipping pass.
+    """
+
+    def __init__(self, initial_samples: int = 0):
+        """
+        Initialize the amplifier
+
+        Args:
+            initial_samples: Initial size of the output buffer in samples (grown on demand)
+        """
+        self._out = np.empty(initial_samples, dtype=np.int16)
+
+    def amplify(self, audio_data: bytes) -> bytes:
+        """
+        Amplify audio volume with a peak-adaptive gain
+
+        Args:
+            audio_data: Raw audio data (16-bit integers)
+
+        Returns:
+            bytes: Amplified audio data, or audio_data itself if amplification is skipped or fails
+        """
+        try:
+            # Convert bytes to numpy array (16-bit integers, zero-copy)
+            audio_array = np.frombuffer(audio_data, dtype=np.int16)
+            sample_count = audio_array.size
+            if sample_count == 0:
+                return audio_data
+
+            # Peak from max/min reductions (no abs() temporary, and -32768 cannot wrap around)
+            peak = max(int(audio_array.max()), -int(audio_array.min()))
+            if peak >= AMPLIFY_SKIP_PEAK:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Audio peak {peak} already near full-scale, skipping amplification")
+                return audio_data
+            gain = 4 if peak < AMPLIFY_BOOST_PEAK else 2
+
+            # Grow the output buffer if the data is larger than any seen so far
+            if sample_count > self._out.size:
+                self._out = np.empty(sample_count, dtype=np.int16)
+            amplified_array = self._out[:sample_count]
+            np.multiply(audio_array, gain, out=amplified_array, dtype=np.int16)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Audio amplified {gain}x: {len(audio_data)} bytes, max value {peak} -> {peak * gain}")
+
+            # tobytes() copies, so the reused output buffer can be overwritten by the next call
+            return amplified_array.tobytes()
+        except Exception as e:
+            logger.error(f"Audio amplification failed: {e}", exc_info=True)
+            logger.warning("Audio amplification failed, using original audio data")
+            return audio_data
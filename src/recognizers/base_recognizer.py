@@ -5,7 +5,7 @@ Defines the contract for all speech recognition providers
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Callable, Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any, Mapping
 
 logger = logging.getLogger(__name__)
 
@@ -18,13 +18,15 @@ class RecognitionConfig:
     channels: int = 1
     chunk_size: int = 3200
     audio_format: str = "pcm"
+    # Capture at the input device's native rate and downsample in-app (only when it is an exact multiple)
+    capture_at_native_rate: bool = False
 
     # Recognition configuration
     semantic_punctuation_enabled: bool = False
     timeout: int = 30
 
     # Provider-specific configuration
-    provider_config: Optional[Dict[str, Any]] = None
+    provider_config: Optional[Mapping[str, Any]] = None
 
     def __post_init__(self):
         """Validate configuration after initialization"""
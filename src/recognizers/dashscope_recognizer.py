@@ -2,21 +2,36 @@
 DashScope (Alibaba Cloud) speech recognizer implementation
 """
 import logging
-import queue
 import threading
 import time
-from typing import Optional
+from collections import deque
+from typing import Callable, Deque, List, Optional
 
 import dashscope
-import numpy as np
 import pyaudio
 from dashscope.audio.asr import Recognition, RecognitionCallback, RecognitionResult as DashScopeResult
 from dashscope.common.error import InvalidParameter
 
+from .audio_device import (
+    AdaptiveAmplifier, acquire_shared_pyaudio, decimate_int16, get_shared_pyaudio, release_shared_pyaudio,
+    resolve_stream_format
+)
 from .base_recognizer import BaseRecognizer, RecognitionConfig, RecognitionResult
 
 logger = logging.getLogger(__name__)
 
+# Bound once at import so on_event does not repeat the class attribute lookup for every partial result
+_is_sentence_end = DashScopeResult.is_sentence_end
+
+# Hard cap on a single coalesced audio frame, whatever the configured batch size
+SEND_BATCH_MAX_BYTES = 1024 * 1024
+
+# Message of the InvalidParameter the SDK raises when a frame is sent after recognition stopped
+_STOP_MSG = "Speech recognition has stopped"
+
+# Upper bound on how long the send thread sleeps with nothing buffered (safety net for missed wake-ups)
+DATA_WAIT_TIMEOUT_SECONDS = 1.0
+
 
 class DashScopeRecognitionCallback(RecognitionCallback):
     """DashScope recognition callback handler"""
@@ -34,7 +49,8 @@ class DashScopeRecognitionCallback(RecognitionCallback):
         self.recognizer = recognizer
         self.mic: Optional[pyaudio.PyAudio] = None
         self.stream: Optional[pyaudio.Stream] = None
-        self.full_text = ""
+        self._segments: List[str] = []  # Text of sentences the service has marked as ended
+        self._partial_text = ""  # Latest partial result of the sentence in progress
         self.connection_ready = threading.Event()
 
         logger.debug("DashScope recognition callback handler initialized")
@@ -62,29 +78,34 @@ class DashScopeRecognitionCallback(RecognitionCallback):
         """Recognition complete callback"""
         logger.info("DashScope recognition completed")
 
-        if self.full_text:
+        # Ended sentences plus any trailing sentence that never received its end marker
+        self._segments.append(self._partial_text)
+        full_text = ''.join(self._segments)
+        self._segments.clear()
+        self._partial_text = ""
+
+        if full_text:
             try:
                 result = RecognitionResult(
-                    text=self.full_text,
+                    text=full_text,
                     is_final=True,
                     confidence=1.0,
                     metadata={'provider': 'dashscope'}
                 )
                 self.recognizer._invoke_callback(result)
-                logger.debug(f"Final DashScope recognition text: {self.full_text}")
+                logger.debug(f"Final DashScope recognition text: {full_text}")
             except Exception as e:
                 logger.error(f"Error invoking callback in DashScope on_complete: {e}", exc_info=True)
 
-        self.full_text = ""
-
     def on_error(self, message) -> None:
         """Recognition error callback"""
         logger.error(f"DashScope recognition error - Request ID: {message.request_id}, Error: {message.message}")
 
         try:
-            if self.stream and hasattr(self.stream, 'is_active') and self.stream.is_active():
-                self.stream.stop_stream()
-                self.stream.close()
+            stream = self.stream
+            if stream is not None and stream.is_active():
+                stream.stop_stream()
+                stream.close()
         except Exception as e:
             logger.error(f"Error cleaning up resources in DashScope on_error: {e}", exc_info=True)
 
@@ -98,13 +119,27 @@ class DashScopeRecognitionCallback(RecognitionCallback):
         try:
             sentence = result.get_sentence()
 
-            if 'text' in sentence:
-                text = sentence['text']
-                logger.debug(f"DashScope recognized text fragment: {text}")
+            text = sentence.get('text')
+            if text is not None:
+                sentence_end = _is_sentence_end(sentence)
+
+                # Stability updates often repeat the previous partial verbatim
+                if not sentence_end and text == self._partial_text:
+                    return
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"DashScope recognized text fragment: {text}")
 
-                self.full_text = text
+                if not sentence_end:
+                    self._partial_text = text
+                    return
+
+                # Commit the finished sentence so the next one does not overwrite it
+                self._segments.append(text)
+                self._partial_text = ""
 
-                if DashScopeResult.is_sentence_end(sentence):
+                # The getters below are only worth calling when the record will actually be emitted
+                if logger.isEnabledFor(logging.INFO):
                     logger.info(
                         f"DashScope sentence end - Request ID: {result.get_request_id()}, "
                         f"Usage: {result.get_usage(sentence)}"
@@ -131,30 +166,51 @@ class DashScopeRecognizer(BaseRecognizer):
 
         self.api_key = api_key
         self.recognition: Optional[Recognition] = None
+        self._send_fn: Optional[Callable[[bytes], None]] = None  # Bound recognition.send_audio_frame
         self.callback: Optional[DashScopeRecognitionCallback] = None
 
-        # Audio buffer
-        self.audio_buffer: Optional[queue.Queue] = None
+        # Ring buffer between the PortAudio callback (single producer) and the send thread (single consumer);
+        # deque.append/popleft are atomic, so no lock is needed
+        self.audio_buffer: Optional[Deque[bytes]] = None
+        self._data_ready = threading.Event()  # Set by the stream callback whenever a chunk is buffered
         self.audio_mic: Optional[pyaudio.PyAudio] = None
         self.audio_stream: Optional[pyaudio.Stream] = None
-        self._record_thread: Optional[threading.Thread] = None
-        self._audio_thread: Optional[threading.Thread] = None
+        self._send_thread: Optional[threading.Thread] = None
 
-        # Calculate buffer size (approximately 2 seconds)
-        buffer_duration_seconds = 2.0
+        # Calculate buffer size (approximately 2 seconds); recomputed per session from the stream's actual buffer size
+        self._buffer_duration_seconds = 2.0
         self.max_buffer_size = int(
-            config.sample_rate * buffer_duration_seconds / config.chunk_size
+            config.sample_rate * self._buffer_duration_seconds / config.chunk_size
         )
 
-        # Configure DashScope
-        dashscope.api_key = self.api_key
+        # Peak-adaptive gain with a reused output buffer, grown to the send size on first use
+        self._amplifier = AdaptiveAmplifier(config.chunk_size * config.channels)
+
+        # Capture rate / sample_rate when capturing at the device's native rate, 1 otherwise (set per session)
+        self._decimate_factor = 1
+        # Stream frames per buffer at the capture rate (set per session, aligned to the device period)
+        self._frames_per_buffer = config.chunk_size
+
+        # Configure DashScope (SDK-global settings; only written when they actually change,
+        # since the recognizer is recreated on every settings save)
+        if dashscope.api_key != self.api_key:
+            dashscope.api_key = self.api_key
         provider_config = config.provider_config or {}
-        dashscope.base_websocket_api_url = provider_config.get(
+        base_websocket_url = provider_config.get(
             'base_websocket_url',
             'wss://dashscope.aliyuncs.com/api-ws/v1/inference'
         )
+        if dashscope.base_websocket_api_url != base_websocket_url:
+            dashscope.base_websocket_api_url = base_websocket_url
 
-        logger.info(f"DashScope recognizer initialized, buffer size: {self.max_buffer_size} chunks (~{buffer_duration_seconds}s)")
+        # Live chunks coalesced into one amplify + send_audio_frame call
+        self.send_batch_chunks = max(1, int(provider_config.get('send_batch_chunks', 2)))
+        self.send_batch_max_ms = max(0, int(provider_config.get('send_batch_max_ms', 400)))
+
+        logger.info(
+            f"DashScope recognizer initialized, buffer size: {self.max_buffer_size} chunks "
+            f"(~{self._buffer_duration_seconds}s), send batch: {self.send_batch_chunks} chunks / {self.send_batch_max_ms}ms"
+        )
 
     def start_recording(self) -> bool:
         """Start recording and recognition"""
@@ -166,8 +222,23 @@ class DashScopeRecognizer(BaseRecognizer):
             start_time = time.time()
             logger.info("Starting DashScope recording and recognition")
 
-            # Create audio buffer
-            self.audio_buffer = queue.Queue(maxsize=self.max_buffer_size)
+            # Resolve the stream format first: buffered chunks hold what each callback actually delivers,
+            # which after period alignment is not necessarily chunk_size frames
+            self._decimate_factor, self._frames_per_buffer = resolve_stream_format(
+                get_shared_pyaudio(), self.config.sample_rate, self.config.chunk_size,
+                self.config.capture_at_native_rate
+            )
+            if self._decimate_factor > 1:
+                logger.info(
+                    f"Capturing at native rate {self.config.sample_rate * self._decimate_factor}Hz, "
+                    f"downsampling {self._decimate_factor}x in-app"
+                )
+            chunk_frames = self._frames_per_buffer // self._decimate_factor
+            self.max_buffer_size = max(1, int(self.config.sample_rate * self._buffer_duration_seconds / chunk_frames))
+
+            # Create audio ring buffer (oldest chunks are dropped if sending falls behind by more than ~2s)
+            self.audio_buffer = deque(maxlen=self.max_buffer_size)
+            self._data_ready.clear()
             logger.debug(f"Audio buffer created, max size: {self.max_buffer_size} chunks")
 
             # Create callback handler first (before opening audio stream)
@@ -203,6 +274,7 @@ class DashScopeRecognizer(BaseRecognizer):
             # Start recognition to establish WebSocket connection
             recognition_start = time.time()
             self.recognition.start()
+            self._send_fn = self.recognition.send_audio_frame
             logger.info(f"DashScope recognition service started (elapsed: {(recognition_start - start_time) * 1000:.2f}ms)")
 
             # Wait for WebSocket connection to be ready BEFORE starting audio capture
@@ -221,42 +293,42 @@ class DashScopeRecognizer(BaseRecognizer):
             # Now that WebSocket is ready, open audio stream
             try:
                 logger.info("Opening audio stream for DashScope...")
-                self.audio_mic = pyaudio.PyAudio()
+                self.audio_mic = acquire_shared_pyaudio()
+                stream_rate = self.config.sample_rate * self._decimate_factor
+                frames_per_buffer = self._frames_per_buffer
+                logger.debug(f"DashScope audio stream buffer: {frames_per_buffer} frames at {stream_rate}Hz")
                 self.audio_stream = self.audio_mic.open(
                     format=pyaudio.paInt16,
                     channels=self.config.channels,
-                    rate=self.config.sample_rate,
+                    rate=stream_rate,
                     input=True,
-                    frames_per_buffer=self.config.chunk_size
+                    frames_per_buffer=frames_per_buffer,
+                    stream_callback=self._pa_callback
                 )
                 audio_stream_time = (time.time() - start_time) * 1000
                 logger.info(f"Audio stream opened for DashScope (elapsed: {audio_stream_time:.2f}ms)")
             except Exception as e:
                 logger.error(f"Failed to open audio stream for DashScope: {e}", exc_info=True)
+                if self.audio_mic is not None:
+                    release_shared_pyaudio()
+                    self.audio_mic = None
                 self.audio_buffer = None
                 if self.recognition:
                     self.recognition.stop()
                     self.recognition = None
+                    self._send_fn = None
                 return False
 
             # Link audio resources to callback
             self.callback.mic = self.audio_mic
             self.callback.stream = self.audio_stream
 
-            # Add a small stabilization delay to ensure audio stream is fully ready
-            logger.debug("Waiting for audio stream to stabilize (100ms)...")
-            time.sleep(0.1)
-
-            # NOW start recording thread (audio capture begins here)
+            # Start the send thread (capture already runs on PortAudio's thread via the stream callback)
             self.is_recording = True
-            self._record_thread = threading.Thread(target=self._record_audio_to_buffer, daemon=True)
-            self._record_thread.start()
-            record_time = (time.time() - start_time) * 1000
-            logger.info(f"Recording thread started for DashScope (elapsed: {record_time:.2f}ms)")
-
-            # Start audio streaming thread (this will send immediately since WebSocket is ready)
-            self._audio_thread = threading.Thread(target=self._send_audio_stream, daemon=True)
-            self._audio_thread.start()
+            self._send_thread = threading.Thread(target=self._send_audio_stream, daemon=True)
+            self._send_thread.start()
+            send_thread_time = (time.time() - start_time) * 1000
+            logger.info(f"Send thread started for DashScope (elapsed: {send_thread_time:.2f}ms)")
 
             total_time = (time.time() - start_time) * 1000
             logger.info(f"DashScope recording and recognition started successfully (total: {total_time:.2f}ms)")
@@ -268,155 +340,136 @@ class DashScopeRecognizer(BaseRecognizer):
             self._cleanup_audio_resources()
             return False
 
-    def _amplify_audio(self, audio_data: bytes) -> bytes:
+    def _downsample_and_amplify(self, audio_data: bytes) -> bytes:
         """
-        Amplify audio volume by 2x
+        Downsample audio captured at the device's native rate to sample_rate, then amplify it
 
         Args:
-            audio_data: Raw audio data (16-bit integers)
+            audio_data: Raw audio data (16-bit integers) at sample_rate * _decimate_factor
 
         Returns:
-            bytes: Amplified audio data
+            bytes: Amplified audio data at sample_rate
         """
-        try:
-            logger.debug(f"Amplifying audio data, original size: {len(audio_data)} bytes")
-
-            # Convert bytes to numpy array (16-bit integers)
-            audio_array = np.frombuffer(audio_data, dtype=np.int16)
-            original_max = np.max(np.abs(audio_array))
-            logger.debug(f"Original audio max value: {original_max}")
-
-            # Amplify by 2x
-            amplified_array = audio_array * 2
-
-            # Handle overflow: 16-bit integer range is -32768 to 32767
-            amplified_array = np.clip(amplified_array, -32768, 32767).astype(np.int16)
-
-            clipped_count = np.sum((amplified_array == 32767) | (amplified_array == -32768))
-            if clipped_count > 0:
-                logger.debug(f"Audio clipping occurred, clipped samples: {clipped_count}")
-
-            amplified_max = np.max(np.abs(amplified_array))
-            logger.debug(f"Amplified audio max value: {amplified_max}")
-
-            amplified_data = amplified_array.tobytes()
-            logger.debug(f"Audio amplification complete, output size: {len(amplified_data)} bytes")
+        return self._amplifier.amplify(decimate_int16(audio_data, self._decimate_factor, self.config.channels))
 
-            return amplified_data
-        except Exception as e:
-            logger.error(f"Audio amplification failed: {e}", exc_info=True)
-            logger.warning("Audio amplification failed, using original audio data")
-            return audio_data
-
-    def _record_audio_to_buffer(self) -> None:
-        """Record audio to buffer in separate thread"""
-        try:
-            logger.debug("DashScope recording thread started, recording to buffer")
-
-            while self.is_recording and self.audio_stream:
-                try:
-                    if not self.is_recording:
-                        break
-
-                    # Read audio data from microphone
-                    audio_data = self.audio_stream.read(
-                        self.config.chunk_size,
-                        exception_on_overflow=False
-                    )
+    def _pa_callback(self, in_data: bytes, frame_count: int, time_info: dict, status: int) -> tuple:
+        """
+        PortAudio stream callback, invoked on PortAudio's own thread for every captured chunk
 
-                    # Put audio data into buffer
-                    try:
-                        # Use blocking put with timeout to avoid data loss
-                        # If buffer is full, wait briefly for space to become available
-                        self.audio_buffer.put(audio_data, timeout=0.5)
-                        logger.debug(f"Audio data stored in buffer, current buffer size: {self.audio_buffer.qsize()}")
-                    except queue.Full:
-                        # This should rarely happen now that WebSocket is established first
-                        logger.warning("Audio buffer full, cannot store new data - possible audio streaming lag")
-                        # Don't discard the data - the stream consumer should be keeping up
+        Args:
+            in_data: Captured audio data
+            frame_count: Number of frames in in_data
+            time_info: Stream timing information
+            status: PortAudio status flags
 
-                except Exception as e:
-                    if self.is_recording:
-                        logger.error(f"Error recording to buffer: {e}", exc_info=True)
-                    else:
-                        logger.debug(f"Error recording to buffer (likely due to stopping): {e}")
-                    break
+        Returns:
+            tuple: (None, paContinue), or (None, paComplete) once the buffer has been released
+        """
+        audio_buffer = self.audio_buffer
+        if audio_buffer is None:
+            return None, pyaudio.paComplete
 
-            logger.debug("DashScope recording thread ended")
-        except Exception as e:
-            logger.error(f"DashScope recording thread exception: {e}", exc_info=True)
+        if len(audio_buffer) == audio_buffer.maxlen:
+            logger.warning("Audio buffer full, dropping oldest chunk - possible audio streaming lag")
+        audio_buffer.append(in_data)
+        self._data_ready.set()
+        return None, pyaudio.paContinue
 
     def _send_audio_stream(self) -> None:
-        """Send audio stream to recognition service in separate thread"""
-        try:
-            logger.debug("DashScope audio streaming thread started")
-            logger.info("Audio volume amplification enabled (2x amplification)")
-
-            # Verify prerequisites
-            if not self.callback:
-                logger.error("Callback handler not initialized")
-                return
-
-            if not self.recognition:
-                logger.error("Recognition object not initialized")
-                return
-
-            # WebSocket should already be connected (verified in start_recording)
-            # Double-check connection is ready
-            if not self.callback.connection_ready.is_set():
-                logger.warning("WebSocket connection not ready, waiting...")
-                connection_ready = self.callback.connection_ready.wait(timeout=2.0)
-                if not connection_ready:
-                    logger.error("WebSocket connection timeout in audio thread")
-                    return
-
-            logger.info("Starting realtime audio streaming to DashScope")
+        """
+        Drain captured audio from the ring buffer and stream it to DashScope
 
-            # Send realtime audio data
+        The thread sleeps until the stream callback signals new data. Buffered chunks are
+        coalesced and each batch is amplified and sent as one frame. A batch is sent when it
+        holds send_batch_chunks chunks, when its first chunk is send_batch_max_ms old, or when
+        it reaches SEND_BATCH_MAX_BYTES, whichever comes first. Chunks stay buffered while the
+        WebSocket is not ready.
+        """
+        try:
+            logger.debug("DashScope send thread started")
+            logger.info("Audio volume amplification enabled (adaptive 4x/2x gain, skipped for loud input)")
+            connection_ready = self.callback.connection_ready
             sent_count = 0
-
-            while self.is_recording and self.audio_buffer is not None:
+            pending = []
+            pending_bytes = 0
+            batch_started = 0.0
+
+            # Loop-invariant lookups hoisted into locals
+            audio_buffer = self.audio_buffer
+            data_ready = self._data_ready
+            amplify = self._downsample_and_amplify if self._decimate_factor > 1 else self._amplifier.amplify
+            batch_chunks = self.send_batch_chunks
+            batch_max_seconds = self.send_batch_max_ms / 1000
+            monotonic = time.monotonic
+            # Bound once; stop_recording joins this thread before stopping recognition,
+            # and a send after stop surfaces as InvalidParameter below
+            send_frame = self._send_fn
+
+            while True:
                 try:
-                    if not self.is_recording or not self.recognition:
-                        break
-
-                    # Get audio data from buffer (blocking, timeout 100ms)
-                    try:
-                        audio_data = self.audio_buffer.get(timeout=0.1)
-                    except queue.Empty:
-                        # Buffer temporarily empty, continue waiting
-                        continue
-
-                    if not self.is_recording or not self.recognition:
+                    recording = self.is_recording
+
+                    # Clear before draining so a chunk appended during the drain re-arms the event
+                    data_ready.clear()
+
+                    if connection_ready.is_set():
+                        while audio_buffer:
+                            audio_data = audio_buffer.popleft()
+                            if not pending:
+                                batch_started = monotonic()
+                            pending.append(audio_data)
+                            pending_bytes += len(audio_data)
+                            if len(pending) >= batch_chunks or pending_bytes >= SEND_BATCH_MAX_BYTES:
+                                send_frame(amplify(b''.join(pending)))
+                                sent_count += len(pending)
+                                pending.clear()
+                                pending_bytes = 0
+
+                        # Age-based flush, also on stop so the tail of the recording is not lost
+                        if pending and (not recording or monotonic() - batch_started >= batch_max_seconds):
+                            send_frame(amplify(b''.join(pending)))
+                            sent_count += len(pending)
+                            pending.clear()
+                            pending_bytes = 0
+
+                    # stop_recording stops the stream before waking us, so this pass drained everything
+                    if not recording:
                         break
 
-                    # Amplify audio before sending
-                    amplified_audio_data = self._amplify_audio(audio_data)
-
-                    # Send to recognition service
-                    self.recognition.send_audio_frame(amplified_audio_data)
-                    sent_count += 1
-
-                    if sent_count % 10 == 0:  # Log every 10 chunks
-                        logger.debug(f"Sent {sent_count} realtime audio chunks to DashScope")
+                    # Sleep until the callback buffers a chunk; with a partial batch pending,
+                    # wake no later than its send deadline. stop_recording() also sets the event.
+                    if pending:
+                        wait_timeout = max(0.0, batch_started + batch_max_seconds - monotonic())
+                    else:
+                        wait_timeout = DATA_WAIT_TIMEOUT_SECONDS
+                    data_ready.wait(wait_timeout)
 
                 except InvalidParameter as e:
-                    if "Speech recognition has stopped" in str(e):
+                    # Match on the raw message argument rather than re-formatting the exception
+                    if e.args and isinstance(e.args[0], str) and e.args[0].startswith(_STOP_MSG):
                         logger.debug("DashScope recognition stopped, stopping audio send")
                     else:
                         logger.warning(f"Parameter error sending audio to DashScope: {e}")
                     break
+                except OSError as e:
+                    # Connection dropped (BrokenPipeError, ConnectionResetError, ...): expected when stopping,
+                    # and a traceback adds nothing either way
+                    if self.is_recording:
+                        logger.warning(f"DashScope connection lost while sending audio: {e}")
+                    else:
+                        logger.debug(f"DashScope connection closed while sending audio (stopping): {e}")
+                    break
                 except Exception as e:
                     if self.is_recording:
                         logger.error(f"Error sending audio to DashScope: {e}", exc_info=True)
                     else:
-                        logger.debug(f"Error sending audio (likely due to stopping): {e}")
+                        logger.debug(f"Error sending audio to DashScope (likely due to stopping): {e}")
                     break
 
             logger.info(f"Realtime audio sending complete, sent {sent_count} chunks to DashScope")
-            logger.debug("DashScope audio streaming thread ended")
+            logger.debug("DashScope send thread ended")
         except Exception as e:
-            logger.error(f"DashScope audio streaming thread exception: {e}", exc_info=True)
+            logger.error(f"DashScope send thread exception: {e}", exc_info=True)
 
     def _cleanup_audio_resources(self) -> None:
         """Cleanup audio resources"""
@@ -431,22 +484,14 @@ class DashScopeRecognizer(BaseRecognizer):
                     logger.debug(f"Error closing DashScope audio stream: {e}")
                 self.audio_stream = None
 
-            # Release audio device
-            if self.audio_mic:
-                try:
-                    self.audio_mic.terminate()
-                    logger.debug("DashScope audio device released")
-                except Exception as e:
-                    logger.debug(f"Error releasing DashScope audio device: {e}")
+            # Release the shared audio device; it stays initialized for the next session
+            if self.audio_mic is not None:
+                release_shared_pyaudio()
                 self.audio_mic = None
 
             # Clear buffer
-            if self.audio_buffer:
-                while not self.audio_buffer.empty():
-                    try:
-                        self.audio_buffer.get_nowait()
-                    except queue.Empty:
-                        break
+            if self.audio_buffer is not None:
+                self.audio_buffer.clear()
                 self.audio_buffer = None
                 logger.debug("DashScope audio buffer cleared")
         except Exception as e:
@@ -464,10 +509,18 @@ class DashScopeRecognizer(BaseRecognizer):
             # Mark as stopped
             self.is_recording = False
 
-            # Wait for recording thread
-            if self._record_thread and self._record_thread.is_alive():
-                logger.debug("Waiting for DashScope recording thread to end...")
-                self._record_thread.join(timeout=1)
+            # Stop capture; stop_stream() waits for an in-flight callback, so the buffer is final afterwards
+            if self.audio_stream:
+                try:
+                    self.audio_stream.stop_stream()
+                except Exception as e:
+                    logger.debug(f"Error stopping DashScope audio stream: {e}")
+
+            # Wake the send thread so it flushes the remaining audio, then wait for it
+            self._data_ready.set()
+            if self._send_thread and self._send_thread.is_alive():
+                logger.debug("Waiting for DashScope send thread to end...")
+                self._send_thread.join(timeout=1)
 
             # Stop recognition
             if self.recognition:
@@ -487,11 +540,7 @@ class DashScopeRecognizer(BaseRecognizer):
                     logger.debug(f"Failed to get DashScope performance metrics: {e}")
 
                 self.recognition = None
-
-            # Wait for audio streaming thread
-            if hasattr(self, '_audio_thread') and self._audio_thread.is_alive():
-                logger.debug("Waiting for DashScope audio streaming thread to end...")
-                self._audio_thread.join(timeout=2)
+                self._send_fn = None
 
             # Cleanup audio resources
             self._cleanup_audio_resources()
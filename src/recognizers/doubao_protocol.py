@@ -16,6 +16,13 @@ logger = logging.getLogger(__name__)
 
 # Constants
 DEFAULT_SAMPLE_RATE = 16000
+HEADER_SIZE = 4  # Fixed 4-byte protocol header
+SEQUENCE_OFFSET = HEADER_SIZE  # Signed sequence number follows the header in client requests
+
+# Precompiled binary layouts for the fixed-size request/response fields
+SEQUENCE_STRUCT = struct.Struct('>i')
+PAYLOAD_SIZE_STRUCT = struct.Struct('>I')
+SEQUENCE_AND_SIZE_STRUCT = struct.Struct('>iI')
 
 
 class ProtocolVersion(IntEnum):
@@ -67,11 +74,12 @@ class CommonUtils:
         """
         try:
             compressed = gzip.compress(data)
-            if len(data) > 0:
-                ratio = len(compressed) / len(data)
-                logger.debug(f"Compressed {len(data)} bytes to {len(compressed)} bytes (ratio: {ratio:.2%})")
-            else:
-                logger.debug(f"Compressed empty data, result: {len(compressed)} bytes")
+            if logger.isEnabledFor(logging.DEBUG):
+                if len(data) > 0:
+                    ratio = len(compressed) / len(data)
+                    logger.debug(f"Compressed {len(data)} bytes to {len(compressed)} bytes (ratio: {ratio:.2%})")
+                else:
+                    logger.debug(f"Compressed empty data, result: {len(compressed)} bytes")
             return compressed
         except Exception as e:
             logger.error(f"Failed to compress data: {e}", exc_info=True)
@@ -90,7 +98,8 @@ class CommonUtils:
         """
         try:
             decompressed = gzip.decompress(data)
-            logger.debug(f"Decompressed {len(data)} bytes to {len(decompressed)} bytes")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Decompressed {len(data)} bytes to {len(decompressed)} bytes")
             return decompressed
         except Exception as e:
             logger.error(f"Failed to decompress data: {e}", exc_info=True)
@@ -222,8 +231,7 @@ class RequestBuilder:
 
         request = bytearray()
         request.extend(header.to_bytes())
-        request.extend(struct.pack('>i', seq))
-        request.extend(struct.pack('>I', payload_size))
+        request.extend(SEQUENCE_AND_SIZE_STRUCT.pack(seq, payload_size))
         request.extend(compressed_payload)
 
         logger.debug(f"Created full client request, seq={seq}, sample_rate={sample_rate}, payload_size={payload_size}")
@@ -257,18 +265,20 @@ class RequestBuilder:
 
         request = bytearray()
         request.extend(header.to_bytes())
-        request.extend(struct.pack('>i', seq))
 
         # Compress or not based on parameter
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         if compress:
             compressed_segment = CommonUtils.gzip_compress(segment)
-            request.extend(struct.pack('>I', len(compressed_segment)))
+            request.extend(SEQUENCE_AND_SIZE_STRUCT.pack(seq, len(compressed_segment)))
             request.extend(compressed_segment)
-            logger.debug(f"Created audio only request with compression, seq={seq}, original_size={len(segment)}, compressed_size={len(compressed_segment)}, is_last={is_last}")
+            if debug_enabled:
+                logger.debug(f"Created audio only request with compression, seq={seq}, original_size={len(segment)}, compressed_size={len(compressed_segment)}, is_last={is_last}")
         else:
-            request.extend(struct.pack('>I', len(segment)))
+            request.extend(SEQUENCE_AND_SIZE_STRUCT.pack(seq, len(segment)))
             request.extend(segment)
-            logger.debug(f"Created audio only request without compression, seq={seq}, segment_size={len(segment)}, is_last={is_last}")
+            if debug_enabled:
+                logger.debug(f"Created audio only request without compression, seq={seq}, segment_size={len(segment)}, is_last={is_last}")
 
         return bytes(request)
 
@@ -332,7 +342,7 @@ class ResponseParser:
                 if len(payload) < 4:
                     logger.error("Payload too short for sequence number")
                     return response
-                response.payload_sequence = struct.unpack('>i', payload[:4])[0]
+                response.payload_sequence = SEQUENCE_STRUCT.unpack_from(payload)[0]
                 payload = payload[4:]
 
             if message_type_specific_flags & 0x02:
@@ -342,7 +352,7 @@ class ResponseParser:
                 if len(payload) < 4:
                     logger.error("Payload too short for event")
                     return response
-                response.event = struct.unpack('>i', payload[:4])[0]
+                response.event = SEQUENCE_STRUCT.unpack_from(payload)[0]
                 payload = payload[4:]
 
             # Parse message_type
@@ -350,14 +360,13 @@ class ResponseParser:
                 if len(payload) < 4:
                     logger.error("Payload too short for payload size")
                     return response
-                response.payload_size = struct.unpack('>I', payload[:4])[0]
+                response.payload_size = PAYLOAD_SIZE_STRUCT.unpack_from(payload)[0]
                 payload = payload[4:]
             elif message_type == MessageType.SERVER_ERROR_RESPONSE:
                 if len(payload) < 8:
                     logger.error("Payload too short for error response")
                     return response
-                response.code = struct.unpack('>i', payload[:4])[0]
-                response.payload_size = struct.unpack('>I', payload[4:8])[0]
+                response.code, response.payload_size = SEQUENCE_AND_SIZE_STRUCT.unpack_from(payload)
                 payload = payload[8:]
 
             if not payload:
@@ -375,7 +384,8 @@ class ResponseParser:
             try:
                 if serialization_method == SerializationType.JSON:
                     response.payload_msg = json.loads(payload.decode('utf-8'))
-                    logger.debug(f"Parsed response: {response}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Parsed response: {response}")
             except Exception as e:
                 logger.error(f"Failed to parse payload JSON: {e}")
 
@@ -4,20 +4,26 @@ Integrates Doubao ASR API with the application using async-to-sync bridge
 """
 import asyncio
 import logging
-import queue
 import threading
 import time
-from typing import Optional
+from collections import deque
+from typing import Deque, Optional
 
 import aiohttp
-import numpy as np
 import pyaudio
 
+from .audio_device import (
+    AdaptiveAmplifier, acquire_shared_pyaudio, decimate_int16, get_shared_pyaudio, release_shared_pyaudio,
+    resolve_stream_format
+)
 from .base_recognizer import BaseRecognizer, RecognitionConfig, RecognitionResult
-from .doubao_protocol import RequestBuilder, ResponseParser, AsrResponse
+from .doubao_protocol import RequestBuilder, ResponseParser, AsrResponse, SEQUENCE_OFFSET, SEQUENCE_STRUCT
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on how long the send task sleeps with nothing buffered (safety net for missed wake-ups)
+DATA_WAIT_TIMEOUT_SECONDS = 1.0
+
 
 class DoubaoRecognizer(BaseRecognizer):
     """Doubao (ByteDance) speech recognizer"""
@@ -53,17 +59,28 @@ class DoubaoRecognizer(BaseRecognizer):
         )
         self.segment_duration = provider_config.get('segment_duration', 200)  # ms
 
+        # Credentials never change for this recognizer, so a single builder serves every session
+        self._request_builder = RequestBuilder(
+            app_key=self.app_id,
+            access_key=self.access_token,
+            resource_id=self.resource_id
+        )
+
+        # Empty last-flag packet differs between sessions only in its sequence number, so it is built once
+        self._empty_last_template = bytearray(
+            self._request_builder.new_audio_only_request(0, b'', is_last=True)
+        )
+
         # Audio buffer
-        self.audio_buffer: Optional[queue.Queue] = None
+        self.audio_buffer: Optional[Deque[bytes]] = None
         self.audio_mic: Optional[pyaudio.PyAudio] = None
         self.audio_stream: Optional[pyaudio.Stream] = None
-        self._record_thread: Optional[threading.Thread] = None
         self._recognition_thread: Optional[threading.Thread] = None
 
-        # Calculate buffer size (approximately 2 seconds)
-        buffer_duration_seconds = 2.0
+        # Calculate buffer size (approximately 2 seconds); recomputed per session from the stream's actual buffer size
+        self._buffer_duration_seconds = 2.0
         self.max_buffer_size = int(
-            config.sample_rate * buffer_duration_seconds / config.chunk_size
+            config.sample_rate * self._buffer_duration_seconds / config.chunk_size
         )
 
         # Async event loop management
@@ -75,10 +92,19 @@ class DoubaoRecognizer(BaseRecognizer):
         self.full_text = ""
         self._seq = 1
         self._ws_ready = threading.Event()  # Event to signal WebSocket is ready
+        self._data_ready: Optional[asyncio.Event] = None  # Wakes the send task when audio is buffered
+
+        # Peak-adaptive gain with a reused output buffer, grown to the send size on first use
+        self._amplifier = AdaptiveAmplifier(config.chunk_size * config.channels)
+
+        # Capture rate / sample_rate when capturing at the device's native rate, 1 otherwise (set per session)
+        self._decimate_factor = 1
+        # Stream frames per buffer at the capture rate (set per session, aligned to the device period)
+        self._frames_per_buffer = config.chunk_size
 
         logger.info(
             f"Doubao recognizer initialized: url={self.url}, resource_id={self.resource_id}, "
-            f"buffer_size={self.max_buffer_size} chunks (~{buffer_duration_seconds}s)"
+            f"buffer_size={self.max_buffer_size} chunks (~{self._buffer_duration_seconds}s)"
         )
 
     def start_recording(self) -> bool:
@@ -91,8 +117,22 @@ class DoubaoRecognizer(BaseRecognizer):
             start_time = time.time()
             logger.info("Starting Doubao recording and recognition")
 
-            # Create audio buffer
-            self.audio_buffer = queue.Queue(maxsize=self.max_buffer_size)
+            # Resolve the stream format first: buffered chunks hold what each callback actually delivers,
+            # which after period alignment is not necessarily chunk_size frames
+            self._decimate_factor, self._frames_per_buffer = resolve_stream_format(
+                get_shared_pyaudio(), self.config.sample_rate, self.config.chunk_size,
+                self.config.capture_at_native_rate
+            )
+            if self._decimate_factor > 1:
+                logger.info(
+                    f"Capturing at native rate {self.config.sample_rate * self._decimate_factor}Hz, "
+                    f"downsampling {self._decimate_factor}x in-app"
+                )
+            chunk_frames = self._frames_per_buffer // self._decimate_factor
+            self.max_buffer_size = max(1, int(self.config.sample_rate * self._buffer_duration_seconds / chunk_frames))
+
+            # Create audio buffer (ring buffer: the oldest chunk is dropped when full)
+            self.audio_buffer = deque(maxlen=self.max_buffer_size)
             logger.debug(f"Audio buffer created, max size: {self.max_buffer_size} chunks")
 
             # Reset WebSocket ready event
@@ -124,32 +164,29 @@ class DoubaoRecognizer(BaseRecognizer):
             # Open audio stream AFTER WebSocket is ready
             try:
                 logger.info("Opening audio stream for Doubao...")
-                self.audio_mic = pyaudio.PyAudio()
+                self.audio_mic = acquire_shared_pyaudio()
+                stream_rate = self.config.sample_rate * self._decimate_factor
+                frames_per_buffer = self._frames_per_buffer
+                logger.debug(f"Doubao audio stream buffer: {frames_per_buffer} frames at {stream_rate}Hz")
                 self.audio_stream = self.audio_mic.open(
                     format=pyaudio.paInt16,
                     channels=self.config.channels,
-                    rate=self.config.sample_rate,
+                    rate=stream_rate,
                     input=True,
-                    frames_per_buffer=self.config.chunk_size
+                    frames_per_buffer=frames_per_buffer,
+                    stream_callback=self._pa_callback
                 )
                 audio_stream_time = (time.time() - start_time) * 1000
                 logger.info(f"Audio stream opened for Doubao (elapsed: {audio_stream_time:.2f}ms)")
             except Exception as e:
                 logger.error(f"Failed to open audio stream for Doubao: {e}", exc_info=True)
+                if self.audio_mic is not None:
+                    release_shared_pyaudio()
+                    self.audio_mic = None
                 self.is_recording = False
                 self.audio_buffer = None
                 return False
 
-            # Add a small stabilization delay to ensure audio stream is fully ready
-            logger.debug("Waiting for audio stream to stabilize (100ms)...")
-            time.sleep(0.1)
-
-            # Start recording thread
-            self._record_thread = threading.Thread(target=self._record_audio_to_buffer, daemon=True)
-            self._record_thread.start()
-            record_time = (time.time() - start_time) * 1000
-            logger.info(f"Recording thread started for Doubao (elapsed: {record_time:.2f}ms)")
-
             total_time = (time.time() - start_time) * 1000
             logger.info(f"Doubao recording and recognition started successfully (total: {total_time:.2f}ms)")
             return True
@@ -160,83 +197,68 @@ class DoubaoRecognizer(BaseRecognizer):
             self._cleanup_audio_resources()
             return False
 
-    def _amplify_audio(self, audio_data: bytes) -> bytes:
+    def _downsample_and_amplify(self, audio_data: bytes) -> bytes:
         """
-        Amplify audio volume by 2x
+        Downsample audio captured at the device's native rate to sample_rate, then amplify it
 
         Args:
-            audio_data: Raw audio data (16-bit integers)
+            audio_data: Raw audio data (16-bit integers) at sample_rate * _decimate_factor
 
         Returns:
-            bytes: Amplified audio data
+            bytes: Amplified audio data at sample_rate
         """
-        try:
-            logger.debug(f"Amplifying audio data, original size: {len(audio_data)} bytes")
-
-            # Convert bytes to numpy array (16-bit integers)
-            audio_array = np.frombuffer(audio_data, dtype=np.int16)
-            original_max = np.max(np.abs(audio_array))
-            logger.debug(f"Original audio max value: {original_max}")
-
-            # Amplify by 2x
-            amplified_array = audio_array * 2
-
-            # Handle overflow: 16-bit integer range is -32768 to 32767
-            amplified_array = np.clip(amplified_array, -32768, 32767).astype(np.int16)
+        return self._amplifier.amplify(decimate_int16(audio_data, self._decimate_factor, self.config.channels))
 
-            clipped_count = np.sum((amplified_array == 32767) | (amplified_array == -32768))
-            if clipped_count > 0:
-                logger.debug(f"Audio clipping occurred, clipped samples: {clipped_count}")
+    def _pa_callback(self, in_data: bytes, frame_count: int, time_info: dict, status: int) -> tuple:
+        """
+        PortAudio stream callback, invoked on PortAudio's own thread for every captured chunk
 
-            amplified_max = np.max(np.abs(amplified_array))
-            logger.debug(f"Amplified audio max value: {amplified_max}")
+        Args:
+            in_data: Captured audio data
+            frame_count: Number of frames in in_data
+            time_info: Stream timing information
+            status: PortAudio status flags
 
-            amplified_data = amplified_array.tobytes()
-            logger.debug(f"Audio amplification complete, output size: {len(amplified_data)} bytes")
+        Returns:
+            tuple: (None, paContinue) while recording, (None, paComplete) once stopped
+        """
+        if not self.is_recording:
+            return None, pyaudio.paComplete
 
-            return amplified_data
-        except Exception as e:
-            logger.error(f"Audio amplification failed: {e}", exc_info=True)
-            logger.warning("Audio amplification failed, using original audio data")
-            return audio_data
+        audio_buffer = self.audio_buffer
+        if audio_buffer is None:
+            return None, pyaudio.paComplete
 
-    def _record_audio_to_buffer(self) -> None:
-        """Record audio to buffer in separate thread"""
-        try:
-            logger.debug("Doubao recording thread started, recording to buffer")
+        # Put audio data into buffer (deque.append is atomic, no lock needed)
+        if len(audio_buffer) == audio_buffer.maxlen:
+            # This should rarely happen now that WebSocket is established first
+            logger.warning("Audio buffer full, dropping oldest chunk - possible audio streaming lag")
+        audio_buffer.append(in_data)
+        self._notify_data_ready()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Audio data stored in buffer, current buffer size: {len(audio_buffer)}")
 
-            while self.is_recording and self.audio_stream:
-                try:
-                    if not self.is_recording:
-                        break
-
-                    # Read audio data from microphone
-                    audio_data = self.audio_stream.read(
-                        self.config.chunk_size,
-                        exception_on_overflow=False
-                    )
+        return None, pyaudio.paContinue
 
-                    # Put audio data into buffer
-                    try:
-                        # Use blocking put with timeout to avoid data loss
-                        # If buffer is full, wait briefly for space to become available
-                        self.audio_buffer.put(audio_data, timeout=0.5)
-                        logger.debug(f"Audio data stored in buffer, current buffer size: {self.audio_buffer.qsize()}")
-                    except queue.Full:
-                        # This should rarely happen now that WebSocket is established first
-                        logger.warning("Audio buffer full, cannot store new data - possible audio streaming lag")
-                        # Don't discard the data - the stream consumer should be keeping up
+    def _notify_data_ready(self, force: bool = False) -> None:
+        """
+        Wake the send task from a non-loop thread
 
-                except Exception as e:
-                    if self.is_recording:
-                        logger.error(f"Error recording to buffer: {e}", exc_info=True)
-                    else:
-                        logger.debug(f"Error recording to buffer (likely due to stopping): {e}")
-                    break
+        The is_set() pre-check reads the event outside its loop, so it can be stale: the send task may clear
+        the event right after. That only matters when no chunk follows to re-arm it, i.e. when stopping.
 
-            logger.debug("Doubao recording thread ended")
-        except Exception as e:
-            logger.error(f"Doubao recording thread exception: {e}", exc_info=True)
+        Args:
+            force: Schedule the wake-up even if the event already looks set (used by stop_recording)
+        """
+        loop = self._loop
+        data_ready = self._data_ready
+        if loop is None or data_ready is None or (data_ready.is_set() and not force):
+            return
+        try:
+            loop.call_soon_threadsafe(data_ready.set)
+        except RuntimeError:
+            # Loop already closed during shutdown
+            pass
 
     def _run_recognition_async(self) -> None:
         """Run async recognition in separate thread with its own event loop"""
@@ -263,19 +285,11 @@ class DoubaoRecognizer(BaseRecognizer):
         try:
             logger.info("Doubao recognition task started")
 
-            # Create request builder
-            request_builder = RequestBuilder(
-                app_key=self.app_id,
-                access_key=self.access_token,
-                resource_id=self.resource_id
-            )
-            logger.info(f"Doubao RequestBuilder created - app_id: {self.app_id}, resource_id: {self.resource_id}")
-
             # Create session
             self._session = aiohttp.ClientSession()
 
             # Connect WebSocket
-            headers = request_builder.new_auth_headers()
+            headers = self._request_builder.new_auth_headers()
             logger.info(f"Connecting to Doubao WebSocket: {self.url}")
             logger.debug(f"WebSocket headers: {headers}")
             self._ws = await self._session.ws_connect(self.url, headers=headers)
@@ -304,6 +318,9 @@ class DoubaoRecognizer(BaseRecognizer):
 
             self._seq += 1
 
+            # Created on this loop before the stream callback starts producing
+            self._data_ready = asyncio.Event()
+
             # Signal that WebSocket is ready for audio streaming
             self._ws_ready.set()
             logger.info("Doubao WebSocket ready for audio streaming")
@@ -332,7 +349,7 @@ class DoubaoRecognizer(BaseRecognizer):
         """Send audio data to Doubao"""
         try:
             logger.info("Doubao audio sending task started")
-            logger.info("Audio volume amplification enabled (2x amplification)")
+            logger.info("Audio volume amplification enabled (adaptive 4x/2x gain, skipped for loud input)")
 
             # WebSocket should already be ready at this point (set in _recognition_task)
             # Just verify it's still ready
@@ -346,28 +363,36 @@ class DoubaoRecognizer(BaseRecognizer):
             audio_to_send = []
             last_send_time = time.time()
             sent_count = 0
+            build_audio_request = self._request_builder.new_audio_only_request
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            audio_buffer = self.audio_buffer
+            amplify = self._downsample_and_amplify if self._decimate_factor > 1 else self._amplifier.amplify
+            send_bytes = self._ws.send_bytes
+            segment_duration = self.segment_duration
+            data_ready = self._data_ready
+
+            # Expected chunk count for segment_duration (constant for the session)
+            chunk_duration_ms = (self._frames_per_buffer // self._decimate_factor) / self.config.sample_rate * 1000
+            chunks_per_segment = max(1, int(segment_duration / chunk_duration_ms))
 
             while self.is_recording:
                 try:
-                    # Get audio from buffer (non-blocking with short timeout)
-                    try:
-                        chunk = self.audio_buffer.get(timeout=0.05)
-                        audio_to_send.append(chunk)
-                    except queue.Empty:
-                        pass  # No new audio yet
+                    # Clear before draining so a chunk appended during the drain re-arms the event
+                    data_ready.clear()
+
+                    # Take all buffered audio without blocking the event loop
+                    # (this task is the only consumer, so a non-empty deque cannot be emptied under us)
+                    while audio_buffer:
+                        audio_to_send.append(audio_buffer.popleft())
 
                     # Calculate time since last send
                     current_time = time.time()
                     time_since_last_send = (current_time - last_send_time) * 1000  # ms
 
                     # Send audio when we have enough data OR enough time has passed
-                    # Calculate expected chunk count for segment_duration
-                    chunk_duration_ms = (self.config.chunk_size / self.config.sample_rate / self.config.channels / 2) * 1000
-                    chunks_per_segment = max(1, int(self.segment_duration / chunk_duration_ms))
-
                     should_send = (
                         len(audio_to_send) >= chunks_per_segment or
-                        (audio_to_send and time_since_last_send >= self.segment_duration)
+                        (audio_to_send and time_since_last_send >= segment_duration)
                     )
 
                     if should_send:
@@ -376,35 +401,57 @@ class DoubaoRecognizer(BaseRecognizer):
                         audio_to_send = []  # Clear the buffer
 
                         # Amplify audio
-                        amplified_segment = self._amplify_audio(segment)
+                        amplified_segment = amplify(segment)
 
                         # Send to Doubao
                         is_last = False  # Will send last flag when stopping
-                        audio_request = RequestBuilder.new_audio_only_request(
+                        audio_request = build_audio_request(
                             self._seq,
                             amplified_segment,
                             is_last=is_last
                         )
-                        await self._ws.send_bytes(audio_request)
+                        await send_bytes(audio_request)
                         sent_count += 1
-                        logger.info(f"Sent audio segment #{sent_count} to Doubao, seq={self._seq}, size={len(segment)} bytes")
+                        if debug_enabled:
+                            logger.debug(
+                                f"Sent audio segment #{sent_count} to Doubao, seq={self._seq}, size={len(segment)} bytes"
+                            )
 
                         self._seq += 1
                         last_send_time = current_time
+                        time_since_last_send = 0
 
-                    # Small delay to prevent busy loop
-                    await asyncio.sleep(0.01)
+                    # Sleep until the producer appends a chunk; with a partial segment pending,
+                    # wake no later than its send deadline. stop_recording() also sets the event.
+                    if audio_to_send:
+                        wait_timeout = max(0.0, (segment_duration - time_since_last_send) / 1000)
+                    else:
+                        wait_timeout = DATA_WAIT_TIMEOUT_SECONDS
+                    try:
+                        await asyncio.wait_for(data_ready.wait(), timeout=wait_timeout)
+                    except asyncio.TimeoutError:
+                        pass
 
+                except OSError as e:
+                    # Connection dropped (BrokenPipeError, ConnectionResetError, ...): expected when stopping,
+                    # and a traceback adds nothing either way
+                    if self.is_recording:
+                        logger.warning(f"Doubao connection lost while sending audio: {e}")
+                    else:
+                        logger.debug(f"Doubao connection closed while sending audio (stopping): {e}")
+                    break
                 except Exception as e:
                     if self.is_recording:
                         logger.error(f"Error sending audio to Doubao: {e}", exc_info=True)
                     break
 
-            # Send final chunk with last flag
+            # Collect audio captured after the last send, then send final chunk with last flag
+            while audio_buffer:
+                audio_to_send.append(audio_buffer.popleft())
             if audio_to_send:
                 segment = b''.join(audio_to_send)
-                amplified_segment = self._amplify_audio(segment)
-                audio_request = RequestBuilder.new_audio_only_request(
+                amplified_segment = amplify(segment)
+                audio_request = build_audio_request(
                     self._seq,
                     amplified_segment,
                     is_last=True
@@ -412,13 +459,9 @@ class DoubaoRecognizer(BaseRecognizer):
                 await self._ws.send_bytes(audio_request)
                 logger.info(f"Sent final audio segment to Doubao with last flag, seq={self._seq}, size={len(segment)} bytes")
             else:
-                # Send empty last packet if no pending audio
-                audio_request = RequestBuilder.new_audio_only_request(
-                    self._seq,
-                    b'',
-                    is_last=True
-                )
-                await self._ws.send_bytes(audio_request)
+                # Send empty last packet if no pending audio (last-flag packets carry a negated sequence)
+                SEQUENCE_STRUCT.pack_into(self._empty_last_template, SEQUENCE_OFFSET, -self._seq)
+                await self._ws.send_bytes(bytes(self._empty_last_template))
                 logger.info(f"Sent empty final packet to Doubao with last flag, seq={self._seq}")
 
             logger.info(f"Doubao audio sending task completed, total segments sent: {sent_count}")
@@ -430,11 +473,14 @@ class DoubaoRecognizer(BaseRecognizer):
         """Receive recognition results from Doubao"""
         try:
             logger.info("Doubao results receiving task started")
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            parse_response = ResponseParser.parse_response
 
             async for msg in self._ws:
                 if msg.type == aiohttp.WSMsgType.BINARY:
-                    response = ResponseParser.parse_response(msg.data)
-                    logger.debug(f"Received Doubao response: {response}")
+                    response = parse_response(msg.data)
+                    if debug_enabled:
+                        logger.debug(f"Received Doubao response: {response}")
 
                     # Check for errors first
                     if response.code != 0:
@@ -496,24 +542,15 @@ class DoubaoRecognizer(BaseRecognizer):
                     logger.debug(f"Error closing Doubao audio stream: {e}")
                 self.audio_stream = None
 
-            # Release audio device
-            if self.audio_mic:
-                try:
-                    self.audio_mic.terminate()
-                    logger.debug("Doubao audio device released")
-                except Exception as e:
-                    logger.debug(f"Error releasing Doubao audio device: {e}")
+            # Release the shared audio device; it stays initialized for the next session
+            if self.audio_mic is not None:
+                release_shared_pyaudio()
                 self.audio_mic = None
 
-            # Clear buffer
-            if self.audio_buffer:
-                while not self.audio_buffer.empty():
-                    try:
-                        self.audio_buffer.get_nowait()
-                    except queue.Empty:
-                        break
+            # Drop buffer; pending chunks are reclaimed with the deque itself
+            if self.audio_buffer is not None:
                 self.audio_buffer = None
-                logger.debug("Doubao audio buffer cleared")
+                logger.debug("Doubao audio buffer released")
         except Exception as e:
             logger.error(f"Error cleaning up Doubao audio resources: {e}", exc_info=True)
 
@@ -526,13 +563,18 @@ class DoubaoRecognizer(BaseRecognizer):
         try:
             logger.info("Stopping Doubao recording and recognition")
 
-            # Mark as stopped
+            # Mark as stopped (the stream callback returns paComplete from now on)
             self.is_recording = False
 
-            # Wait for recording thread
-            if self._record_thread and self._record_thread.is_alive():
-                logger.debug("Waiting for Doubao recording thread to end...")
-                self._record_thread.join(timeout=1)
+            # Stop capture; stop_stream() waits for an in-flight callback, so the buffer is final afterwards
+            if self.audio_stream:
+                try:
+                    self.audio_stream.stop_stream()
+                except Exception as e:
+                    logger.debug(f"Error stopping Doubao audio stream: {e}")
+
+            # Wake the send task so it flushes immediately
+            self._notify_data_ready(force=True)
 
             # Wait for recognition thread
             if self._recognition_thread and self._recognition_thread.is_alive():
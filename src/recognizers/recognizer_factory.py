@@ -3,11 +3,15 @@ Recognizer factory
 Creates appropriate recognizer instances based on provider configuration
 """
 import logging
-from typing import Dict, Any
+from typing import Any, Callable, Dict, Mapping, TYPE_CHECKING
 
 from .base_recognizer import BaseRecognizer, RecognitionConfig
-from .dashscope_recognizer import DashScopeRecognizer
-from .doubao_recognizer import DoubaoRecognizer
+
+# Provider modules pull in dashscope/pyaudio/aiohttp/numpy at import time, so they are
+# imported only when a recognizer for that provider is actually created
+if TYPE_CHECKING:
+    from .dashscope_recognizer import DashScopeRecognizer
+    from .doubao_recognizer import DoubaoRecognizer
 
 logger = logging.getLogger(__name__)
 
@@ -21,11 +25,16 @@ class RecognizerFactory:
 
     SUPPORTED_PROVIDERS = [PROVIDER_DASHSCOPE, PROVIDER_DOUBAO]
 
+    _DISPLAY_NAMES = {
+        PROVIDER_DASHSCOPE: 'Alibaba DashScope',
+        PROVIDER_DOUBAO: 'ByteDance Doubao'
+    }
+
     @staticmethod
     def create_recognizer(
         provider: str,
         config: RecognitionConfig,
-        credentials: Dict[str, Any]
+        credentials: Mapping[str, Any]
     ) -> BaseRecognizer:
         """
         Create a recognizer instance based on provider
@@ -43,26 +52,21 @@ class RecognizerFactory:
         """
         provider = provider.lower().strip()
 
-        if provider not in RecognizerFactory.SUPPORTED_PROVIDERS:
+        creator = _CREATORS.get(provider)
+        if creator is None:
             raise ValueError(
                 f"Unsupported provider: {provider}. "
                 f"Supported providers: {', '.join(RecognizerFactory.SUPPORTED_PROVIDERS)}"
             )
 
         logger.info(f"Creating recognizer for provider: {provider}")
-
-        if provider == RecognizerFactory.PROVIDER_DASHSCOPE:
-            return RecognizerFactory._create_dashscope_recognizer(config, credentials)
-        elif provider == RecognizerFactory.PROVIDER_DOUBAO:
-            return RecognizerFactory._create_doubao_recognizer(config, credentials)
-        else:
-            raise ValueError(f"Unknown provider: {provider}")
+        return creator(config, credentials)
 
     @staticmethod
     def _create_dashscope_recognizer(
         config: RecognitionConfig,
-        credentials: Dict[str, Any]
-    ) -> DashScopeRecognizer:
+        credentials: Mapping[str, Any]
+    ) -> 'DashScopeRecognizer':
         """
         Create DashScope recognizer
 
@@ -83,13 +87,14 @@ class RecognizerFactory:
         logger.info("Creating DashScope recognizer")
         logger.debug(f"DashScope config: {config}")
 
+        from .dashscope_recognizer import DashScopeRecognizer
         return DashScopeRecognizer(config=config, api_key=api_key)
 
     @staticmethod
     def _create_doubao_recognizer(
         config: RecognitionConfig,
-        credentials: Dict[str, Any]
-    ) -> DoubaoRecognizer:
+        credentials: Mapping[str, Any]
+    ) -> 'DoubaoRecognizer':
         """
         Create Doubao recognizer
 
@@ -114,6 +119,7 @@ class RecognizerFactory:
         logger.info("Creating Doubao recognizer")
         logger.debug(f"Doubao config: {config}")
 
+        from .doubao_recognizer import DoubaoRecognizer
         return DoubaoRecognizer(
             config=config,
             app_id=app_id,
@@ -121,7 +127,7 @@ class RecognizerFactory:
         )
 
     @staticmethod
-    def validate_credentials(provider: str, credentials: Dict[str, Any]) -> bool:
+    def validate_credentials(provider: str, credentials: Mapping[str, Any]) -> bool:
         """
         Validate credentials for a provider
 
@@ -180,8 +186,11 @@ class RecognizerFactory:
         Returns:
             str: Display name
         """
-        display_names = {
-            RecognizerFactory.PROVIDER_DASHSCOPE: 'Alibaba DashScope',
-            RecognizerFactory.PROVIDER_DOUBAO: 'ByteDance Doubao'
-        }
-        return display_names.get(provider.lower(), provider)
+        return RecognizerFactory._DISPLAY_NAMES.get(provider.lower(), provider)
+
+
+# Provider name -> creator; the creators import their provider module on first use, so this table stays cheap
+_CREATORS: Dict[str, Callable[[RecognitionConfig, Mapping[str, Any]], BaseRecognizer]] = {
+    RecognizerFactory.PROVIDER_DASHSCOPE: RecognizerFactory._create_dashscope_recognizer,
+    RecognizerFactory.PROVIDER_DOUBAO: RecognizerFactory._create_doubao_recognizer
+}
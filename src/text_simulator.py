@@ -3,32 +3,210 @@
 负责将识别的文本自动输入到当前活动窗口的光标位置
 实现多种输入方案以确保跨应用兼容性
 """
+import ctypes
+import functools
+import itertools
 import logging
+import re
+import struct
+import threading
 import time
 from enum import Enum
-from typing import Optional
+from typing import Callable, Dict, Optional, Tuple
 
-import pyautogui
-import pyperclip
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 
 try:
     import win32api
     import win32con
     import win32gui
+    import win32process
     HAS_WIN32 = True
 except ImportError:
     HAS_WIN32 = False
 
+try:
+    _user32 = ctypes.WinDLL('user32', use_last_error=True)
+    HAS_SENDINPUT = True
+except (AttributeError, OSError):
+    _user32 = None
+    HAS_SENDINPUT = False
+
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _pyautogui():
+    """
+    按需导入pyautogui（导入时会加载PIL并探测鼠标位置，推迟到首次输入）
+    
+    Returns:
+        module: 已配置的pyautogui模块
+    """
+    import pyautogui
+    pyautogui.PAUSE = 0         # 去掉每次调用后的默认0.1秒停顿，等待时间由paste_delay/input_delay控制
+    pyautogui.FAILSAFE = False  # 鼠标位于屏幕角落时不应导致输入失败
+    return pyautogui
+
+
+@functools.lru_cache(maxsize=1)
+def _pyperclip():
+    """
+    按需导入pyperclip
+    
+    Returns:
+        module: pyperclip模块
+    """
+    import pyperclip
+    return pyperclip
+
+
+# 剪贴板被占用时的重试策略
+CLIPBOARD_RETRY_ATTEMPTS = 3
+CLIPBOARD_RETRY_INTERVAL = 0.05  # 秒
+CLIPBOARD_PROBE_TIMEOUT = 0.5    # 可用性检测的最长等待时间（秒）
+
+# CJK统一表意文字（含扩展A区与兼容表意文字），命中时Win32方案不适用
+_HAS_CJK = re.compile('[\u4e00-\u9fff\u3400-\u4dbf\uf900-\ufaff]').search
+
+# 可直接响应 WM_PASTE 的标准编辑控件类名
+WM_PASTE_CLASSES = frozenset({'Edit', 'RichEdit20A', 'RichEdit20W', 'RICHEDIT50W'})
+
+# WM_PASTE同步发送的最长等待时间（毫秒），目标窗口无响应时改用Ctrl+V，避免输入线程被永久阻塞
+WM_PASTE_TIMEOUT_MS = 1000
+
+# SendInput 常量（见 MSDN INPUT / KEYBDINPUT）
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ('dx', ctypes.c_long),
+        ('dy', ctypes.c_long),
+        ('mouseData', ctypes.c_ulong),
+        ('dwFlags', ctypes.c_ulong),
+        ('time', ctypes.c_ulong),
+        ('dwExtraInfo', ctypes.c_size_t),
+    ]
+
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ('wVk', ctypes.c_ushort),
+        ('wScan', ctypes.c_ushort),
+        ('dwFlags', ctypes.c_ulong),
+        ('time', ctypes.c_ulong),
+        ('dwExtraInfo', ctypes.c_size_t),
+    ]
+
+
+class _HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [
+        ('uMsg', ctypes.c_ulong),
+        ('wParamL', ctypes.c_ushort),
+        ('wParamH', ctypes.c_ushort),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [
+        ('mi', _MOUSEINPUT),
+        ('ki', _KEYBDINPUT),
+        ('hi', _HARDWAREINPUT),
+    ]
+
+
+class _INPUT(ctypes.Structure):
+    _anonymous_ = ('u',)
+    _fields_ = [
+        ('type', ctypes.c_ulong),
+        ('u', _INPUTUNION),
+    ]
+
+
+def _send_unicode_input(text: str) -> int:
+    """
+    通过一次SendInput调用发送整段文本（KEYEVENTF_UNICODE）
+    每个UTF-16码元生成一对按下/抬起事件，超出BMP的字符以代理对发送
+
+    Args:
+        text: 要发送的文本
+
+    Returns:
+        int: 实际注入的事件数，与 2 * UTF-16码元数 相等表示全部成功
+    """
+    utf16 = text.encode('utf-16-le')
+    units = struct.unpack(f'<{len(utf16) // 2}H', utf16)
+
+    inputs = (_INPUT * (2 * len(units)))()
+    for i, unit in enumerate(units):
+        down = inputs[2 * i]
+        down.type = INPUT_KEYBOARD
+        down.ki.wScan = unit
+        down.ki.dwFlags = KEYEVENTF_UNICODE
+
+        up = inputs[2 * i + 1]
+        up.type = INPUT_KEYBOARD
+        up.ki.wScan = unit
+        up.ki.dwFlags = KEYEVENTF_UNICODE | KEYEVENTF_KEYUP
+
+    return _user32.SendInput(len(inputs), inputs, ctypes.sizeof(_INPUT))
+
+
+class _PartialInputError(Exception):
+    """SendInput只注入了部分事件：文本已部分输入，任何降级方法都会导致重复文本"""
+
+
 class InputMethod(Enum):
     """输入方法枚举"""
     CLIPBOARD = "clipboard"  # 剪贴板方案（主方案）
+    SENDINPUT = "sendinput"  # SendInput Unicode批量输入方案（绕过输入法，中文优先）
     WIN32 = "win32"          # Win32 SendInput方案（备用）
     PYAUTOGUI = "pyautogui"  # pyautogui逐字输入方案（兜底）
 
 
+# 配置值 -> 输入方法
+_METHOD_MAP = {m.value: m for m in InputMethod}
+
+# 首选方法 -> 失败后依次尝试的降级方法
+_FALLBACK_ORDER: Dict[InputMethod, Tuple[InputMethod, ...]] = {
+    m: tuple(x for x in InputMethod if x != m) for m in InputMethod
+}
+
+
+class _InputJobSignals(QObject):
+    """输入任务信号，用于将结果传回发起任务的线程"""
+    finished = pyqtSignal(bool)
+
+
+class _InputJob(QRunnable):
+    """在线程池中执行的文本输入任务"""
+    
+    def __init__(self, simulator: 'TextSimulator', text: str):
+        """
+        初始化输入任务
+        
+        Args:
+            simulator: 执行输入的文本输入模拟器
+            text: 要输入的文本
+        """
+        super().__init__()
+        self.simulator = simulator
+        self.text = text
+        self.signals = _InputJobSignals()
+    
+    def run(self) -> None:
+        """执行输入并发出结果信号"""
+        try:
+            success = self.simulator.input_text(self.text)
+        except Exception as e:
+            logger.error(f"后台输入任务异常: {e}", exc_info=True)
+            success = False
+        self.signals.finished.emit(success)
+
+
 class TextSimulator:
     """文本输入模拟器，负责将文本输入到当前活动窗口"""
     
@@ -41,6 +219,14 @@ class TextSimulator:
         """
         self.config = config or {}
         self._original_clipboard: Optional[str] = None
+        self._restore_timer: Optional[threading.Timer] = None
+        # 保护剪贴板备份与恢复；每次粘贴递增代数，使已安排但尚未执行的恢复失效
+        self._clipboard_lock = threading.Lock()
+        self._restore_generation = 0
+        
+        # 单线程池：剪贴板/SendInput等阻塞操作不占用UI线程，且多次输入按顺序执行
+        self._input_pool = QThreadPool()
+        self._input_pool.setMaxThreadCount(1)
         
         # 获取配置
         self.preferred_method = self._get_preferred_method()
@@ -63,16 +249,16 @@ class TextSimulator:
         """
         method_str = self.config.get('preferred_method', 'clipboard').lower()
         
-        try:
-            return InputMethod(method_str)
-        except ValueError:
+        if method_str not in _METHOD_MAP:
             logger.warning(f"无效的输入方法配置: {method_str}，使用默认方法: clipboard")
             return InputMethod.CLIPBOARD
+        
+        return _METHOD_MAP[method_str]
     
     def input_text(self, text: str) -> bool:
         """
         将文本输入到当前活动窗口
-        使用三级降级策略确保兼容性
+        使用多级降级策略确保兼容性
         
         Args:
             text: 要输入的文本
@@ -87,46 +273,78 @@ class TextSimulator:
         logger.info(f"开始输入文本（长度: {len(text)}字符）")
         logger.debug(f"输入内容: {text}")
         
-        # 尝试首选方法
-        if self._try_input_with_method(text, self.preferred_method):
-            return True
-        
-        # 首选方法失败，尝试降级
-        logger.warning(f"首选方法 {self.preferred_method.value} 失败，尝试降级")
+        # 中文内容优先使用SendInput Unicode：不经过输入法，也不占用剪贴板
+        preferred = self.preferred_method
+        if preferred == InputMethod.CLIPBOARD and HAS_SENDINPUT and _HAS_CJK(text):
+            preferred = InputMethod.SENDINPUT
         
-        # 尝试其他方法
-        methods_to_try = [m for m in InputMethod if m != self.preferred_method]
-        
-        for method in methods_to_try:
-            logger.info(f"尝试降级方法: {method.value}")
-            if self._try_input_with_method(text, method):
+        try:
+            # 尝试首选方法
+            if self._try_input_with_method(text, preferred):
                 return True
+            
+            # 首选方法失败，尝试降级
+            logger.warning(f"首选方法 {preferred.value} 失败，尝试降级")
+            
+            # 尝试其他方法（SendInput已失败时，pyautogui方案不再重复尝试SendInput）
+            sendinput_tried = preferred == InputMethod.SENDINPUT
+            for method in _FALLBACK_ORDER[preferred]:
+                logger.info(f"尝试降级方法: {method.value}")
+                if self._try_input_with_method(text, method, sendinput_tried):
+                    return True
+                sendinput_tried = sendinput_tried or method == InputMethod.SENDINPUT
+        except _PartialInputError as e:
+            logger.error(f"{e}，停止降级以免重复输入")
+            return False
         
         # 所有方法都失败
         logger.error("所有输入方法均失败")
         return False
     
-    def _try_input_with_method(self, text: str, method: InputMethod) -> bool:
+    def input_text_async(self, text: str, callback: Optional[Callable[[bool], None]] = None) -> None:
+        """
+        在后台线程中输入文本，避免剪贴板等待和粘贴延迟阻塞Qt事件循环
+        需在Qt主线程调用，回调通过信号在主线程执行
+        
+        Args:
+            text: 要输入的文本
+            callback: 输入完成后的回调，参数为是否成功
+        """
+        job = _InputJob(self, text)
+        if callback:
+            job.signals.finished.connect(callback)
+        self._input_pool.start(job)
+        logger.debug("文本输入任务已提交到后台线程")
+    
+    def _try_input_with_method(self, text: str, method: InputMethod, sendinput_tried: bool = False) -> bool:
         """
         使用指定方法尝试输入文本
         
         Args:
             text: 要输入的文本
             method: 输入方法
+            sendinput_tried: SendInput Unicode方案是否已经失败过（pyautogui方案据此跳过SendInput）
             
         Returns:
             bool: 是否成功
+            
+        Raises:
+            _PartialInputError: SendInput只注入了部分事件，不应再降级
         """
         try:
             if method == InputMethod.CLIPBOARD:
                 return self._input_via_clipboard(text)
+            elif method == InputMethod.SENDINPUT:
+                return self._input_via_sendinput_unicode(text)
             elif method == InputMethod.WIN32:
                 return self._input_via_win32(text)
             elif method == InputMethod.PYAUTOGUI:
-                return self._input_via_pyautogui(text)
+                return self._input_via_pyautogui(text, use_sendinput=not sendinput_tried)
             else:
                 logger.error(f"未知的输入方法: {method}")
                 return False
+        except _PartialInputError:
+            raise
         except Exception as e:
             logger.error(f"使用 {method.value} 方法输入时出错: {e}", exc_info=True)
             return False
@@ -134,7 +352,7 @@ class TextSimulator:
     def _input_via_clipboard(self, text: str) -> bool:
         """
         通过剪贴板方案输入文本
-        策略：备份剪贴板 -> 写入文本 -> 模拟Ctrl+V -> 恢复剪贴板
+        策略：备份剪贴板 -> 写入文本 -> 模拟Ctrl+V -> 延迟后异步恢复剪贴板
         
         Args:
             text: 要输入的文本
@@ -146,35 +364,62 @@ class TextSimulator:
         
         try:
             # 1. 备份当前剪贴板内容
-            if self.restore_clipboard:
-                try:
-                    self._original_clipboard = pyperclip.paste()
-                    logger.debug("剪贴板内容已备份")
-                except Exception as e:
-                    logger.warning(f"备份剪贴板失败: {e}")
-                    self._original_clipboard = None
-            
-            # 2. 将文本写入剪贴板
-            pyperclip.copy(text)
-            logger.debug("文本已写入剪贴板")
-            
-            # 3. 短暂延迟，确保剪贴板更新完成
-            time.sleep(self.paste_delay)
+            # 递增代数使上一次安排的恢复失效：正在执行的恢复持有锁，会在此之前完成；尚未执行的恢复将被丢弃，
+            # 此时剪贴板里仍是上次输入的文本，沿用已有备份
+            current_clipboard = None
+            with self._clipboard_lock:
+                self._restore_generation += 1
+                if self._restore_timer is not None:
+                    self._restore_timer.cancel()
+                    self._restore_timer = None
+                
+                if self.restore_clipboard:
+                    try:
+                        current_clipboard = _pyperclip().paste()
+                    except Exception as e:
+                        logger.warning(f"读取剪贴板失败: {e}")
+                    if self._original_clipboard is not None:
+                        logger.debug("上次的剪贴板恢复未执行，沿用已有备份")
+                    else:
+                        self._original_clipboard = current_clipboard
+                        logger.debug("剪贴板内容已备份")
             
-            # 4. 模拟Ctrl+V粘贴
-            pyautogui.hotkey('ctrl', 'v')
-            logger.debug("已执行Ctrl+V粘贴")
+            # 标准编辑控件可直接发送WM_PASTE，无需经过键盘输入队列
+            paste_target = self._get_wm_paste_target()
             
-            # 5. 短暂延迟，等待粘贴完成
-            time.sleep(self.paste_delay)
+            # 2. 将文本写入剪贴板（剪贴板实际内容已是目标文本时跳过写入）
+            if current_clipboard != text:
+                self._copy_to_clipboard(text)
+                logger.debug("文本已写入剪贴板")
+                
+                # 3. 短暂延迟，确保剪贴板更新完成（WM_PASTE为同步调用，无需等待）
+                if not paste_target:
+                    time.sleep(self.paste_delay)
             
-            # 6. 恢复原剪贴板内容
-            if self.restore_clipboard and self._original_clipboard is not None:
+            # 4. 粘贴：WM_PASTE同步返回（超时或目标窗口无响应时改用Ctrl+V），否则模拟Ctrl+V
+            if paste_target:
                 try:
-                    pyperclip.copy(self._original_clipboard)
-                    logger.debug("剪贴板内容已恢复")
+                    win32gui.SendMessageTimeout(
+                        paste_target, win32con.WM_PASTE, 0, 0,
+                        win32con.SMTO_ABORTIFHUNG, WM_PASTE_TIMEOUT_MS
+                    )
+                    logger.debug(f"已向焦点控件 {paste_target} 发送WM_PASTE")
                 except Exception as e:
-                    logger.warning(f"恢复剪贴板失败: {e}")
+                    logger.warning(f"WM_PASTE发送超时或失败: {e}，改用Ctrl+V")
+                    paste_target = 0
+            if not paste_target:
+                _pyautogui().hotkey('ctrl', 'v')
+                logger.debug("已执行Ctrl+V粘贴")
+            
+            # 5. 恢复原剪贴板内容（备份与输入文本相同时无需恢复）：WM_PASTE已完成可立即恢复，Ctrl+V则等待粘贴完成后在后台恢复
+            if self.restore_clipboard and self._original_clipboard is not None and self._original_clipboard != text:
+                if paste_target:
+                    self._restore_original_clipboard()
+                else:
+                    self._schedule_clipboard_restore()
+            else:
+                with self._clipboard_lock:
+                    self._original_clipboard = None
             
             logger.info("剪贴板方案输入成功")
             return True
@@ -182,14 +427,139 @@ class TextSimulator:
             logger.error(f"剪贴板方案输入失败: {e}", exc_info=True)
             
             # 尝试恢复剪贴板
-            if self.restore_clipboard and self._original_clipboard is not None:
-                try:
-                    pyperclip.copy(self._original_clipboard)
-                except:
-                    pass
+            self._restore_original_clipboard()
             
             return False
     
+    def _get_wm_paste_target(self) -> int:
+        """
+        获取可接收WM_PASTE的焦点控件句柄
+        需要临时附加到前台窗口线程的输入队列才能取得其焦点控件
+        
+        Returns:
+            int: 焦点控件句柄，不可用或控件类型不支持WM_PASTE时返回0
+        """
+        if not HAS_WIN32:
+            return 0
+        
+        try:
+            hwnd = win32gui.GetForegroundWindow()
+            if not hwnd:
+                return 0
+            
+            target_thread, _ = win32process.GetWindowThreadProcessId(hwnd)
+            current_thread = win32api.GetCurrentThreadId()
+            attached = False
+            try:
+                if target_thread != current_thread:
+                    win32process.AttachThreadInput(current_thread, target_thread, True)
+                    attached = True
+                focus = win32gui.GetFocus()
+            finally:
+                if attached:
+                    win32process.AttachThreadInput(current_thread, target_thread, False)
+            
+            if not focus:
+                return 0
+            
+            # WM_PASTE没有返回值，只能依据控件类名判断是否支持（如Chromium窗口不支持）
+            class_name = win32gui.GetClassName(focus)
+            if class_name not in WM_PASTE_CLASSES:
+                logger.debug(f"焦点控件类型 {class_name} 不支持WM_PASTE，使用Ctrl+V")
+                return 0
+            
+            return focus
+        except Exception as e:
+            logger.debug(f"获取WM_PASTE目标控件失败: {e}，使用Ctrl+V")
+            return 0
+    
+    def _copy_to_clipboard(self, text: str) -> None:
+        """
+        写入剪贴板，剪贴板被其他程序占用时有限次重试
+        
+        Args:
+            text: 要写入的文本
+            
+        Raises:
+            Exception: 重试次数用尽后仍写入失败
+        """
+        for attempt in range(1, CLIPBOARD_RETRY_ATTEMPTS + 1):
+            try:
+                _pyperclip().copy(text)
+                return
+            except Exception as e:
+                if attempt == CLIPBOARD_RETRY_ATTEMPTS:
+                    raise
+                logger.debug(f"写入剪贴板失败（第{attempt}次）: {e}，稍后重试")
+                time.sleep(CLIPBOARD_RETRY_INTERVAL)
+    
+    def _schedule_clipboard_restore(self) -> None:
+        """在粘贴完成后于后台线程恢复原剪贴板内容"""
+        with self._clipboard_lock:
+            self._restore_timer = threading.Timer(
+                self.paste_delay * 2, self._restore_original_clipboard, args=(self._restore_generation,)
+            )
+            self._restore_timer.daemon = True
+            self._restore_timer.start()
+        logger.debug("已安排剪贴板恢复")
+    
+    def _restore_original_clipboard(self, generation: Optional[int] = None) -> None:
+        """
+        恢复备份的剪贴板内容并释放备份
+        
+        Args:
+            generation: 安排恢复时的粘贴代数，之后又开始了新的粘贴则放弃本次恢复；None表示立即恢复
+        """
+        with self._clipboard_lock:
+            if generation is not None and generation != self._restore_generation:
+                logger.debug("已开始新的粘贴，放弃过期的剪贴板恢复")
+                return
+            
+            original = self._original_clipboard
+            self._original_clipboard = None
+            self._restore_timer = None
+            if not self.restore_clipboard or original is None:
+                return
+            
+            try:
+                self._copy_to_clipboard(original)
+                logger.debug("剪贴板内容已恢复")
+            except Exception as e:
+                logger.warning(f"恢复剪贴板失败: {e}")
+    
+    def _input_via_sendinput_unicode(self, text: str) -> bool:
+        """
+        通过一次SendInput调用以UTF-16码元批量输入文本
+        KEYEVENTF_UNICODE事件不经过输入法，可直接输入中文等任意字符
+        
+        Args:
+            text: 要输入的文本
+            
+        Returns:
+            bool: 是否成功
+            
+        Raises:
+            _PartialInputError: 只注入了部分事件
+        """
+        if not HAS_SENDINPUT:
+            logger.warning("SendInput不可用，跳过此方法")
+            return False
+        
+        logger.debug("使用SendInput Unicode方案输入文本")
+        
+        expected = len(text.encode('utf-16-le'))  # 2 * UTF-16码元数 = 事件数
+        sent = _send_unicode_input(text)
+        if sent == expected:
+            logger.info(f"SendInput Unicode方案输入成功，共 {sent} 个键盘事件")
+            return True
+        
+        if sent:
+            raise _PartialInputError(f"SendInput仅注入 {sent}/{expected} 个事件")
+        
+        # 目标窗口权限更高（UIPI）时SendInput会被拒绝
+        logger.warning("SendInput被拒绝（可能目标窗口权限更高）")
+        return False
+    
     def _input_via_win32(self, text: str) -> bool:
         """
         通过Win32 SendInput API输入文本
@@ -221,14 +591,12 @@ class TextSimulator:
             # 因此此方法主要作为英文输入的备用方案
             
             # 检查是否包含中文
-            has_chinese = any('\u4e00' <= char <= '\u9fff' for char in text)
-            
-            if has_chinese:
+            if _HAS_CJK(text):
                 logger.debug("文本包含中文字符，Win32方案可能不适用")
                 return False
             
             # 对于纯英文，使用pyautogui.write
-            pyautogui.write(text, interval=self.input_delay)
+            _pyautogui().write(text, interval=self.input_delay)
             
             logger.info("Win32方案输入成功")
             return True
@@ -236,38 +604,44 @@ class TextSimulator:
             logger.error(f"Win32方案输入失败: {e}", exc_info=True)
             return False
     
-    def _input_via_pyautogui(self, text: str) -> bool:
+    def _input_via_pyautogui(self, text: str, use_sendinput: bool = True) -> bool:
         """
         通过pyautogui逐字输入（兜底方案）
         注意：此方法速度较慢，但兼容性最好
         
         Args:
             text: 要输入的文本
+            use_sendinput: 是否先尝试整段SendInput（SendInput方案刚失败过时无需重试）
             
         Returns:
             bool: 是否成功
+            
+        Raises:
+            _PartialInputError: 只注入了部分事件
         """
         logger.debug("使用pyautogui逐字输入方案")
         
+        # Windows下优先将整段文本打包为一次SendInput调用，避免逐字的系统调用和延迟
+        if HAS_SENDINPUT and use_sendinput:
+            expected = len(text.encode('utf-16-le'))  # 2 * UTF-16码元数 = 事件数
+            sent = _send_unicode_input(text)
+            if sent == expected:
+                logger.info(f"SendInput批量输入成功，共 {sent} 个键盘事件")
+                return True
+            if sent:
+                # 部分事件已注入，再逐字输入会导致重复文本
+                raise _PartialInputError(f"SendInput仅注入 {sent}/{expected} 个事件")
+            logger.warning("SendInput被拒绝（可能目标窗口权限更高），回退到逐字输入")
+        
         try:
-            # pyautogui.write对中文支持不好，改用typewrite with interval
-            # 但对于中文，仍建议使用剪贴板方案
-            
-            # 尝试使用pyautogui.typewrite
-            # 注意：此方法对特殊字符和中文支持有限
-            for char in text:
-                try:
-                    pyautogui.typewrite(char, interval=self.input_delay)
-                except Exception as e:
-                    # 如果单个字符输入失败，尝试直接按键
-                    logger.debug(f"字符 '{char}' typewrite失败: {e}，尝试其他方式")
-                    try:
-                        pyautogui.press(char)
-                    except:
-                        logger.warning(f"字符 '{char}' 无法输入，跳过")
-                        continue
-                
-                time.sleep(self.input_delay)
+            # pyautogui只能键入ASCII字符：ASCII片段一次typewrite输入（字符间隔由interval控制），
+            # 中文等非ASCII片段通过剪贴板粘贴
+            for is_ascii, group in itertools.groupby(text, key=str.isascii):
+                segment = ''.join(group)
+                if is_ascii:
+                    _pyautogui().typewrite(segment, interval=self.input_delay)
+                elif not self._input_via_clipboard(segment):
+                    logger.warning(f"非ASCII片段（{len(segment)}字符）无法输入，跳过")
             
             logger.info("pyautogui逐字输入成功")
             return True
@@ -304,6 +678,34 @@ class TextSimulator:
             logger.error(f"获取活动窗口信息失败: {e}", exc_info=True)
             return None
     
+    def _probe_clipboard(self) -> dict:
+        """
+        检查剪贴板是否可读，剪贴板被长时间占用时超时返回，避免阻塞启动
+        
+        Returns:
+            dict: 可用性测试结果
+        """
+        outcome = {}
+        
+        def read_clipboard() -> None:
+            try:
+                _pyperclip().paste()
+                outcome['available'] = True
+            except Exception as e:
+                outcome['available'] = False
+                outcome['reason'] = str(e)
+        
+        probe = threading.Thread(target=read_clipboard, daemon=True)
+        probe.start()
+        probe.join(timeout=CLIPBOARD_PROBE_TIMEOUT)
+        
+        if probe.is_alive():
+            return {
+                'available': False,
+                'reason': f'剪贴板读取超时（{CLIPBOARD_PROBE_TIMEOUT}秒）'
+            }
+        return outcome
+    
     def set_input_method(self, method: InputMethod) -> None:
         """
         设置首选输入方法
@@ -324,7 +726,6 @@ class TextSimulator:
         logger.info("开始测试输入方法可用性")
         
         results = {}
-        test_text = "Test"
         
         for method in InputMethod:
             try:
@@ -340,17 +741,13 @@ class TextSimulator:
                 
                 # 简单的可用性检查（不实际输入）
                 if method == InputMethod.CLIPBOARD:
-                    # 测试剪贴板读写
-                    try:
-                        original = pyperclip.paste()
-                        pyperclip.copy(test_text)
-                        pyperclip.copy(original)
-                        results[method.value] = {'available': True}
-                    except Exception as e:
-                        results[method.value] = {
-                            'available': False,
-                            'reason': str(e)
-                        }
+                    # 测试剪贴板可读即可，不做写入往返
+                    results[method.value] = self._probe_clipboard()
+                elif method == InputMethod.SENDINPUT:
+                    results[method.value] = {
+                        'available': HAS_SENDINPUT,
+                        'reason': 'SendInput可用' if HAS_SENDINPUT else 'SendInput不可用'
+                    }
                 elif method == InputMethod.WIN32:
                     results[method.value] = {
                         'available': HAS_WIN32,
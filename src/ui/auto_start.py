@@ -2,6 +2,8 @@
 自动启动管理模块
 处理Windows注册表操作，实现开机自启动功能
 """
+import ctypes
+import functools
 import logging
 import sys
 from pathlib import Path
@@ -13,8 +15,52 @@ try:
 except ImportError:
     HAS_WINREG = False
 
+try:
+    _RegGetValueW = ctypes.WinDLL('advapi32').RegGetValueW
+    _RegGetValueW.argtypes = [
+        ctypes.c_void_p,                 # hkey
+        ctypes.c_wchar_p,                # lpSubKey
+        ctypes.c_wchar_p,                # lpValue
+        ctypes.c_ulong,                  # dwFlags
+        ctypes.c_void_p,                 # pdwType
+        ctypes.c_void_p,                 # pvData
+        ctypes.POINTER(ctypes.c_ulong),  # pcbData
+    ]
+    _RegGetValueW.restype = ctypes.c_long
+except (AttributeError, OSError):
+    _RegGetValueW = None
+
+# RegGetValueW 参数与返回码
+RRF_RT_REG_SZ = 0x00000002
+ERROR_SUCCESS = 0
+ERROR_FILE_NOT_FOUND = 2
+RUN_VALUE_BUFFER_CHARS = 1024  # 足以容纳启动命令行，超长时退回winreg读取
+
 logger = logging.getLogger(__name__)
 
+# 平台支持情况在进程生命周期内不变
+_SUPPORTED = HAS_WINREG and sys.platform == 'win32'
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_exe_path() -> str:
+    """
+    解析当前可执行文件的路径（进程内只计算一次）
+    
+    Returns:
+        str: 可执行文件路径
+    """
+    if getattr(sys, 'frozen', False):
+        # 打包后的可执行文件
+        exe_path = sys.executable
+    else:
+        # 开发环境中，使用Python解释器 + 脚本路径
+        script_path = Path(__file__).parent.parent / "main.py"
+        exe_path = f'"{sys.executable}" "{script_path}"'
+    
+    logger.debug(f"可执行文件路径: {exe_path}")
+    return exe_path
+
 
 class AutoStartManager:
     """自动启动管理器"""
@@ -25,11 +71,76 @@ class AutoStartManager:
     
     def __init__(self):
         """初始化自动启动管理器"""
+        # Run键句柄在实例生命周期内复用，避免每次查询/修改都重新打开
+        self._key = None
+        
         if not HAS_WINREG:
             logger.warning("winreg模块不可用，自动启动功能将被禁用")
+        else:
+            self._open_key()
         
         logger.info("自动启动管理器初始化完成")
     
+    def _open_key(self):
+        """
+        打开Run注册表键（读写），无写权限时退回只读
+        
+        Returns:
+            注册表键句柄，打开失败返回None
+        """
+        try:
+            self._key = winreg.OpenKey(
+                winreg.HKEY_CURRENT_USER,
+                self.REG_PATH,
+                0,
+                winreg.KEY_READ | winreg.KEY_WRITE
+            )
+        except PermissionError:
+            logger.warning("无法以读写方式打开自动启动注册表键，退回只读模式")
+            try:
+                self._key = winreg.OpenKey(
+                    winreg.HKEY_CURRENT_USER,
+                    self.REG_PATH,
+                    0,
+                    winreg.KEY_READ
+                )
+            except Exception as e:
+                logger.error(f"打开自动启动注册表键失败: {e}", exc_info=True)
+                self._key = None
+        except Exception as e:
+            logger.error(f"打开自动启动注册表键失败: {e}", exc_info=True)
+            self._key = None
+        
+        return self._key
+    
+    def _get_key(self):
+        """
+        获取已打开的Run注册表键，之前打开失败时重试一次
+        
+        Returns:
+            注册表键句柄
+            
+        Raises:
+            OSError: 注册表键无法打开
+        """
+        if self._key is None and self._open_key() is None:
+            raise OSError(f"无法打开注册表键: {self.REG_PATH}")
+        return self._key
+    
+    def close(self) -> None:
+        """关闭缓存的注册表键句柄"""
+        if self._key is None:
+            return
+        
+        try:
+            winreg.CloseKey(self._key)
+        except Exception as e:
+            logger.debug(f"关闭注册表键失败: {e}")
+        self._key = None
+    
+    def __del__(self):
+        self.close()
+    
     def is_enabled(self) -> bool:
         """
         检查自动启动是否已启用
@@ -42,33 +153,48 @@ class AutoStartManager:
             return False
         
         try:
-            # 打开注册表键
-            key = winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER,
-                self.REG_PATH,
-                0,
-                winreg.KEY_READ
-            )
-            
-            # 尝试读取值
-            try:
-                value, _ = winreg.QueryValueEx(key, self.APP_NAME)
-                winreg.CloseKey(key)
-                
-                # 检查值是否指向当前可执行文件
-                current_exe = self._get_executable_path()
-                is_enabled = (value == current_exe)
-                
-                logger.debug(f"自动启动状态: {'已启用' if is_enabled else '未启用'}")
-                return is_enabled
-            except FileNotFoundError:
-                winreg.CloseKey(key)
+            value = self._read_run_value()
+            if value is None:
                 logger.debug("注册表中未找到自动启动项")
                 return False
+            
+            # 检查值是否指向当前可执行文件
+            is_enabled = (value == self._get_executable_path())
+            
+            logger.debug(f"自动启动状态: {'已启用' if is_enabled else '未启用'}")
+            return is_enabled
         except Exception as e:
             logger.error(f"检查自动启动状态失败: {e}", exc_info=True)
             return False
     
+    def _read_run_value(self) -> Optional[str]:
+        """
+        读取Run键下本应用的启动项
+        优先用RegGetValueW在已打开的键上单次调用读取，值不存在时直接返回而不经过异常
+        
+        Returns:
+            Optional[str]: 启动命令行，不存在时返回None
+        """
+        key = self._get_key()
+        
+        if _RegGetValueW is not None:
+            buffer = ctypes.create_unicode_buffer(RUN_VALUE_BUFFER_CHARS)
+            size = ctypes.c_ulong(ctypes.sizeof(buffer))
+            status = _RegGetValueW(
+                int(key), None, self.APP_NAME, RRF_RT_REG_SZ, None, buffer, ctypes.byref(size)
+            )
+            if status == ERROR_SUCCESS:
+                return buffer.value
+            if status == ERROR_FILE_NOT_FOUND:
+                return None
+            logger.debug(f"RegGetValueW返回错误码 {status}，改用winreg读取")
+        
+        try:
+            value, _ = winreg.QueryValueEx(key, self.APP_NAME)
+            return value
+        except FileNotFoundError:
+            return None
+    
     def enable(self) -> bool:
         """
         启用自动启动
@@ -86,25 +212,15 @@ class AutoStartManager:
             
             logger.info(f"启用自动启动: {exe_path}")
             
-            # 打开注册表键
-            key = winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER,
-                self.REG_PATH,
-                0,
-                winreg.KEY_WRITE
-            )
-            
             # 设置值
             winreg.SetValueEx(
-                key,
+                self._get_key(),
                 self.APP_NAME,
                 0,
                 winreg.REG_SZ,
                 exe_path
             )
             
-            winreg.CloseKey(key)
-            
             logger.info("自动启动已成功启用")
             return True
         except PermissionError:
@@ -128,25 +244,14 @@ class AutoStartManager:
         try:
             logger.info("禁用自动启动")
             
-            # 打开注册表键
-            key = winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER,
-                self.REG_PATH,
-                0,
-                winreg.KEY_WRITE
-            )
-            
             # 删除值
             try:
-                winreg.DeleteValue(key, self.APP_NAME)
+                winreg.DeleteValue(self._get_key(), self.APP_NAME)
                 logger.info("自动启动已成功禁用")
-                success = True
             except FileNotFoundError:
                 logger.warning("自动启动项不存在，无需删除")
-                success = True
             
-            winreg.CloseKey(key)
-            return success
+            return True
         except PermissionError:
             logger.error("权限不足，无法修改注册表。请以管理员权限运行程序。")
             return False
@@ -175,16 +280,7 @@ class AutoStartManager:
         Returns:
             str: 可执行文件路径
         """
-        if getattr(sys, 'frozen', False):
-            # 打包后的可执行文件
-            exe_path = sys.executable
-        else:
-            # 开发环境中，使用Python解释器 + 脚本路径
-            script_path = Path(__file__).parent.parent / "main.py"
-            exe_path = f'"{sys.executable}" "{script_path}"'
-        
-        logger.debug(f"可执行文件路径: {exe_path}")
-        return exe_path
+        return _resolve_exe_path()
     
     @staticmethod
     def is_supported() -> bool:
@@ -194,5 +290,5 @@ class AutoStartManager:
         Returns:
             bool: 是否支持
         """
-        return HAS_WINREG and sys.platform == 'win32'
+        return _SUPPORTED
 
@@ -2,20 +2,52 @@
 图标工具模块
 提供统一的图标加载功能，支持开发环境和打包环境
 """
+import functools
 import logging
+import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import FrozenSet, Optional
 
 from PyQt5.QtGui import QIcon
 
+# 编译后的Qt资源模块（由 build.bat 通过 pyrcc5 从 assets/resources.qrc 生成），导入即完成资源注册
+try:
+    from . import qt_resources  # noqa: F401
+    HAS_QT_RESOURCES = True
+except ImportError:
+    HAS_QT_RESOURCES = False
+
 logger = logging.getLogger(__name__)
 
+# Qt资源系统中的图标与样式表路径
+RESOURCE_ICON = ":/icons/logo.ico"
+RESOURCE_STYLESHEET = ":/styles/styles.qss"
+
+
+def _list_asset_names(assets_dir: Path) -> FrozenSet[str]:
+    """
+    列出资源目录中的文件名（一次目录扫描代替逐个文件stat）
+    
+    Args:
+        assets_dir: 资源目录
+        
+    Returns:
+        FrozenSet[str]: 目录中的文件名集合，目录不存在时为空集合
+    """
+    try:
+        with os.scandir(assets_dir) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
 
+@functools.lru_cache(maxsize=1)
 def get_icon_path() -> Optional[Path]:
     """
     获取图标文件路径
     优先查找 logo.ico（Windows任务栏需要ICO格式），如果找不到则查找 logo.svg
+    结果在进程内缓存，资源目录只扫描一次
     
     Returns:
         Optional[Path]: 图标文件路径，如果不存在则返回 None
@@ -43,15 +75,18 @@ def get_icon_path() -> Optional[Path]:
         ]
         logger.debug(f"检测到开发环境，尝试路径: {[str(p) for p in base_paths]}")
     
+    # 每个资源目录只扫描一次
+    asset_dirs = [(base_path / "assets", _list_asset_names(base_path / "assets")) for base_path in base_paths]
+    
     # 按优先级尝试查找图标文件（先ICO，后SVG）
     for icon_filename in icon_filenames:
         logger.debug(f"尝试查找图标文件: {icon_filename}")
         
-        for base_path in base_paths:
-            icon_path = base_path / "assets" / icon_filename
+        for assets_dir, asset_names in asset_dirs:
+            icon_path = assets_dir / icon_filename
             logger.debug(f"尝试图标路径: {icon_path}")
             
-            if icon_path.exists():
+            if icon_filename in asset_names:
                 logger.info(f"找到图标文件: {icon_path} (格式: {icon_filename.split('.')[-1].upper()})")
                 logger.debug(f"图标文件大小: {icon_path.stat().st_size} 字节")
                 return icon_path
@@ -66,9 +101,23 @@ def get_icon_path() -> Optional[Path]:
     return None
 
 
+@functools.lru_cache(maxsize=1)
+def get_icon_path_str() -> Optional[str]:
+    """
+    获取图标文件的绝对路径字符串（供Windows API使用），结果在进程内缓存
+    
+    Returns:
+        Optional[str]: 图标文件绝对路径，如果不存在则返回 None
+    """
+    icon_path = get_icon_path()
+    return str(icon_path.resolve()) if icon_path is not None else None
+
+
+@functools.lru_cache(maxsize=1)
 def get_app_icon() -> QIcon:
     """
     获取应用图标
+    图标在进程内只从磁盘解码一次，之后返回共享的QIcon对象
     
     Returns:
         QIcon: 应用图标对象，如果加载失败则返回空图标
@@ -76,6 +125,14 @@ def get_app_icon() -> QIcon:
     logger.info("=" * 50)
     logger.info("开始加载应用图标")
     
+    # 优先从已注册的Qt资源加载，无需访问文件系统
+    if HAS_QT_RESOURCES:
+        icon = QIcon(RESOURCE_ICON)
+        if not icon.isNull():
+            logger.info(f"从Qt资源加载应用图标: {RESOURCE_ICON}")
+            return icon
+        logger.warning(f"Qt资源中的图标无效，回退到文件加载: {RESOURCE_ICON}")
+    
     icon_path = get_icon_path()
     
     if icon_path is None:
@@ -5,8 +5,8 @@
 import logging
 from typing import Optional
 
-from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation, QRect, pyqtProperty
-from PyQt5.QtGui import QPainter, QColor, QPen, QPainterPath
+from PyQt5.QtCore import Qt, QVariantAnimation, QEasingCurve, QRect, QPoint, QPointF, QLineF, QElapsedTimer
+from PyQt5.QtGui import QPainter, QColor, QPen, QBrush, QPolygonF, QPixmap, QPalette
 from PyQt5.QtWidgets import QWidget, QApplication, QLabel, QVBoxLayout
 
 logger = logging.getLogger(__name__)
@@ -25,6 +25,8 @@ class RecordingWidget(QWidget):
     PULSE_MAX_SCALE = 1.02
     PULSE_DURATION = 1500  # 毫秒
     LIGHTNING_BLINK_INTERVAL = 500  # 闪电闪烁间隔（毫秒）
+    _LIGHTNING_OPACITIES = (1.0, 0.3)  # 闪电亮/暗两个相位的透明度
+    MAX_FRAME_RATE = 30  # 脉动动画重绘帧率上限（不超过屏幕刷新率）
     
     # 样式参数
     BG_COLOR = QColor(40, 40, 40, 230)  # 半透明深色背景
@@ -32,19 +34,51 @@ class RecordingWidget(QWidget):
     ACCENT_COLOR = QColor(52, 168, 83)  # 绿色强调色
     BORDER_RADIUS = 12
     
-    def __init__(self, parent: Optional[QWidget] = None):
+    # 标签样式表（颜色与字号运行时不变，类加载时生成一次）
+    _LABEL_QSS = f"""
+            QLabel {{
+                color: {TEXT_COLOR.name()};
+                font-size: 16px;
+                font-weight: bold;
+                background: transparent;
+                padding: 5px;
+            }}
+        """
+    
+    # 顶部装饰线与闪电图标参数
+    LINE_PADDING = 20     # 左右内边距
+    LINE_OFFSET_Y = 12    # 直线距矩形顶部的距离
+    LIGHTNING_SIZE = 16   # 闪电大小
+    _LIGHTNING_PIXMAP_SIDE = LIGHTNING_SIZE + 2  # 闪电位图边长（留出抗锯齿边缘）
+    
+    def __init__(self, parent: Optional[QWidget] = None, opaque: bool = False):
         """
         初始化录音动画窗口
         
         Args:
             parent: 父窗口
+            opaque: 是否使用不透明背景（省去合成器逐帧的透明混合；有父窗口时作为普通子控件嵌入）
         """
         super().__init__(parent)
         
+        self._opaque = opaque
+        self._bg_color = QColor(self.BG_COLOR.rgb()) if opaque else self.BG_COLOR  # rgb()不含透明通道
+        
         self._scale = 1.0  # 缩放因子，用于脉动动画
-        self._pulse_animation: Optional[QPropertyAnimation] = None
-        self._lightning_opacity = 1.0  # 闪电透明度，用于闪烁动画
-        self._lightning_timer: Optional[QTimer] = None
+        self._scaled_rect = QRect(0, 0, self.WIDGET_WIDTH, self.WIDGET_HEIGHT)  # 当前缩放后的背景矩形
+        self._last_update_rect = self._scaled_rect  # 上次请求重绘时的背景矩形
+        self._pulse_animation: Optional[QVariantAnimation] = None
+        self._lightning_idx = 0  # 闪电闪烁相位索引（由脉动动画时间驱动）
+        self._frame_interval_ms = 1000 // self.MAX_FRAME_RATE  # 两次脉动重绘的最小间隔
+        self._frame_timer = QElapsedTimer()
+        self._cached_pos: Optional[QPoint] = None  # 顶层窗口模式下缓存的屏幕底部中央位置
+        
+        # 屏幕配置变化时使缓存的位置失效
+        app = QApplication.instance()
+        if app is not None:
+            app.primaryScreenChanged.connect(self._invalidate_position)
+            app.screenAdded.connect(self._invalidate_position)
+            app.screenRemoved.connect(self._invalidate_position)
         
         logger.info("初始化录音动画窗口")
         
@@ -58,21 +92,35 @@ class RecordingWidget(QWidget):
     
     def _init_ui(self) -> None:
         """初始化UI组件"""
-        # 窗口属性
-        self.setWindowFlags(
-            Qt.WindowStaysOnTopHint |      # 窗口置顶
-            Qt.FramelessWindowHint |       # 无边框
-            Qt.Tool |                       # 工具窗口（不在任务栏显示）
-            Qt.WindowTransparentForInput   # 透明输入（不捕获鼠标事件）
-        )
-        
-        # 设置透明背景
-        self.setAttribute(Qt.WA_TranslucentBackground)
+        # 窗口属性（不透明模式且有父窗口时作为普通子控件，不创建独立的顶层窗口）
+        if not (self._opaque and self.parentWidget() is not None):
+            self.setWindowFlags(
+                Qt.WindowStaysOnTopHint |      # 窗口置顶
+                Qt.FramelessWindowHint |       # 无边框
+                Qt.Tool |                       # 工具窗口（不在任务栏显示）
+                Qt.WindowTransparentForInput   # 透明输入（不捕获鼠标事件）
+            )
+        
+        if self._opaque:
+            # 不透明背景：由Qt直接填充背景色，合成器无需逐帧透明混合
+            palette = self.palette()
+            palette.setColor(QPalette.Window, self._bg_color)
+            self.setPalette(palette)
+            self.setAutoFillBackground(True)
+        else:
+            # 设置透明背景
+            self.setAttribute(Qt.WA_TranslucentBackground)
         self.setAttribute(Qt.WA_ShowWithoutActivating)  # 显示时不激活
         
         # 设置窗口大小
         self.setFixedSize(self.WIDGET_WIDTH, self.WIDGET_HEIGHT)
         
+        # 尺寸固定，缩放矩形与闪电贴图位置所需的整数偏移预先算好
+        self._half_w = self.WIDGET_WIDTH >> 1
+        self._half_h = self.WIDGET_HEIGHT >> 1
+        self._lightning_half = self._LIGHTNING_PIXMAP_SIDE >> 1
+        self._lightning_offset_y = self.LINE_OFFSET_Y - self._lightning_half
+        
         # 创建布局
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -80,93 +128,127 @@ class RecordingWidget(QWidget):
         # 创建文本标签
         self.label = QLabel("🎤 正在聆听...")
         self.label.setAlignment(Qt.AlignCenter)
-        self.label.setStyleSheet(f"""
-            QLabel {{
-                color: {self.TEXT_COLOR.name()};
-                font-size: 16px;
-                font-weight: bold;
-                background: transparent;
-                padding: 5px;
-            }}
-        """)
+        self.label.setTextFormat(Qt.PlainText)  # 固定纯文本，跳过富文本检测
+        self.label.setStyleSheet(self._LABEL_QSS)
         
         layout.addWidget(self.label)
         
+        # 绘制用的画笔与闪电多边形在每帧中保持不变，预先创建
+        self._line_pen = QPen(self.ACCENT_COLOR, 2)
+        self._line_pen.setCapStyle(Qt.RoundCap)
+        self._lightning_poly = self._build_lightning_polygon(self.LIGHTNING_SIZE)
+        
+        # 闪电只有亮/暗两种透明度，按相位预先创建两把画刷
+        self._lightning_brushes = tuple(
+            QBrush(QColor(self.ACCENT_COLOR.red(), self.ACCENT_COLOR.green(), self.ACCENT_COLOR.blue(),
+                          round(opacity * 255)))
+            for opacity in self._LIGHTNING_OPACITIES
+        )
+        
+        # 背景与装饰线只随缩放变化、闪电只有两种透明度，预先栅格化为位图，每帧仅做贴图
+        self._bg_pixmap = self._render_background_pixmap()
+        self._lightning_pixmaps = tuple(self._render_lightning_pixmap(brush) for brush in self._lightning_brushes)
+        
+        # 闪烁只改变闪电图标所在区域，预留脉动缩放带来的位移余量
+        half_extent = self.LIGHTNING_SIZE // 2 + 4
+        self._lightning_dirty_rect = QRect(
+            self.WIDGET_WIDTH // 2 - half_extent,
+            self.LINE_OFFSET_Y - half_extent,
+            half_extent * 2,
+            half_extent * 2
+        )
+        
         logger.debug("UI组件初始化完成")
     
     def _init_animation(self) -> None:
         """初始化动画效果"""
-        # 脉动动画
-        self._pulse_animation = QPropertyAnimation(self, b"scale")
+        # 脉动动画（QVariantAnimation直接通过valueChanged推送数值，不经过Qt属性系统查找setter）
+        self._pulse_animation = QVariantAnimation(self)
         self._pulse_animation.setDuration(self.PULSE_DURATION)
         self._pulse_animation.setStartValue(self.PULSE_MIN_SCALE)
         self._pulse_animation.setEndValue(self.PULSE_MAX_SCALE)
         self._pulse_animation.setLoopCount(-1)  # 无限循环
         
         # 使用EaseInOutQuad缓动函数实现平滑动画
-        from PyQt5.QtCore import QEasingCurve
         self._pulse_animation.setEasingCurve(QEasingCurve.InOutQuad)
+        self._pulse_animation.valueChanged.connect(self._on_pulse_value_changed)
         
-        # 闪电闪烁动画定时器
-        self._lightning_timer = QTimer(self)
-        self._lightning_timer.timeout.connect(self._update_lightning)
-        self._lightning_timer.setInterval(self.LIGHTNING_BLINK_INTERVAL)
+        # 脉动重绘帧率取屏幕刷新率与上限中的较小值，动画速度由动画时长决定，与帧率无关
+        screen = QApplication.primaryScreen()
+        refresh_rate = int(screen.refreshRate() or self.MAX_FRAME_RATE) if screen else self.MAX_FRAME_RATE
+        frame_rate = max(1, min(self.MAX_FRAME_RATE, refresh_rate))
+        self._frame_interval_ms = 1000 // frame_rate
         
         logger.debug("动画效果初始化完成")
     
-    def _update_lightning(self) -> None:
-        """更新闪电闪烁效果"""
-        # 切换闪电透明度，实现闪烁效果
-        self._lightning_opacity = 1.0 if self._lightning_opacity < 0.5 else 0.3
-        self.update()  # 触发重绘
+    def _update_lightning(self) -> bool:
+        """
+        根据脉动动画的累计运行时间更新闪电闪烁状态
+        
+        Returns:
+            bool: 闪电闪烁相位是否发生变化
+        """
+        # currentTime()是跨循环的累计时间（单次循环内的时间为currentLoopTime()），不需要再加上已完成的循环
+        elapsed = self._pulse_animation.currentTime()
+        idx = (elapsed // self.LIGHTNING_BLINK_INTERVAL) & 1
+        if idx == self._lightning_idx:
+            return False
+        self._lightning_idx = idx
+        return True
+    
+    def _invalidate_position(self, *args) -> None:
+        """屏幕增减或主屏幕切换时清除缓存的位置，下次显示时重新计算"""
+        self._cached_pos = None
     
     def _position_at_bottom_center(self) -> None:
-        """将窗口定位到屏幕底部中央"""
-        screen = QApplication.primaryScreen()
-        screen_geometry = screen.availableGeometry()
+        """将窗口定位到屏幕底部中央（作为子控件时定位到父窗口底部中央）"""
+        if self.isWindow():
+            if self._cached_pos is not None:
+                self.move(self._cached_pos)
+                return
+            screen_geometry = QApplication.primaryScreen().availableGeometry()
+        else:
+            # 父窗口尺寸随时可能变化，不缓存
+            screen_geometry = self.parentWidget().rect()
         
         x = (screen_geometry.width() - self.WIDGET_WIDTH) // 2
         y = screen_geometry.height() - self.WIDGET_HEIGHT - self.MARGIN_BOTTOM
         
+        if self.isWindow():
+            self._cached_pos = QPoint(x, y)
         self.move(x, y)
-        logger.debug(f"窗口定位到: ({x}, {y})")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"窗口定位到: ({x}, {y})")
     
     def show_recording(self) -> None:
         """显示录音动画"""
-        logger.info("显示录音动画")
-        
         # 定位窗口
         self._position_at_bottom_center()
         
-        # 显示窗口
+        # 恢复隐藏时关闭的重绘，再显示窗口
+        self.setUpdatesEnabled(True)
         self.show()
         
         # 启动动画
         if self._pulse_animation:
             self._pulse_animation.start()
         
-        if self._lightning_timer:
-            self._lightning_timer.start()
-        
         logger.debug("录音动画已启动")
     
     def hide_recording(self) -> None:
         """隐藏录音动画"""
-        logger.info("隐藏录音动画")
-        
         # 停止动画
         if self._pulse_animation:
             self._pulse_animation.stop()
         
-        if self._lightning_timer:
-            self._lightning_timer.stop()
-        
-        # 隐藏窗口
+        # 关闭重绘以丢弃尚未处理的绘制请求，再隐藏窗口
+        self.setUpdatesEnabled(False)
         self.hide()
         
         # 重置状态
-        self._scale = 1.0
-        self._lightning_opacity = 1.0
+        self._set_scale(1.0)
+        self._last_update_rect = self._scaled_rect
+        self._lightning_idx = 0
         
         logger.debug("录音动画已停止")
     
@@ -178,50 +260,96 @@ class RecordingWidget(QWidget):
             event: 绘制事件
         """
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)  # 抗锯齿
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)  # 缩放贴图时平滑插值
         
-        # 计算缩放后的矩形
-        rect = self.rect()
-        center_x = rect.width() / 2
-        center_y = rect.height() / 2
+        # 缩放后的矩形在缩放因子变化时已算好
+        scaled_rect = self._scaled_rect
         
-        scaled_width = rect.width() * self._scale
-        scaled_height = rect.height() * self._scale
+        # 贴上预渲染的背景与装饰线
+        painter.drawPixmap(scaled_rect, self._bg_pixmap)
         
-        scaled_rect = QRect(
-            int(center_x - scaled_width / 2),
-            int(center_y - scaled_height / 2),
-            int(scaled_width),
-            int(scaled_height)
-        )
+        # 贴上闪电图标（位于直线中央，按闪烁相位选用亮/暗位图）
+        lightning_x = scaled_rect.left() + ((scaled_rect.width() - 1) >> 1) - self._lightning_half
+        lightning_y = scaled_rect.top() + self._lightning_offset_y
+        painter.drawPixmap(lightning_x, lightning_y, self._lightning_pixmaps[self._lightning_idx])
+        
+        # 父类绘制（文本标签）
+        super().paintEvent(event)
+    
+    def _create_pixmap(self, width: int, height: int) -> QPixmap:
+        """
+        创建按设备像素比缩放的透明位图
+        
+        Args:
+            width: 逻辑宽度
+            height: 逻辑高度
+            
+        Returns:
+            QPixmap: 透明位图
+        """
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(width * ratio), int(height * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        return pixmap
+    
+    def _render_background_pixmap(self) -> QPixmap:
+        """
+        预渲染圆角矩形背景与装饰直线
+        
+        Returns:
+            QPixmap: 原始尺寸的背景位图
+        """
+        pixmap = self._create_pixmap(self.WIDGET_WIDTH, self.WIDGET_HEIGHT)
+        rect = QRect(0, 0, self.WIDGET_WIDTH, self.WIDGET_HEIGHT)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)  # 抗锯齿
         
         # 绘制圆角矩形背景
         painter.setPen(Qt.NoPen)
-        painter.setBrush(self.BG_COLOR)
-        painter.drawRoundedRect(scaled_rect, self.BORDER_RADIUS, self.BORDER_RADIUS)
+        painter.setBrush(self._bg_color)
+        painter.drawRoundedRect(rect, self.BORDER_RADIUS, self.BORDER_RADIUS)
         
-        # 绘制直线和闪电效果（在矩形顶部）
-        self._draw_line_with_lightning(painter, scaled_rect)
+        # 绘制直线（在矩形顶部）
+        self._draw_lines(painter, rect)
         
-        # 父类绘制（文本标签）
-        super().paintEvent(event)
+        painter.end()
+        return pixmap
+    
+    def _render_lightning_pixmap(self, brush: QBrush) -> QPixmap:
+        """
+        预渲染闪电图标
+        
+        Args:
+            brush: 闪电填充画刷（决定该相位的透明度）
+            
+        Returns:
+            QPixmap: 以闪电中心为中心的方形位图
+        """
+        side = self._LIGHTNING_PIXMAP_SIDE
+        pixmap = self._create_pixmap(side, side)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)  # 抗锯齿
+        self._draw_lightning(painter, side / 2, side / 2, brush)
+        painter.end()
+        return pixmap
     
-    def _draw_line_with_lightning(self, painter: QPainter, rect: QRect) -> None:
+    def _draw_lines(self, painter: QPainter, rect: QRect) -> None:
         """
-        绘制直线和闪电图标
+        绘制直线（中间留出闪电图标的位置）
         
         Args:
             painter: 绘图对象
             rect: 绘制矩形
         """
         # 设置画笔，用于绘制直线
-        pen = QPen(self.ACCENT_COLOR, 2)
-        pen.setCapStyle(Qt.RoundCap)
-        painter.setPen(pen)
+        painter.setPen(self._line_pen)
         
         # 参数设置
-        padding = 20  # 左右内边距
-        line_y = rect.top() + 12  # 直线y坐标位置
+        padding = self.LINE_PADDING
+        line_y = rect.top() + self.LINE_OFFSET_Y  # 直线y坐标位置
         
         # 计算直线的起点和终点
         line_left = rect.left() + padding
@@ -229,19 +357,38 @@ class RecordingWidget(QWidget):
         line_center_x = (line_left + line_right) / 2
         
         # 绘制直线（分两段，中间留出闪电的位置）
-        lightning_width = 16  # 闪电宽度
+        lightning_width = self.LIGHTNING_SIZE  # 闪电宽度
         lightning_gap = lightning_width / 2  # 闪电两侧的间距
         
-        # 绘制左侧直线
-        painter.drawLine(int(line_left), int(line_y), int(line_center_x - lightning_gap), int(line_y))
+        # 左右两段直线一次批量绘制（QLineF直接接受浮点坐标）
+        painter.drawLines([
+            QLineF(line_left, line_y, line_center_x - lightning_gap, line_y),
+            QLineF(line_center_x + lightning_gap, line_y, line_right, line_y),
+        ])
+    
+    @staticmethod
+    def _build_lightning_polygon(size: float) -> QPolygonF:
+        """
+        构建以原点为中心的闪电多边形（几何形状固定，只需构建一次）
         
-        # 绘制右侧直线
-        painter.drawLine(int(line_center_x + lightning_gap), int(line_y), int(line_right), int(line_y))
+        Args:
+            size: 闪电大小
+            
+        Returns:
+            QPolygonF: 闪电多边形
+        """
+        half_size = size / 2
         
-        # 绘制闪电图标
-        self._draw_lightning(painter, line_center_x, line_y, lightning_width)
+        # 闪电形状：经典的闪电图标形状（纯直线闭合图形，无需QPainterPath的子路径/曲线开销）
+        return QPolygonF([
+            QPointF(-half_size * 0.2, -half_size),        # 顶部点（稍微偏左）
+            QPointF(-half_size * 0.5, -half_size * 0.2),  # 上中部左侧点
+            QPointF(-half_size * 0.6, 0),                 # 中心点（最左侧）
+            QPointF(half_size * 0.4, half_size * 0.2),    # 下中部右侧点
+            QPointF(half_size * 0.2, half_size),          # 底部点（稍微偏右）
+        ])
     
-    def _draw_lightning(self, painter: QPainter, center_x: float, center_y: float, size: float) -> None:
+    def _draw_lightning(self, painter: QPainter, center_x: float, center_y: float, brush: QBrush) -> None:
         """
         绘制闪电图标
         
@@ -249,75 +396,79 @@ class RecordingWidget(QWidget):
             painter: 绘图对象
             center_x: 闪电中心x坐标
             center_y: 闪电中心y坐标
-            size: 闪电大小
+            brush: 填充画刷
         """
-        # 保存当前状态
-        painter.save()
-        
-        # 设置闪电颜色和透明度
-        lightning_color = QColor(self.ACCENT_COLOR)
-        lightning_color.setAlphaF(self._lightning_opacity)
-        
-        # 创建闪电路径
-        path = QPainterPath()
-        half_size = size / 2
-        
-        # 闪电形状：经典的闪电图标形状
-        # 顶部点（稍微偏左）
-        top_x = center_x - half_size * 0.2
-        top_y = center_y - half_size
-        
-        # 上中部左侧点
-        upper_left_x = center_x - half_size * 0.5
-        upper_left_y = center_y - half_size * 0.2
-        
-        # 中心点（最左侧）
-        center_left_x = center_x - half_size * 0.6
-        center_left_y = center_y
-        
-        # 下中部右侧点
-        lower_right_x = center_x + half_size * 0.4
-        lower_right_y = center_y + half_size * 0.2
-        
-        # 底部点（稍微偏右）
-        bottom_x = center_x + half_size * 0.2
-        bottom_y = center_y + half_size
-        
-        # 构建闪电路径（形成闪电形状）
-        path.moveTo(top_x, top_y)
-        path.lineTo(upper_left_x, upper_left_y)
-        path.lineTo(center_left_x, center_left_y)
-        path.lineTo(lower_right_x, lower_right_y)
-        path.lineTo(bottom_x, bottom_y)
+        # 只记录会被修改的画笔与画刷，避免save()/restore()压栈整个绘图状态
+        prev_brush = painter.brush()
+        prev_pen = painter.pen()
         
         # 绘制闪电（使用填充而不是描边，看起来更饱满）
-        painter.setBrush(lightning_color)
+        # 平移多边形本身而非画家坐标系，绘制后无需恢复变换
+        painter.setBrush(brush)
         painter.setPen(Qt.NoPen)
-        painter.drawPath(path)
+        painter.drawPolygon(self._lightning_poly.translated(center_x, center_y))
         
-        # 恢复状态
-        painter.restore()
+        # 恢复画笔与画刷
+        painter.setBrush(prev_brush)
+        painter.setPen(prev_pen)
     
-    @pyqtProperty(float)
-    def scale(self) -> float:
+    def _compute_scaled_rect(self, scale: float) -> QRect:
         """
-        获取缩放因子（用于动画）
+        计算以窗口中心为基准缩放后的矩形
         
+        Args:
+            scale: 缩放因子
+            
         Returns:
-            float: 缩放因子
+            QRect: 缩放后的矩形
         """
-        return self._scale
+        # Q16.16定点数：只做一次浮点转换，其余均为整数运算
+        scale_i = int(scale * 65536)
+        scaled_width = (self.WIDGET_WIDTH * scale_i) >> 16
+        scaled_height = (self.WIDGET_HEIGHT * scale_i) >> 16
+        
+        return QRect(
+            self._half_w - (scaled_width >> 1),
+            self._half_h - (scaled_height >> 1),
+            scaled_width,
+            scaled_height
+        )
     
-    @scale.setter
-    def scale(self, value: float) -> None:
+    def _set_scale(self, value: float) -> None:
         """
-        设置缩放因子（用于动画）
+        设置缩放因子并同步缓存的缩放矩形（不触发重绘）
         
         Args:
             value: 缩放因子
         """
         self._scale = value
-        self.update()  # 触发重绘
+        self._scaled_rect = self._compute_scaled_rect(value)
+    
+    def _on_pulse_value_changed(self, value: float) -> None:
+        """
+        脉动动画数值变化回调
+        
+        Args:
+            value: 缩放因子
+        """
+        # 闪电闪烁与脉动共用同一时钟；缩放停在极值附近时仍需单独重绘闪电区域
+        if self._update_lightning():
+            self.update(self._lightning_dirty_rect)
+        
+        # 缩放量化到3位小数，缓动曲线产生的细微变化不值得重绘
+        quantized = round(value, 3)
+        if quantized == self._scale:
+            return
+        self._set_scale(quantized)
+        
+        # 动画驱动频率可能远高于所需帧率，间隔不足一帧时只记录数值不重绘
+        if self._frame_timer.isValid() and self._frame_timer.elapsed() < self._frame_interval_ms:
+            return
+        self._frame_timer.start()
+        
+        # 只重绘上次重绘时与当前矩形共同覆盖的区域
+        self.update(self._last_update_rect.united(self._scaled_rect))
+        self._last_update_rect = self._scaled_rect
     
     def closeEvent(self, event) -> None:
         """
@@ -332,8 +483,5 @@ class RecordingWidget(QWidget):
         if self._pulse_animation:
             self._pulse_animation.stop()
         
-        if self._lightning_timer:
-            self._lightning_timer.stop()
-        
         event.accept()
 
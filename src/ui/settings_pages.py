@@ -3,26 +3,179 @@
 包含各个配置页面的实现
 """
 import logging
+import sys
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, QUrl, pyqtBoundSignal, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QDesktopServices
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QFormLayout,
     QLabel, QLineEdit, QPushButton, QComboBox,
     QCheckBox, QSpinBox, QDoubleSpinBox, QGroupBox,
-    QTextEdit, QMessageBox, QScrollArea
+    QMessageBox
 )
 
+try:
+    from recognizers.audio_device import get_shared_pyaudio, reinitialize_shared_pyaudio
+    HAS_PYAUDIO = True
+except ImportError:
+    HAS_PYAUDIO = False
+
 logger = logging.getLogger(__name__)
 
+# 音频输入设备列表缓存有效期（秒），期间重新打开设置页不再初始化PortAudio
+AUDIO_DEVICE_CACHE_TTL = 60.0
+
+_DEVICE_CACHE: Optional[Tuple[float, List[str]]] = None  # (枚举时间, 设备名称列表)
+
+# 配置文件位置（进程生命周期内不变，导入时计算一次）
+_CONFIG_DIR = Path.home() / ".autovoicetype"
+_CONFIG_FILE = _CONFIG_DIR / "config.json"
+
+# 下拉框选项与配置值的对应关系（按下拉框选项顺序排列）
+_PROVIDERS = ("dashscope", "doubao")
+_PROVIDER_INDEX = {provider: index for index, provider in enumerate(_PROVIDERS)}
+_INPUT_METHODS = ("clipboard", "sendinput", "win32", "pyautogui")
+_METHOD_INDEX = {method: index for index, method in enumerate(_INPUT_METHODS)}
+_METHOD_DESCRIPTIONS = (
+    "通过剪贴板粘贴文本，兼容性最好，推荐使用",
+    "一次性批量发送Unicode按键，绕过输入法且不占用剪贴板，适合中文",
+    "使用Windows API输入，适合英文输入，中文支持有限",
+    "逐字符输入，速度较慢但兼容性极高"
+)
+_LANG_CODE = {"简体中文": "zh-CN", "English": "en-US"}
+_LANG_TEXT = {code: text for text, code in _LANG_CODE.items()}
+
+# 关于页面显示的Python版本
+_PYTHON_VERSION_STR = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+
+# 文本输入框配置变更的防抖间隔（毫秒），连续输入时只在停顿后发射一次
+CONFIG_DEBOUNCE_MS = 300
+
+
+# 声明式表单字段的控件工厂：返回无参可调用对象，由BasePage._build_form创建控件
+
+def _spin_factory(minimum: int, maximum: int, step: int, suffix: str) -> Callable[[], QSpinBox]:
+    """整数输入框工厂"""
+    def create() -> QSpinBox:
+        spin = QSpinBox()
+        spin.setRange(minimum, maximum)
+        spin.setSingleStep(step)
+        spin.setSuffix(suffix)
+        return spin
+    return create
+
+
+def _double_spin_factory(minimum: float, maximum: float, step: float, suffix: str,
+                         decimals: int = 2) -> Callable[[], QDoubleSpinBox]:
+    """浮点数输入框工厂"""
+    def create() -> QDoubleSpinBox:
+        spin = QDoubleSpinBox()
+        spin.setRange(minimum, maximum)
+        spin.setSingleStep(step)
+        spin.setSuffix(suffix)
+        spin.setDecimals(decimals)
+        return spin
+    return create
+
+
+def _combo_factory(items: Tuple[str, ...], int_value: bool = False) -> Callable[[], QComboBox]:
+    """文本下拉框工厂（int_value为True时选项文本按整数写入配置）"""
+    def create() -> QComboBox:
+        combo = QComboBox()
+        combo.addItems(items)
+        combo.setProperty("intValue", int_value)
+        return combo
+    return create
+
+
+def _check_factory(text: str) -> Callable[[], QCheckBox]:
+    """复选框工厂"""
+    def create() -> QCheckBox:
+        return QCheckBox(text)
+    return create
+
+
+def _enumerate_input_devices(force_refresh: bool = False) -> List[str]:
+    """
+    枚举音频输入设备（结果带有效期缓存）
+    
+    Args:
+        force_refresh: 是否忽略缓存重新枚举
+        
+    Returns:
+        List[str]: 输入设备名称列表
+    """
+    global _DEVICE_CACHE
+    
+    now = time.monotonic()
+    if not force_refresh and _DEVICE_CACHE is not None and now - _DEVICE_CACHE[0] < AUDIO_DEVICE_CACHE_TTL:
+        return _DEVICE_CACHE[1]
+    
+    if not HAS_PYAUDIO:
+        raise RuntimeError("未安装pyaudio")
+    
+    # 与录音共用同一个PortAudio实例：用户主动刷新时重建实例以重新扫描设备（正在录音时沿用现有实例），其余情况直接复用
+    p = reinitialize_shared_pyaudio() if force_refresh else get_shared_pyaudio()
+    devices = []
+    for i in range(p.get_device_count()):
+        device_info = p.get_device_info_by_index(i)
+        if device_info.get('maxInputChannels', 0) > 0:
+            devices.append(device_info.get('name', f'设备 {i}'))
+    
+    _DEVICE_CACHE = (now, devices)
+    return devices
+
+
+class _DeviceScanSignals(QObject):
+    """设备枚举任务信号，用于将结果传回UI线程"""
+    finished = pyqtSignal(list)  # 设备名称列表
+    failed = pyqtSignal(str)     # 错误信息
+
+
+class _DeviceScanTask(QRunnable):
+    """在线程池中执行的音频输入设备枚举任务（PortAudio初始化可能耗时数百毫秒）"""
+    
+    def __init__(self, force_refresh: bool = False):
+        """
+        初始化枚举任务
+        
+        Args:
+            force_refresh: 是否忽略缓存重新枚举
+        """
+        super().__init__()
+        self.force_refresh = force_refresh
+        self.signals = _DeviceScanSignals()
+    
+    def run(self) -> None:
+        """执行枚举并发出结果信号"""
+        try:
+            devices = _enumerate_input_devices(self.force_refresh)
+        except Exception as e:
+            logger.error(f"刷新音频设备失败: {e}")
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(devices)
+
 
 class BasePage(QWidget):
     """配置页面基类"""
     
-    # 配置变更信号
+    # 配置变更信号：按值类型拆分，避免通过QVariant装箱传递object
+    config_str_changed = pyqtSignal(str, str)      # (key_path, value)
+    config_int_changed = pyqtSignal(str, int)      # (key_path, value)
+    config_float_changed = pyqtSignal(str, float)  # (key_path, value)
+    config_bool_changed = pyqtSignal(str, bool)    # (key_path, value)
+    # 通用配置变更信号，仅用于重置等特殊命令
     config_changed = pyqtSignal(str, object)  # (key_path, value)
     
+    # 配置组表单布局参数（所有配置组共用）
+    GROUP_SPACING = 15
+    GROUP_MARGINS = (20, 25, 20, 20)  # 左、上、右、下
+    
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.layout = QVBoxLayout(self)
@@ -30,8 +183,134 @@ class BasePage(QWidget):
         self.layout.setSpacing(20)
         self.layout.setContentsMargins(30, 30, 30, 30)
         
+        # 页面控件在首次显示时才构建，未访问的页面不创建控件
+        self._built = False
+        self._pending_config: Optional[Mapping[str, Any]] = None  # 构建前收到的配置，构建后应用
+        self._is_loading = False  # 正在将配置加载到控件，期间不发射配置变更
+        
+        # 声明式表单字段：配置路径 -> (控件, 默认值)
+        self._form_fields: Dict[str, Tuple[QWidget, object]] = {}
+        
+        # 防抖中的配置值及各配置项的计时器
+        self._debounced_values: Dict[str, str] = {}
+        self._debounce_timers: Dict[str, QTimer] = {}
+        
         logger.debug(f"初始化配置页面: {self.__class__.__name__}")
     
+    def showEvent(self, event) -> None:
+        """
+        首次显示时构建页面控件，并应用隐藏期间收到的配置
+        
+        Args:
+            event: 显示事件
+        """
+        self._ensure_built()
+        self._apply_pending_config()
+        super().showEvent(event)
+    
+    def _ensure_built(self) -> None:
+        """构建页面控件（仅执行一次），并应用构建前缓存的配置"""
+        if self._built:
+            return
+        self._built = True
+        self._build_ui()
+        self._apply_pending_config()
+    
+    def _apply_pending_config(self) -> None:
+        """应用缓存的配置（如有）"""
+        if self._pending_config is not None:
+            config, self._pending_config = self._pending_config, None
+            with self._loading_config():
+                self._apply_config(config)
+    
+    def _build_ui(self) -> None:
+        """构建页面控件，由子类实现"""
+        pass
+    
+    def load_config(self, config: Mapping[str, Any]) -> None:
+        """
+        加载配置到界面（页面尚未构建或当前不可见时缓存，下次显示时再应用）
+        
+        Args:
+            config: 配置的只读视图
+        """
+        if not self._built or not self.isVisible():
+            self._pending_config = config
+            return
+        with self._loading_config():
+            self._apply_config(config)
+    
+    @contextmanager
+    def _loading_config(self):
+        """加载配置期间屏蔽配置变更信号并暂停重绘，避免每个控件赋值都触发变更与重绘"""
+        self._is_loading = True
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(True)
+            self._is_loading = False
+    
+    def _apply_config(self, config: Mapping[str, Any]) -> None:
+        """
+        将配置应用到页面控件（基类处理声明式表单字段，子类扩展其余控件）
+        
+        Args:
+            config: 配置字典
+        """
+        for key_path, (widget, default) in self._form_fields.items():
+            section, name = key_path.split(".", 1)
+            self._set_field_value(widget, config.get(section, {}).get(name, default))
+    
+    def _build_form(self, form_layout: QFormLayout, fields: tuple) -> None:
+        """
+        按声明式字段表创建表单行，并连接到共享的配置变更槽
+        
+        Args:
+            form_layout: 表单布局
+            fields: (标签, 配置路径, 控件工厂, 默认值) 元组序列，复选框标签为空字符串
+        """
+        for label, key_path, factory, default in fields:
+            widget = factory()
+            widget.setProperty("configKey", key_path)
+            self._set_field_value(widget, default)  # 先设默认值再连接信号，避免构建时发射变更
+            
+            if isinstance(widget, QCheckBox):
+                widget.stateChanged.connect(self._on_check_changed)
+            elif isinstance(widget, QDoubleSpinBox):
+                widget.valueChanged.connect(self._on_float_changed)
+            elif isinstance(widget, QSpinBox):
+                widget.valueChanged.connect(self._on_int_changed)
+            elif widget.property("intValue"):
+                widget.currentTextChanged.connect(self._on_int_text_changed)
+            else:
+                widget.currentTextChanged.connect(self._on_text_changed)
+            
+            if label:
+                field_label = QLabel(label)
+                field_label.setObjectName("FieldLabel")
+                form_layout.addRow(field_label, widget)
+            else:
+                form_layout.addRow("", widget)
+            
+            self._form_fields[key_path] = (widget, default)
+    
+    @staticmethod
+    def _set_field_value(widget: QWidget, value: object) -> None:
+        """
+        按控件类型设置字段值
+        
+        Args:
+            widget: 表单控件
+            value: 字段值
+        """
+        if isinstance(widget, QCheckBox):
+            widget.setChecked(bool(value))
+        elif isinstance(widget, (QSpinBox, QDoubleSpinBox)):
+            widget.setValue(value)
+        else:
+            widget.setCurrentText(str(value))
+    
     def add_title(self, title: str, description: str = "") -> None:
         """
         添加页面标题和描述
@@ -61,24 +340,137 @@ class BasePage(QWidget):
             QGroupBox: 组容器
         """
         group = QGroupBox(title)
-        group_layout = QFormLayout()
-        group_layout.setSpacing(15)
-        group_layout.setContentsMargins(20, 25, 20, 20)
-        group.setLayout(group_layout)
+        group.setLayout(self._make_form_layout())
         
         self.layout.addWidget(group)
         return group
     
+    @classmethod
+    def _make_form_layout(cls) -> QFormLayout:
+        """
+        创建使用统一间距与边距的配置组表单布局
+        
+        Returns:
+            QFormLayout: 表单布局
+        """
+        form_layout = QFormLayout()
+        form_layout.setSpacing(cls.GROUP_SPACING)
+        form_layout.setContentsMargins(*cls.GROUP_MARGINS)
+        return form_layout
+    
+    def _emit(self, signal: pyqtBoundSignal, key_path: str, value: object) -> None:
+        """
+        发射配置变更信号（加载配置期间不发射）
+        
+        Args:
+            signal: 要发射的配置变更信号
+            key_path: 配置路径
+            value: 配置值
+        """
+        if self._is_loading:
+            return
+        logger.debug("配置变更: %s = %s", key_path, value)
+        signal.emit(key_path, value)
+    
     def emit_config_change(self, key_path: str, value: object) -> None:
+        """发射通用配置变更信号（仅用于重置等特殊命令，普通配置项使用emit_str等类型化方法）"""
+        self._emit(self.config_changed, key_path, value)
+    
+    def emit_str(self, key_path: str, value: str) -> None:
+        """发射字符串配置变更信号"""
+        self._emit(self.config_str_changed, key_path, value)
+    
+    def emit_int(self, key_path: str, value: int) -> None:
+        """发射整数配置变更信号"""
+        self._emit(self.config_int_changed, key_path, value)
+    
+    def emit_float(self, key_path: str, value: float) -> None:
+        """发射浮点数配置变更信号"""
+        self._emit(self.config_float_changed, key_path, value)
+    
+    def emit_bool(self, key_path: str, value: bool) -> None:
+        """发射布尔配置变更信号"""
+        self._emit(self.config_bool_changed, key_path, value)
+    
+    def connect_config_signals(self, slot: Callable[[str, object], None]) -> None:
         """
-        发射配置变更信号
+        将所有配置变更信号连接到同一个槽
+        
+        Args:
+            slot: 接收(key_path, value)的槽函数
+        """
+        for signal in (self.config_str_changed, self.config_int_changed, self.config_float_changed,
+                       self.config_bool_changed, self.config_changed):
+            signal.connect(slot)
+    
+    # 共享的配置变更槽：配置路径保存在发送控件的configKey属性中，无需为每个控件创建闭包
+    
+    @pyqtSlot(str)
+    def _on_text_changed(self, text: str) -> None:
+        """文本类控件变更（立即发射）"""
+        self.emit_str(self.sender().property("configKey"), text)
+    
+    @pyqtSlot(str)
+    def _on_text_edited(self, text: str) -> None:
+        """文本输入框变更（防抖发射）"""
+        self._debounced_emit(self.sender().property("configKey"), text)
+    
+    @pyqtSlot(str)
+    def _on_int_text_changed(self, text: str) -> None:
+        """数值文本下拉框变更"""
+        self.emit_int(self.sender().property("configKey"), int(text))
+    
+    @pyqtSlot(int)
+    def _on_int_changed(self, value: int) -> None:
+        """整数控件变更"""
+        self.emit_int(self.sender().property("configKey"), value)
+    
+    @pyqtSlot(float)
+    def _on_float_changed(self, value: float) -> None:
+        """浮点数控件变更"""
+        self.emit_float(self.sender().property("configKey"), value)
+    
+    @pyqtSlot(int)
+    def _on_check_changed(self, state: int) -> None:
+        """复选框变更"""
+        self.emit_bool(self.sender().property("configKey"), state == Qt.Checked)
+    
+    def _debounced_emit(self, key_path: str, value: str) -> None:
+        """
+        防抖发射配置变更信号，同一配置项在停顿CONFIG_DEBOUNCE_MS后才发射最新值
         
         Args:
             key_path: 配置路径
             value: 配置值
         """
-        logger.debug(f"配置变更: {key_path} = {value}")
-        self.config_changed.emit(key_path, value)
+        if self._is_loading:
+            return
+        self._debounced_values[key_path] = value
+        
+        timer = self._debounce_timers.get(key_path)
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(CONFIG_DEBOUNCE_MS)
+            timer.timeout.connect(lambda: self._emit_debounced(key_path))
+            self._debounce_timers[key_path] = timer
+        timer.start()  # 重新计时，取消上一次尚未触发的发射
+    
+    def _emit_debounced(self, key_path: str) -> None:
+        """
+        发射防抖中的配置值
+        
+        Args:
+            key_path: 配置路径
+        """
+        if key_path in self._debounced_values:
+            self.emit_str(key_path, self._debounced_values.pop(key_path))
+    
+    def flush_pending_changes(self) -> None:
+        """立即发射所有防抖中的配置变更（保存或关闭前调用）"""
+        for key_path in list(self._debounced_values):
+            self._debounce_timers[key_path].stop()
+            self._emit_debounced(key_path)
 
 
 class BasicSettingsPage(BasePage):
@@ -87,9 +479,14 @@ class BasicSettingsPage(BasePage):
     # API验证信号
     api_validation_requested = pyqtSignal(str)  # api_key
     
-    def __init__(self, parent: Optional[QWidget] = None):
-        super().__init__(parent)
-
+    # 通用设置字段：(标签, 配置路径, 控件工厂, 默认值)
+    GENERAL_FIELDS = (
+        ("日志级别:", "general.log_level", _combo_factory(("DEBUG", "INFO", "WARNING", "ERROR")), "INFO"),
+        ("", "general.auto_start", _check_factory("开机自动启动"), False),
+    )
+    
+    def _build_ui(self) -> None:
+        """构建页面控件"""
         self.add_title("基础设置", "配置应用的基本参数和API密钥")
 
         # 提供商选择
@@ -138,14 +535,15 @@ class BasicSettingsPage(BasePage):
         self.dashscope_api_key_input = QLineEdit()
         self.dashscope_api_key_input.setPlaceholderText("请输入DashScope API密钥")
         self.dashscope_api_key_input.setEchoMode(QLineEdit.Password)
-        self.dashscope_api_key_input.textChanged.connect(
-            lambda text: self.emit_config_change("api.dashscope_api_key", text)
-        )
+        self.dashscope_api_key_input.setProperty("configKey", "api.dashscope_api_key")
+        self.dashscope_api_key_input.textChanged.connect(self._on_text_edited)
 
         # 显示/隐藏按钮
         self.dashscope_toggle_btn = QPushButton("显示")
         self.dashscope_toggle_btn.setFixedWidth(60)
-        self.dashscope_toggle_btn.clicked.connect(self._toggle_dashscope_key_visibility)
+        self.dashscope_toggle_btn.clicked.connect(
+            lambda: self._toggle_echo(self.dashscope_api_key_input, self.dashscope_toggle_btn)
+        )
 
         dashscope_key_layout.addWidget(self.dashscope_api_key_input)
         dashscope_key_layout.addWidget(self.dashscope_toggle_btn)
@@ -166,9 +564,8 @@ class BasicSettingsPage(BasePage):
 
         self.dashscope_model_input = QLineEdit()
         self.dashscope_model_input.setPlaceholderText("请输入模型名称，例如: qwen3-asr-flash-realtime")
-        self.dashscope_model_input.textChanged.connect(
-            lambda text: self.emit_config_change("api.dashscope_model", text)
-        )
+        self.dashscope_model_input.setProperty("configKey", "api.dashscope_model")
+        self.dashscope_model_input.textChanged.connect(self._on_text_edited)
 
         dashscope_layout.addRow(dashscope_model_label, self.dashscope_model_input)
 
@@ -182,9 +579,8 @@ class BasicSettingsPage(BasePage):
 
         self.doubao_app_id_input = QLineEdit()
         self.doubao_app_id_input.setPlaceholderText("请输入Doubao APP ID")
-        self.doubao_app_id_input.textChanged.connect(
-            lambda text: self.emit_config_change("api.doubao_app_id", text)
-        )
+        self.doubao_app_id_input.setProperty("configKey", "api.doubao_app_id")
+        self.doubao_app_id_input.textChanged.connect(self._on_text_edited)
 
         doubao_layout.addRow(doubao_app_id_label, self.doubao_app_id_input)
 
@@ -196,14 +592,15 @@ class BasicSettingsPage(BasePage):
         self.doubao_access_token_input = QLineEdit()
         self.doubao_access_token_input.setPlaceholderText("请输入Doubao Access Token")
         self.doubao_access_token_input.setEchoMode(QLineEdit.Password)
-        self.doubao_access_token_input.textChanged.connect(
-            lambda text: self.emit_config_change("api.doubao_access_token", text)
-        )
+        self.doubao_access_token_input.setProperty("configKey", "api.doubao_access_token")
+        self.doubao_access_token_input.textChanged.connect(self._on_text_edited)
 
         # 显示/隐藏按钮
         self.doubao_toggle_btn = QPushButton("显示")
         self.doubao_toggle_btn.setFixedWidth(60)
-        self.doubao_toggle_btn.clicked.connect(self._toggle_doubao_token_visibility)
+        self.doubao_toggle_btn.clicked.connect(
+            lambda: self._toggle_echo(self.doubao_access_token_input, self.doubao_toggle_btn)
+        )
 
         doubao_token_layout.addWidget(self.doubao_access_token_input)
         doubao_token_layout.addWidget(self.doubao_toggle_btn)
@@ -234,61 +631,39 @@ class BasicSettingsPage(BasePage):
         
         form_layout.addRow(lang_label, self.lang_combo)
         
-        # 日志级别
-        log_level_label = QLabel("日志级别:")
-        log_level_label.setObjectName("FieldLabel")
-        
-        self.log_level_combo = QComboBox()
-        self.log_level_combo.addItems(["DEBUG", "INFO", "WARNING", "ERROR"])
-        self.log_level_combo.currentTextChanged.connect(
-            lambda text: self.emit_config_change("general.log_level", text)
-        )
-        
-        form_layout.addRow(log_level_label, self.log_level_combo)
-        
-        # 开机自启动
-        self.auto_start_check = QCheckBox("开机自动启动")
-        self.auto_start_check.stateChanged.connect(
-            lambda state: self.emit_config_change("general.auto_start", state == Qt.Checked)
-        )
-        
-        form_layout.addRow("", self.auto_start_check)
+        # 日志级别、开机自启动
+        self._build_form(form_layout, self.GENERAL_FIELDS)
     
     def _on_provider_changed(self, index: int) -> None:
         """提供商变更处理"""
-        providers = ["dashscope", "doubao"]
-        provider = providers[index]
+        provider = _PROVIDERS[index]
         logger.info(f"提供商已变更: {provider}")
-        self.emit_config_change("api.provider", provider)
+        self.emit_str("api.provider", provider)
 
         # 显示/隐藏对应的API设置组
         self.dashscope_group.setVisible(provider == "dashscope")
         self.doubao_group.setVisible(provider == "doubao")
 
-    def _toggle_dashscope_key_visibility(self) -> None:
-        """切换DashScope API密钥可见性"""
-        if self.dashscope_api_key_input.echoMode() == QLineEdit.Password:
-            self.dashscope_api_key_input.setEchoMode(QLineEdit.Normal)
-            self.dashscope_toggle_btn.setText("隐藏")
-        else:
-            self.dashscope_api_key_input.setEchoMode(QLineEdit.Password)
-            self.dashscope_toggle_btn.setText("显示")
-
-    def _toggle_doubao_token_visibility(self) -> None:
-        """切换Doubao Access Token可见性"""
-        if self.doubao_access_token_input.echoMode() == QLineEdit.Password:
-            self.doubao_access_token_input.setEchoMode(QLineEdit.Normal)
-            self.doubao_toggle_btn.setText("隐藏")
-        else:
-            self.doubao_access_token_input.setEchoMode(QLineEdit.Password)
-            self.doubao_toggle_btn.setText("显示")
+    @staticmethod
+    def _toggle_echo(edit: QLineEdit, btn: QPushButton) -> None:
+        """
+        切换密码输入框的明文/密文显示，当前状态记录在按钮的revealed属性中
+        
+        Args:
+            edit: 密码输入框
+            btn: 显示/隐藏按钮
+        """
+        revealed = not btn.property("revealed")
+        btn.setProperty("revealed", revealed)
+        edit.setEchoMode(QLineEdit.Normal if revealed else QLineEdit.Password)
+        btn.setText("隐藏" if revealed else "显示")
     
     def _on_language_changed(self, language: str) -> None:
         """语言变更处理"""
-        lang_code = "zh-CN" if language == "简体中文" else "en-US"
-        self.emit_config_change("general.language", lang_code)
+        lang_code = _LANG_CODE.get(language, "en-US")
+        self.emit_str("general.language", lang_code)
     
-    def load_config(self, config: dict) -> None:
+    def _apply_config(self, config: Mapping[str, Any]) -> None:
         """
         加载配置到界面
 
@@ -299,8 +674,7 @@ class BasicSettingsPage(BasePage):
 
         # 提供商设置
         provider = config.get("api", {}).get("provider", "dashscope")
-        provider_index = 0 if provider == "dashscope" else 1
-        self.provider_combo.setCurrentIndex(provider_index)
+        self.provider_combo.setCurrentIndex(_PROVIDER_INDEX.get(provider, 1))
 
         # DashScope API设置
         dashscope_api_key = config.get("api", {}).get("dashscope_api_key", "")
@@ -323,22 +697,30 @@ class BasicSettingsPage(BasePage):
 
         # 通用设置
         language = config.get("general", {}).get("language", "zh-CN")
-        lang_text = "简体中文" if language == "zh-CN" else "English"
-        self.lang_combo.setCurrentText(lang_text)
-
-        log_level = config.get("general", {}).get("log_level", "INFO")
-        self.log_level_combo.setCurrentText(log_level)
+        self.lang_combo.setCurrentText(_LANG_TEXT.get(language, "English"))
 
-        auto_start = config.get("general", {}).get("auto_start", False)
-        self.auto_start_check.setChecked(auto_start)
+        # 日志级别、开机自启动
+        super()._apply_config(config)
 
 
 class AudioSettingsPage(BasePage):
     """音频设置页面"""
     
+    # 音频参数字段：(标签, 配置路径, 控件工厂, 默认值)；声道数按索引映射，单独处理
+    SAMPLE_RATE_FIELDS = (
+        ("采样率:", "audio.sample_rate", _combo_factory(("8000", "16000", "44100", "48000"), int_value=True), 16000),
+    )
+    BUFFER_FIELDS = (
+        ("缓冲大小:", "audio.chunk_size", _spin_factory(1024, 8192, 512, " 字节"), 3200),
+    )
+    
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         
+        self._scan_task: Optional[_DeviceScanTask] = None  # 进行中的设备枚举任务
+    
+    def _build_ui(self) -> None:
+        """构建页面控件"""
         self.add_title("音频设置", "配置麦克风和音频采集参数")
         
         # 音频设备
@@ -363,12 +745,12 @@ class AudioSettingsPage(BasePage):
         self.mic_combo.addItem("默认设备")
         
         # 刷新按钮
-        refresh_btn = QPushButton("刷新")
-        refresh_btn.setFixedWidth(60)
-        refresh_btn.clicked.connect(self._refresh_audio_devices)
+        self.refresh_btn = QPushButton("刷新")
+        self.refresh_btn.setFixedWidth(60)
+        self.refresh_btn.clicked.connect(lambda: self._refresh_audio_devices(force_refresh=True))
         
         mic_layout.addWidget(self.mic_combo, 1)
-        mic_layout.addWidget(refresh_btn)
+        mic_layout.addWidget(self.refresh_btn)
         
         form_layout.addRow(mic_label, mic_layout)
         
@@ -381,17 +763,7 @@ class AudioSettingsPage(BasePage):
         form_layout = group.layout()
         
         # 采样率
-        sample_rate_label = QLabel("采样率:")
-        sample_rate_label.setObjectName("FieldLabel")
-        
-        self.sample_rate_combo = QComboBox()
-        self.sample_rate_combo.addItems(["8000", "16000", "44100", "48000"])
-        self.sample_rate_combo.setCurrentText("16000")
-        self.sample_rate_combo.currentTextChanged.connect(
-            lambda text: self.emit_config_change("audio.sample_rate", int(text))
-        )
-        
-        form_layout.addRow(sample_rate_label, self.sample_rate_combo)
+        self._build_form(form_layout, self.SAMPLE_RATE_FIELDS)
         
         # 声道数
         channels_label = QLabel("声道数:")
@@ -399,56 +771,70 @@ class AudioSettingsPage(BasePage):
         
         self.channels_combo = QComboBox()
         self.channels_combo.addItems(["单声道 (1)", "立体声 (2)"])
-        self.channels_combo.currentIndexChanged.connect(
-            lambda idx: self.emit_config_change("audio.channels", idx + 1)
-        )
+        self.channels_combo.currentIndexChanged.connect(self._on_channels_changed)
         
         form_layout.addRow(channels_label, self.channels_combo)
         
         # 缓冲大小
-        chunk_label = QLabel("缓冲大小:")
-        chunk_label.setObjectName("FieldLabel")
-        
-        self.chunk_spin = QSpinBox()
-        self.chunk_spin.setRange(1024, 8192)
-        self.chunk_spin.setSingleStep(512)
-        self.chunk_spin.setValue(3200)
-        self.chunk_spin.setSuffix(" 字节")
-        self.chunk_spin.valueChanged.connect(
-            lambda val: self.emit_config_change("audio.chunk_size", val)
-        )
-        
-        form_layout.addRow(chunk_label, self.chunk_spin)
+        self._build_form(form_layout, self.BUFFER_FIELDS)
         
         # 帮助文本
         help_label = QLabel("默认参数适用于大多数场景，通常无需修改")
         help_label.setObjectName("HelpLabel")
         form_layout.addRow("", help_label)
     
-    def _refresh_audio_devices(self) -> None:
-        """刷新音频设备列表"""
+    @pyqtSlot(int)
+    def _on_channels_changed(self, index: int) -> None:
+        """声道数变更处理（下拉框索引0/1对应1/2声道）"""
+        self.emit_int("audio.channels", index + 1)
+    
+    def _refresh_audio_devices(self, force_refresh: bool = False) -> None:
+        """
+        在后台线程刷新音频设备列表，完成后通过信号回到UI线程更新下拉框
+        
+        Args:
+            force_refresh: 是否忽略缓存重新枚举（用户点击刷新时）
+        """
+        if self._scan_task is not None:
+            logger.debug("音频设备枚举进行中，忽略重复刷新")
+            return
+        
         logger.debug("刷新音频设备列表")
+        self.refresh_btn.setEnabled(False)
+        
+        # 保留任务引用，确保信号对象在结果送达前不被回收
+        self._scan_task = _DeviceScanTask(force_refresh)
+        self._scan_task.signals.finished.connect(self._on_devices_ready)
+        self._scan_task.signals.failed.connect(self._on_devices_failed)
+        QThreadPool.globalInstance().start(self._scan_task)
+    
+    def _on_devices_ready(self, devices: list) -> None:
+        """
+        设备枚举完成处理
+        
+        Args:
+            devices: 输入设备名称列表
+        """
+        self._scan_task = None
+        self.refresh_btn.setEnabled(True)
         
         self.mic_combo.clear()
         self.mic_combo.addItem("默认设备")
+        self.mic_combo.addItems(devices)
+        logger.info(f"找到 {len(devices)} 个音频输入设备")
+    
+    def _on_devices_failed(self, error: str) -> None:
+        """
+        设备枚举失败处理
         
-        try:
-            import pyaudio
-            p = pyaudio.PyAudio()
-            
-            for i in range(p.get_device_count()):
-                device_info = p.get_device_info_by_index(i)
-                if device_info.get('maxInputChannels', 0) > 0:
-                    device_name = device_info.get('name', f'设备 {i}')
-                    self.mic_combo.addItem(device_name)
-            
-            p.terminate()
-            logger.info(f"找到 {self.mic_combo.count() - 1} 个音频输入设备")
-        except Exception as e:
-            logger.error(f"刷新音频设备失败: {e}")
-            QMessageBox.warning(self, "错误", f"无法枚举音频设备:\n{e}")
+        Args:
+            error: 错误信息
+        """
+        self._scan_task = None
+        self.refresh_btn.setEnabled(True)
+        QMessageBox.warning(self, "错误", f"无法枚举音频设备:\n{error}")
     
-    def load_config(self, config: dict) -> None:
+    def _apply_config(self, config: Mapping[str, Any]) -> None:
         """
         加载配置到界面
         
@@ -457,22 +843,26 @@ class AudioSettingsPage(BasePage):
         """
         logger.debug("加载音频设置配置")
         
-        sample_rate = config.get("audio", {}).get("sample_rate", 16000)
-        self.sample_rate_combo.setCurrentText(str(sample_rate))
+        # 采样率、缓冲大小
+        super()._apply_config(config)
         
         channels = config.get("audio", {}).get("channels", 1)
         self.channels_combo.setCurrentIndex(channels - 1)
-        
-        chunk_size = config.get("audio", {}).get("chunk_size", 3200)
-        self.chunk_spin.setValue(chunk_size)
 
 
 class InputSettingsPage(BasePage):
     """输入设置页面"""
     
-    def __init__(self, parent: Optional[QWidget] = None):
-        super().__init__(parent)
-        
+    # 输入参数字段：(标签, 配置路径, 控件工厂, 默认值)
+    PARAMETER_FIELDS = (
+        ("字符延迟:", "input.input_delay", _double_spin_factory(0.01, 1.0, 0.01, " 秒"), 0.05),
+        ("粘贴延迟:", "input.paste_delay", _double_spin_factory(0.01, 1.0, 0.01, " 秒"), 0.1),
+        ("最大长度:", "input.max_input_length", _spin_factory(100, 50000, 1000, " 字符"), 10000),
+        ("", "input.restore_clipboard", _check_factory("自动恢复剪贴板内容"), True),
+    )
+    
+    def _build_ui(self) -> None:
+        """构建页面控件"""
         self.add_title("输入设置", "配置文本输入方式和参数")
         
         # 输入方法
@@ -495,6 +885,7 @@ class InputSettingsPage(BasePage):
         self.method_combo = QComboBox()
         self.method_combo.addItems([
             "剪贴板方案 (推荐)",
+            "SendInput Unicode",
             "Win32 API",
             "PyAutoGUI"
         ])
@@ -515,78 +906,19 @@ class InputSettingsPage(BasePage):
         group = self.create_group("输入参数")
         form_layout = group.layout()
         
-        # 输入延迟
-        input_delay_label = QLabel("字符延迟:")
-        input_delay_label.setObjectName("FieldLabel")
-        
-        self.input_delay_spin = QDoubleSpinBox()
-        self.input_delay_spin.setRange(0.01, 1.0)
-        self.input_delay_spin.setSingleStep(0.01)
-        self.input_delay_spin.setValue(0.05)
-        self.input_delay_spin.setSuffix(" 秒")
-        self.input_delay_spin.setDecimals(2)
-        self.input_delay_spin.valueChanged.connect(
-            lambda val: self.emit_config_change("input.input_delay", val)
-        )
-        
-        form_layout.addRow(input_delay_label, self.input_delay_spin)
-        
-        # 粘贴延迟
-        paste_delay_label = QLabel("粘贴延迟:")
-        paste_delay_label.setObjectName("FieldLabel")
-        
-        self.paste_delay_spin = QDoubleSpinBox()
-        self.paste_delay_spin.setRange(0.01, 1.0)
-        self.paste_delay_spin.setSingleStep(0.01)
-        self.paste_delay_spin.setValue(0.1)
-        self.paste_delay_spin.setSuffix(" 秒")
-        self.paste_delay_spin.setDecimals(2)
-        self.paste_delay_spin.valueChanged.connect(
-            lambda val: self.emit_config_change("input.paste_delay", val)
-        )
-        
-        form_layout.addRow(paste_delay_label, self.paste_delay_spin)
-        
-        # 最大长度
-        max_len_label = QLabel("最大长度:")
-        max_len_label.setObjectName("FieldLabel")
-        
-        self.max_len_spin = QSpinBox()
-        self.max_len_spin.setRange(100, 50000)
-        self.max_len_spin.setSingleStep(1000)
-        self.max_len_spin.setValue(10000)
-        self.max_len_spin.setSuffix(" 字符")
-        self.max_len_spin.valueChanged.connect(
-            lambda val: self.emit_config_change("input.max_input_length", val)
-        )
-        
-        form_layout.addRow(max_len_label, self.max_len_spin)
-        
-        # 恢复剪贴板
-        self.restore_clipboard_check = QCheckBox("自动恢复剪贴板内容")
-        self.restore_clipboard_check.setChecked(True)
-        self.restore_clipboard_check.stateChanged.connect(
-            lambda state: self.emit_config_change("input.restore_clipboard", state == Qt.Checked)
-        )
-        
-        form_layout.addRow("", self.restore_clipboard_check)
+        # 字符延迟、粘贴延迟、最大长度、恢复剪贴板
+        self._build_form(form_layout, self.PARAMETER_FIELDS)
     
     def _on_method_changed(self, index: int) -> None:
         """输入方法变更处理"""
-        methods = ["clipboard", "win32", "pyautogui"]
-        self.emit_config_change("input.preferred_method", methods[index])
+        self.emit_str("input.preferred_method", _INPUT_METHODS[index])
         self._update_method_description(index)
     
     def _update_method_description(self, index: int) -> None:
         """更新方法说明"""
-        descriptions = [
-            "通过剪贴板粘贴文本，兼容性最好，推荐使用",
-            "使用Windows API输入，适合英文输入，中文支持有限",
-            "逐字符输入，速度较慢但兼容性极高"
-        ]
-        self.method_desc.setText(descriptions[index])
+        self.method_desc.setText(_METHOD_DESCRIPTIONS[index])
     
-    def load_config(self, config: dict) -> None:
+    def _apply_config(self, config: Mapping[str, Any]) -> None:
         """
         加载配置到界面
         
@@ -596,28 +928,23 @@ class InputSettingsPage(BasePage):
         logger.debug("加载输入设置配置")
         
         method = config.get("input", {}).get("preferred_method", "clipboard")
-        method_index = {"clipboard": 0, "win32": 1, "pyautogui": 2}.get(method, 0)
-        self.method_combo.setCurrentIndex(method_index)
+        self.method_combo.setCurrentIndex(_METHOD_INDEX.get(method, 0))
         
-        input_delay = config.get("input", {}).get("input_delay", 0.05)
-        self.input_delay_spin.setValue(input_delay)
-        
-        paste_delay = config.get("input", {}).get("paste_delay", 0.1)
-        self.paste_delay_spin.setValue(paste_delay)
-        
-        max_length = config.get("input", {}).get("max_input_length", 10000)
-        self.max_len_spin.setValue(max_length)
-        
-        restore_clipboard = config.get("input", {}).get("restore_clipboard", True)
-        self.restore_clipboard_check.setChecked(restore_clipboard)
+        # 字符延迟、粘贴延迟、最大长度、恢复剪贴板
+        super()._apply_config(config)
 
 
 class AdvancedSettingsPage(BasePage):
     """高级设置页面"""
     
-    def __init__(self, parent: Optional[QWidget] = None):
-        super().__init__(parent)
-        
+    # 识别设置字段：(标签, 配置路径, 控件工厂, 默认值)
+    RECOGNITION_FIELDS = (
+        ("", "recognition.semantic_punctuation_enabled", _check_factory("启用智能标点符号"), False),
+        ("超时时间:", "recognition.timeout", _spin_factory(5, 120, 5, " 秒"), 30),
+    )
+    
+    def _build_ui(self) -> None:
+        """构建页面控件"""
         self.add_title("高级设置", "配置高级功能和识别参数")
         
         # 识别设置
@@ -633,31 +960,8 @@ class AdvancedSettingsPage(BasePage):
         group = self.create_group("识别设置")
         form_layout = group.layout()
         
-        # 智能标点
-        self.punctuation_check = QCheckBox("启用智能标点符号")
-        self.punctuation_check.stateChanged.connect(
-            lambda state: self.emit_config_change(
-                "recognition.semantic_punctuation_enabled",
-                state == Qt.Checked
-            )
-        )
-        
-        form_layout.addRow("", self.punctuation_check)
-        
-        # 超时时间
-        timeout_label = QLabel("超时时间:")
-        timeout_label.setObjectName("FieldLabel")
-        
-        self.timeout_spin = QSpinBox()
-        self.timeout_spin.setRange(5, 120)
-        self.timeout_spin.setSingleStep(5)
-        self.timeout_spin.setValue(30)
-        self.timeout_spin.setSuffix(" 秒")
-        self.timeout_spin.valueChanged.connect(
-            lambda val: self.emit_config_change("recognition.timeout", val)
-        )
-        
-        form_layout.addRow(timeout_label, self.timeout_spin)
+        # 智能标点、超时时间
+        self._build_form(form_layout, self.RECOGNITION_FIELDS)
     
     def _create_config_section(self) -> None:
         """创建配置文件区域"""
@@ -668,8 +972,7 @@ class AdvancedSettingsPage(BasePage):
         config_path_label = QLabel("配置路径:")
         config_path_label.setObjectName("FieldLabel")
         
-        config_path = str(Path.home() / ".autovoicetype" / "config.json")
-        self.config_path_display = QLabel(config_path)
+        self.config_path_display = QLabel(str(_CONFIG_FILE))
         self.config_path_display.setWordWrap(True)
         self.config_path_display.setTextInteractionFlags(Qt.TextSelectableByMouse)
         
@@ -696,44 +999,20 @@ class AdvancedSettingsPage(BasePage):
         form_layout.addRow("", btn_layout)
     
     def _open_config_file(self) -> None:
-        """打开配置文件"""
-        import subprocess
-        import platform
-        
-        config_file = Path.home() / ".autovoicetype" / "config.json"
-        
-        try:
-            if platform.system() == "Windows":
-                subprocess.Popen(["notepad.exe", str(config_file)])
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.Popen(["open", "-e", str(config_file)])
-            else:  # Linux
-                subprocess.Popen(["xdg-open", str(config_file)])
-            
-            logger.info(f"已打开配置文件: {config_file}")
-        except Exception as e:
-            logger.error(f"打开配置文件失败: {e}")
-            QMessageBox.warning(self, "错误", f"无法打开配置文件:\n{e}")
+        """打开配置文件（通过系统Shell关联程序打开，不额外启动子进程）"""
+        if QDesktopServices.openUrl(QUrl.fromLocalFile(str(_CONFIG_FILE))):
+            logger.info(f"已打开配置文件: {_CONFIG_FILE}")
+        else:
+            logger.error(f"打开配置文件失败: {_CONFIG_FILE}")
+            QMessageBox.warning(self, "错误", f"无法打开配置文件:\n{_CONFIG_FILE}")
     
     def _open_config_folder(self) -> None:
-        """打开配置目录"""
-        import subprocess
-        import platform
-        
-        config_dir = Path.home() / ".autovoicetype"
-        
-        try:
-            if platform.system() == "Windows":
-                subprocess.Popen(["explorer", str(config_dir)])
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.Popen(["open", str(config_dir)])
-            else:  # Linux
-                subprocess.Popen(["xdg-open", str(config_dir)])
-            
-            logger.info(f"已打开配置目录: {config_dir}")
-        except Exception as e:
-            logger.error(f"打开配置目录失败: {e}")
-            QMessageBox.warning(self, "错误", f"无法打开配置目录:\n{e}")
+        """打开配置目录（通过系统Shell打开，不额外启动子进程）"""
+        if QDesktopServices.openUrl(QUrl.fromLocalFile(str(_CONFIG_DIR))):
+            logger.info(f"已打开配置目录: {_CONFIG_DIR}")
+        else:
+            logger.error(f"打开配置目录失败: {_CONFIG_DIR}")
+            QMessageBox.warning(self, "错误", f"无法打开配置目录:\n{_CONFIG_DIR}")
     
     def _reset_config(self) -> None:
         """重置配置"""
@@ -750,7 +1029,7 @@ class AdvancedSettingsPage(BasePage):
             # 发射信号通知主窗口
             self.emit_config_change("__reset__", True)
     
-    def load_config(self, config: dict) -> None:
+    def _apply_config(self, config: Mapping[str, Any]) -> None:
         """
         加载配置到界面
         
@@ -759,19 +1038,15 @@ class AdvancedSettingsPage(BasePage):
         """
         logger.debug("加载高级设置配置")
         
-        punctuation = config.get("recognition", {}).get("semantic_punctuation_enabled", False)
-        self.punctuation_check.setChecked(punctuation)
-        
-        timeout = config.get("recognition", {}).get("timeout", 30)
-        self.timeout_spin.setValue(timeout)
+        # 智能标点、超时时间
+        super()._apply_config(config)
 
 
 class AboutPage(BasePage):
     """关于页面"""
     
-    def __init__(self, parent: Optional[QWidget] = None):
-        super().__init__(parent)
-        
+    def _build_ui(self) -> None:
+        """构建页面控件"""
         self.add_title("关于 AutoVoiceType", "智能语音输入法")
         
         # 版本信息
@@ -802,20 +1077,15 @@ class AboutPage(BasePage):
         
         python_label = QLabel("Python 版本:")
         python_label.setObjectName("FieldLabel")
-        import sys
-        python_value = QLabel(f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}")
+        python_value = QLabel(_PYTHON_VERSION_STR)
         form_layout.addRow(python_label, python_value)
     
     def _create_usage_section(self) -> None:
         """创建使用说明区域"""
         group = self.create_group("使用说明")
-        layout = QVBoxLayout()
-        layout.setContentsMargins(15, 15, 15, 15)
         
-        usage_text = QTextEdit()
-        usage_text.setReadOnly(True)
-        usage_text.setMaximumHeight(150)
-        usage_text.setPlainText(
+        # 静态只读文本使用QLabel，无需QTextEdit的文档模型与滚动区域
+        usage_text = QLabel(
             "1. 按住【右Ctrl键】开始语音输入\n"
             "2. 对着麦克风说话\n"
             "3. 释放【右Ctrl键】结束输入\n"
@@ -825,9 +1095,12 @@ class AboutPage(BasePage):
             "- 确保麦克风工作正常\n"
             "- 在安静环境下识别效果更好"
         )
+        usage_text.setTextFormat(Qt.PlainText)
+        usage_text.setWordWrap(True)
+        usage_text.setTextInteractionFlags(Qt.TextSelectableByMouse)
         
-        layout.addWidget(usage_text)
-        group.setLayout(layout)
+        # 配置组已有表单布局，再次setLayout会被Qt忽略，直接添加为整行
+        group.layout().addRow(usage_text)
     
     def _create_links_section(self) -> None:
         """创建链接区域"""
@@ -852,8 +1125,3 @@ class AboutPage(BasePage):
         copyright_label.setAlignment(Qt.AlignCenter)
         self.layout.addStretch()
         self.layout.addWidget(copyright_label)
-    
-    def load_config(self, config: dict) -> None:
-        """关于页面不需要加载配置"""
-        pass
-
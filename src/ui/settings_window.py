@@ -2,12 +2,15 @@
 设置窗口模块
 提供用户友好的配置界面
 """
+import copy
 import logging
 import sys
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Dict, List, Optional
 
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+from PyQt5 import sip
+from PyQt5.QtCore import Qt, pyqtSignal, QFile, QObject, QRunnable, QThreadPool, QTimer
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -23,11 +26,120 @@ from .settings_pages import (
     AdvancedSettingsPage,
     AboutPage
 )
-from .icon_utils import get_app_icon, get_icon_path
+from .icon_utils import HAS_QT_RESOURCES, RESOURCE_STYLESHEET, get_app_icon, get_icon_path_str
 from .windows_icon_utils import set_qt_window_icon_win32
 
 logger = logging.getLogger(__name__)
 
+# 待保存状态文本的合并刷新间隔（毫秒）
+STATUS_DEBOUNCE_MS = 50
+
+# 左侧导航项：(显示文本, 页面名称)
+_NAV_ITEMS = (
+    ("⚙️  基础设置", "基础设置"),
+    ("🎤  音频设置", "音频设置"),
+    ("⌨️  输入设置", "输入设置"),
+    ("🔧  高级设置", "高级设置"),
+    ("ℹ️  关于", "关于"),
+)
+
+# 资源根目录（进程生命周期内不变，导入时计算一次）
+_IS_FROZEN = getattr(sys, 'frozen', False)
+_SOURCE_ROOT = Path(__file__).parent.parent.parent  # 从 src/ui/ 向上到项目根目录
+_BASE_PATH = Path(getattr(sys, '_MEIPASS', _SOURCE_ROOT)) if _IS_FROZEN else _SOURCE_ROOT  # 打包环境为临时解压目录
+_EXE_DIR = Path(sys.executable).parent
+
+# 样式表缓存：解析出的文件路径 -> 样式表内容
+_STYLESHEET_CACHE: Dict[str, str] = {}
+# 已解析的样式表文件路径（None表示尚未解析）
+_STYLESHEET_PATH: Optional[str] = None
+
+
+def _stylesheet_candidates() -> List[Path]:
+    """
+    获取样式表文件的候选路径（按优先级排列）
+    
+    在打包后的环境中，使用 sys._MEIPASS 获取临时解压目录；
+    在开发环境中，使用相对于源码的路径
+    
+    Returns:
+        List[Path]: 候选路径列表
+    """
+    source_path = _SOURCE_ROOT / "assets" / "styles.qss"
+    if _IS_FROZEN:
+        # 打包后的环境（exe）
+        return [
+            _BASE_PATH / "assets" / "styles.qss",
+            source_path,
+            Path.cwd() / "assets" / "styles.qss",
+            _EXE_DIR / "assets" / "styles.qss",
+            _EXE_DIR / "_internal" / "assets" / "styles.qss",
+        ]
+    # 开发环境（直接运行main.py）
+    return [source_path, Path.cwd() / "assets" / "styles.qss"]
+
+
+def _resolve_stylesheet_path() -> Optional[str]:
+    """
+    查找样式表位置：优先使用已编译的Qt资源，否则查找第一个存在的样式表文件，结果缓存后不再探测文件系统
+    
+    Returns:
+        Optional[str]: 样式表资源路径或文件路径，均不存在时返回None
+    """
+    global _STYLESHEET_PATH
+    if _STYLESHEET_PATH is None and HAS_QT_RESOURCES and QFile.exists(RESOURCE_STYLESHEET):
+        _STYLESHEET_PATH = RESOURCE_STYLESHEET
+    if _STYLESHEET_PATH is None:
+        for candidate in _stylesheet_candidates():
+            logger.debug(f"尝试样式表路径: {candidate}")
+            if candidate.exists():
+                _STYLESHEET_PATH = str(candidate.resolve())
+                break
+        else:
+            logger.warning("未找到样式表文件")
+            return None
+    return _STYLESHEET_PATH
+
+
+def _read_stylesheet(path: str) -> str:
+    """
+    读取样式表内容（支持Qt资源路径）
+    
+    Args:
+        path: 样式表资源路径（以":"开头）或文件路径
+        
+    Returns:
+        str: 样式表内容
+    """
+    if path.startswith(":"):
+        qss = QFile(path)
+        if not qss.open(QFile.ReadOnly):
+            raise IOError(f"无法打开Qt资源: {path}")
+        try:
+            return bytes(qss.readAll()).decode('utf-8')
+        finally:
+            qss.close()
+    # 以二进制读取后解码，跳过文本模式的换行转换
+    with open(path, 'rb') as f:
+        return f.read().decode('utf-8')
+
+
+class _IconPathSignals(QObject):
+    """图标路径解析任务信号，用于将结果传回UI线程"""
+    resolved = pyqtSignal(str)  # 图标文件绝对路径（未找到时为空字符串）
+
+
+class _IconPathTask(QRunnable):
+    """在线程池中解析图标文件路径（涉及资源目录扫描与路径解析，避免阻塞窗口首次显示）"""
+    
+    def __init__(self):
+        super().__init__()
+        self.signals = _IconPathSignals()
+    
+    def run(self) -> None:
+        """解析路径并发出结果信号"""
+        self.signals.resolved.emit(get_icon_path_str() or "")
+
 
 class FirstRunWizard(QDialog):
     """首次运行向导"""
@@ -37,6 +149,7 @@ class FirstRunWizard(QDialog):
 
         self.setWindowTitle("欢迎使用 AutoVoiceType")
         self.setModal(True)
+        self._win32_icon_set = False  # Windows任务栏图标只需设置一次
 
         # 首次运行向导固定大小
         WIZARD_WIDTH = 600
@@ -68,13 +181,14 @@ class FirstRunWizard(QDialog):
         """
         super().showEvent(event)
         
-        # 在Windows上，使用Windows API强制设置任务栏图标
-        if sys.platform == 'win32':
-            icon_path = get_icon_path()
-            if icon_path and icon_path.exists():
+        # 在Windows上，使用Windows API强制设置任务栏图标（每个窗口实例只设置一次）
+        if sys.platform == 'win32' and not self._win32_icon_set:
+            icon_path = get_icon_path_str()
+            if icon_path:
+                self._win32_icon_set = True
                 logger.debug("尝试使用Windows API设置首次运行向导的任务栏图标")
                 # 延迟一点时间，确保窗口已经完全显示
-                QTimer.singleShot(100, lambda: set_qt_window_icon_win32(self, str(icon_path.resolve())))
+                QTimer.singleShot(100, lambda: set_qt_window_icon_win32(self, icon_path))
     
     def _init_ui(self) -> None:
         """初始化UI"""
@@ -136,6 +250,19 @@ class SettingsWindow(QMainWindow):
         self.config_manager = config_manager
         self.pages = {}
         self.pending_changes = {}  # 待保存的配置变更
+        self._win32_icon_set = False  # Windows任务栏图标只需设置一次
+        self._icon_task: Optional[_IconPathTask] = None  # 进行中的图标路径解析任务
+        self._first_run_wizard: Optional[FirstRunWizard] = None  # 首次运行向导（内容固定，创建后复用）
+        self._confirm_close_box: Optional[QMessageBox] = None  # 关闭确认框（首次使用时创建，之后复用）
+        self._saved_info_box: Optional[QMessageBox] = None  # 保存成功提示框（首次使用时创建，之后复用）
+        self._no_changes_box: Optional[QMessageBox] = None  # 无需保存提示框（首次使用时创建，之后复用）
+        self.page_stack: Optional[QStackedWidget] = None  # 在_init_ui中创建，导航项可能先于它触发切换
+        
+        # 待保存项数的状态文本合并刷新，连续变更时最多约20Hz重绘状态标签
+        self._status_debounce = QTimer(self)
+        self._status_debounce.setSingleShot(True)
+        self._status_debounce.setInterval(STATUS_DEBOUNCE_MS)
+        self._status_debounce.timeout.connect(self._update_pending_status)
         
         logger.info("初始化设置窗口")
 
@@ -179,61 +306,24 @@ class SettingsWindow(QMainWindow):
         logger.info("设置窗口初始化完成")
     
     def _load_stylesheet(self) -> None:
-        """加载样式表"""
-        logger.debug("开始加载样式表")
-        
-        # 确定资源文件路径
-        # 在打包后的环境中，使用 sys._MEIPASS 获取临时解压目录
-        # 在开发环境中，使用相对路径
-        if getattr(sys, 'frozen', False):
-            # 打包后的环境（exe）
-            base_path = Path(sys._MEIPASS)
-            qss_file = base_path / "assets" / "styles.qss"
-            logger.debug(f"检测到打包环境，基础路径: {base_path}")
-        else:
-            # 开发环境（直接运行main.py）
-            base_path = Path(__file__).parent.parent.parent
-            qss_file = base_path / "assets" / "styles.qss"
-            logger.debug(f"检测到开发环境，基础路径: {base_path}")
-        
-        logger.debug(f"样式表文件路径: {qss_file}")
-        logger.debug(f"样式表文件是否存在: {qss_file.exists()}")
+        """加载样式表（文件路径与内容在进程内缓存，再次打开设置窗口时不访问磁盘）"""
+        qss_file = _resolve_stylesheet_path()
+        if qss_file is None:
+            logger.error("所有样式表路径尝试均失败，界面将使用默认样式")
+            return
         
-        if qss_file.exists():
+        stylesheet = _STYLESHEET_CACHE.get(qss_file)
+        if stylesheet is None:
             try:
-                with open(qss_file, 'r', encoding='utf-8') as f:
-                    stylesheet = f.read()
-                    self.setStyleSheet(stylesheet)
-                logger.info(f"样式表加载成功: {qss_file}")
-                logger.debug(f"样式表内容长度: {len(stylesheet)} 字符")
+                stylesheet = _read_stylesheet(qss_file)
             except Exception as e:
-                logger.error(f"加载样式表失败: {e}", exc_info=True)
-        else:
-            logger.warning(f"样式表文件不存在: {qss_file}")
-            # 尝试其他可能的路径
-            alternative_paths = [
-                Path(__file__).parent.parent.parent / "assets" / "styles.qss",
-                Path.cwd() / "assets" / "styles.qss",
-            ]
-            if getattr(sys, 'frozen', False):
-                # 打包环境：尝试 exe 所在目录
-                exe_dir = Path(sys.executable).parent
-                alternative_paths.append(exe_dir / "assets" / "styles.qss")
-                alternative_paths.append(exe_dir / "_internal" / "assets" / "styles.qss")
-            
-            for alt_path in alternative_paths:
-                logger.debug(f"尝试备用路径: {alt_path}")
-                if alt_path.exists():
-                    try:
-                        with open(alt_path, 'r', encoding='utf-8') as f:
-                            stylesheet = f.read()
-                            self.setStyleSheet(stylesheet)
-                        logger.info(f"样式表从备用路径加载成功: {alt_path}")
-                        return
-                    except Exception as e:
-                        logger.warning(f"从备用路径加载样式表失败: {alt_path}, 错误: {e}")
-            
-            logger.error("所有样式表路径尝试均失败，界面将使用默认样式")
+                logger.error(f"加载样式表失败: {qss_file}, 错误: {e}", exc_info=True)
+                return
+            _STYLESHEET_CACHE[qss_file] = stylesheet
+            logger.info(f"样式表加载成功: {qss_file}")
+            logger.debug(f"样式表内容长度: {len(stylesheet)} 字符")
+        
+        self.setStyleSheet(stylesheet)
     
     def _init_ui(self) -> None:
         """初始化UI组件"""
@@ -304,21 +394,15 @@ class SettingsWindow(QMainWindow):
         self.nav_list.setObjectName("SidebarList")
         self.nav_list.setSpacing(2)
         
-        # 导航项
-        nav_items = [
-            ("⚙️  基础设置", "基础设置"),
-            ("🎤  音频设置", "音频设置"),
-            ("⌨️  输入设置", "输入设置"),
-            ("🔧  高级设置", "高级设置"),
-            ("ℹ️  关于", "关于")
-        ]
-        
-        for display_text, page_name in nav_items:
+        # 填充期间暂停重绘，所有导航项添加完毕后只刷新一次
+        self.nav_list.setUpdatesEnabled(False)
+        for display_text, page_name in _NAV_ITEMS:
             item = QListWidgetItem(display_text)
             item.setData(Qt.UserRole, page_name)
             self.nav_list.addItem(item)
+        self.nav_list.setUpdatesEnabled(True)
         
-        # 连接信号
+        # 填充完成后再连接信号，添加导航项不会触发页面切换
         self.nav_list.currentRowChanged.connect(self._on_nav_changed)
         
         layout.addWidget(self.nav_list)
@@ -329,7 +413,7 @@ class SettingsWindow(QMainWindow):
     def _create_button_bar(self) -> QWidget:
         """创建底部按钮栏"""
         button_bar = QWidget()
-        button_bar.setStyleSheet("background-color: #f5f5f5; border-top: 1px solid #e0e0e0;")
+        button_bar.setObjectName("ButtonBar")  # 样式见 styles.qss 中的 #ButtonBar
         button_bar.setFixedHeight(60)
         
         layout = QHBoxLayout(button_bar)
@@ -368,26 +452,26 @@ class SettingsWindow(QMainWindow):
         """创建所有配置页面"""
         # 基础设置页
         basic_page = BasicSettingsPage()
-        basic_page.config_changed.connect(self._on_config_changed)
+        basic_page.connect_config_signals(self._on_config_changed)
         basic_page.api_validation_requested.connect(self._validate_api_key)
         self.pages["基础设置"] = basic_page
         self.page_stack.addWidget(basic_page)
         
         # 音频设置页
         audio_page = AudioSettingsPage()
-        audio_page.config_changed.connect(self._on_config_changed)
+        audio_page.connect_config_signals(self._on_config_changed)
         self.pages["音频设置"] = audio_page
         self.page_stack.addWidget(audio_page)
         
         # 输入设置页
         input_page = InputSettingsPage()
-        input_page.config_changed.connect(self._on_config_changed)
+        input_page.connect_config_signals(self._on_config_changed)
         self.pages["输入设置"] = input_page
         self.page_stack.addWidget(input_page)
         
         # 高级设置页
         advanced_page = AdvancedSettingsPage()
-        advanced_page.config_changed.connect(self._on_config_changed)
+        advanced_page.connect_config_signals(self._on_config_changed)
         self.pages["高级设置"] = advanced_page
         self.page_stack.addWidget(advanced_page)
         
@@ -409,7 +493,7 @@ class SettingsWindow(QMainWindow):
             return
         
         # 检查 page_stack 是否已初始化
-        if not hasattr(self, 'page_stack') or self.page_stack is None:
+        if self.page_stack is None:
             return
         
         item = self.nav_list.item(index)
@@ -419,7 +503,7 @@ class SettingsWindow(QMainWindow):
         page_name = item.data(Qt.UserRole)
         
         self.page_stack.setCurrentIndex(index)
-        logger.debug(f"切换到页面: {page_name}")
+        logger.debug("切换到页面: %s", page_name)
     
     def _on_config_changed(self, key_path: str, value: object) -> None:
         """
@@ -441,10 +525,15 @@ class SettingsWindow(QMainWindow):
         if key_path == "api.model":
             logger.info(f"模型配置已变更: {value}")
         else:
-            logger.debug(f"配置变更: {key_path} = {value}")
+            logger.debug("配置变更: %s = %s", key_path, value)
         
-        # 更新状态标签
-        self.status_label.setText(f"有 {len(self.pending_changes)} 项配置待保存")
+        # 更新状态标签（合并短时间内的连续变更）
+        self._status_debounce.start()
+    
+    def _update_pending_status(self) -> None:
+        """刷新待保存配置项数的状态文本"""
+        if self.pending_changes:
+            self.status_label.setText(f"有 {len(self.pending_changes)} 项配置待保存")
     
     def _validate_api_key(self, api_key: str) -> None:
         """
@@ -476,28 +565,32 @@ class SettingsWindow(QMainWindow):
         )
         logger.info("API密钥验证通过")
     
+    def _flush_page_edits(self) -> None:
+        """让各页面立即提交防抖中的输入，避免停顿前点击保存丢失最后的修改"""
+        for page in self.pages.values():
+            page.flush_pending_changes()
+    
     def _apply_changes(self) -> None:
         """应用配置变更（不关闭窗口）"""
+        self._flush_page_edits()
         if not self.pending_changes:
-            QMessageBox.information(self, "提示", "没有需要保存的配置")
+            if self._no_changes_box is None:
+                self._no_changes_box = QMessageBox(
+                    QMessageBox.Information, "提示", "没有需要保存的配置", QMessageBox.Ok, self
+                )
+            self._no_changes_box.exec_()
             return
         
         changes_count = len(self.pending_changes)
         logger.info(f"应用 {changes_count} 项配置变更")
         
-        # 应用所有变更到配置管理器
-        for key_path, value in self.pending_changes.items():
-            success = self.config_manager.set(key_path, value)
-            if success:
-                if key_path == "api.model":
-                    logger.info(f"模型配置已保存: {value}")
-                else:
-                    logger.debug(f"配置项已保存: {key_path} = {value}")
-            else:
-                logger.error(f"保存配置项失败: {key_path} = {value}")
+        # 一次性批量应用所有变更到配置管理器
+        if not self.config_manager.update(self.pending_changes):
+            logger.error("部分配置项应用失败")
         
         # 保存配置文件
         if self.config_manager.save_config():
+            self._status_debounce.stop()
             self.status_label.setText("✓ 配置已保存")
             self.pending_changes.clear()
             
@@ -508,13 +601,18 @@ class SettingsWindow(QMainWindow):
             QTimer.singleShot(2000, lambda: self.status_label.setText(""))
             
             logger.info(f"配置保存成功，共保存 {changes_count} 项配置")
-            QMessageBox.information(self, "成功", "配置已保存并应用")
+            if self._saved_info_box is None:
+                self._saved_info_box = QMessageBox(
+                    QMessageBox.Information, "成功", "配置已保存并应用", QMessageBox.Ok, self
+                )
+            self._saved_info_box.exec_()
         else:
             logger.error("配置保存失败")
             QMessageBox.critical(self, "错误", "配置保存失败，请检查文件权限")
     
     def _save_and_close(self) -> None:
         """保存配置并关闭窗口"""
+        self._flush_page_edits()
         if self.pending_changes:
             self._apply_changes()
         
@@ -525,7 +623,8 @@ class SettingsWindow(QMainWindow):
         logger.warning("重置所有配置")
         
         # 使用默认配置
-        self.config_manager.config = self.config_manager.DEFAULT_CONFIG.copy()
+        # 深拷贝：之后的set()/update()会原地修改嵌套的配置节，不能共享DEFAULT_CONFIG中的字典
+        self.config_manager.config = copy.deepcopy(self.config_manager.DEFAULT_CONFIG)
         
         # 保存配置
         if self.config_manager.save_config():
@@ -534,6 +633,7 @@ class SettingsWindow(QMainWindow):
             
             # 清除待保存变更
             self.pending_changes.clear()
+            self._status_debounce.stop()
             self.status_label.setText("✓ 配置已重置")
             
             QTimer.singleShot(2000, lambda: self.status_label.setText(""))
@@ -548,7 +648,8 @@ class SettingsWindow(QMainWindow):
         """加载所有配置到页面"""
         logger.info("加载配置到所有页面")
         
-        config = self.config_manager.config
+        # 所有页面共享同一个只读视图，无需复制，页面也无法修改配置字典
+        config = MappingProxyType(self.config_manager.config)
         
         for page_name, page in self.pages.items():
             if hasattr(page, 'load_config'):
@@ -562,8 +663,9 @@ class SettingsWindow(QMainWindow):
         Returns:
             bool: 用户是否确认继续
         """
-        wizard = FirstRunWizard(self)
-        result = wizard.exec_()
+        if self._first_run_wizard is None or sip.isdeleted(self._first_run_wizard):
+            self._first_run_wizard = FirstRunWizard(self)
+        result = self._first_run_wizard.exec_()
         
         return result == QDialog.Accepted
     
@@ -606,15 +708,31 @@ class SettingsWindow(QMainWindow):
 
         # 在Windows上，使用Windows API强制设置任务栏图标
         # 这可以确保任务栏显示正确的图标，即使exe文件本身没有图标
-        if sys.platform == 'win32':
-            icon_path = get_icon_path()
-            if icon_path and icon_path.exists():
-                logger.debug("尝试使用Windows API设置任务栏图标")
-                # 延迟一点时间，确保窗口已经完全显示
-                QTimer.singleShot(100, lambda: self._set_win32_icon(str(icon_path.resolve())))
+        # 窗口句柄在隐藏/重新显示之间保持不变，因此每个窗口实例只需设置一次
+        # 图标路径在线程池中解析，不阻塞窗口首次绘制
+        if sys.platform == 'win32' and not self._win32_icon_set:
+            self._win32_icon_set = True
+            self._icon_task = _IconPathTask()
+            self._icon_task.signals.resolved.connect(self._on_icon_path_resolved)
+            QThreadPool.globalInstance().start(self._icon_task)
 
         super().showEvent(event)
     
+    def _on_icon_path_resolved(self, icon_path: str) -> None:
+        """
+        图标路径解析完成处理（UI线程）
+        
+        Args:
+            icon_path: 图标文件绝对路径，未找到时为空字符串
+        """
+        self._icon_task = None
+        if not icon_path:
+            logger.debug("未找到图标文件，跳过Windows API图标设置")
+            return
+        logger.debug("尝试使用Windows API设置任务栏图标")
+        # 延迟一点时间，确保窗口已经完全显示
+        QTimer.singleShot(100, lambda: self._set_win32_icon(icon_path))
+    
     def _set_win32_icon(self, icon_path: str) -> None:
         """
         使用Windows API设置窗口图标
@@ -639,14 +757,18 @@ class SettingsWindow(QMainWindow):
             event: 关闭事件
         """
         # 检查是否有未保存的变更
+        self._flush_page_edits()
         if self.pending_changes:
-            reply = QMessageBox.question(
-                self,
-                "确认关闭",
-                "有未保存的配置变更，确定要关闭吗？",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No
-            )
+            if self._confirm_close_box is None:
+                self._confirm_close_box = QMessageBox(
+                    QMessageBox.Question,
+                    "确认关闭",
+                    "有未保存的配置变更，确定要关闭吗？",
+                    QMessageBox.Yes | QMessageBox.No,
+                    self
+                )
+                self._confirm_close_box.setDefaultButton(QMessageBox.No)
+            reply = self._confirm_close_box.exec_()
             
             if reply == QMessageBox.No:
                 event.ignore()
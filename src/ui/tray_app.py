@@ -26,6 +26,9 @@ class TrayApp(QObject):
     settings_requested = pyqtSignal()  # 打开设置信号
     quit_requested = pyqtSignal()      # 退出应用信号
     
+    # 生成的默认图标（所有实例共享，只绘制一次）
+    _DEFAULT_ICON_CACHE: Optional[QIcon] = None
+    
     def __init__(self, app: QApplication):
         """
         初始化系统托盘应用
@@ -38,6 +41,7 @@ class TrayApp(QObject):
         self.app = app
         self.tray_icon: Optional[QSystemTrayIcon] = None
         self.menu: Optional[QMenu] = None
+        self._quit_confirm_box: Optional[QMessageBox] = None  # 退出确认框（首次使用时创建，之后复用）
         
         # 回调函数
         self._on_settings_callback: Optional[Callable] = None
@@ -58,6 +62,9 @@ class TrayApp(QObject):
         # 初始化托盘图标
         self._init_tray_icon()
         
+        # 任何退出路径（菜单退出、系统关机等）都统一在退出前清理托盘资源
+        self.app.aboutToQuit.connect(self.cleanup)
+        
         logger.info("系统托盘应用初始化完成")
     
     def _init_tray_icon(self) -> None:
@@ -103,11 +110,14 @@ class TrayApp(QObject):
     
     def _generate_default_icon(self) -> QIcon:
         """
-        生成默认图标（简单的圆形麦克风图标）
+        生成默认图标（简单的圆形麦克风图标），结果在类级别缓存
         
         Returns:
             QIcon: 生成的图标
         """
+        if TrayApp._DEFAULT_ICON_CACHE is not None:
+            return TrayApp._DEFAULT_ICON_CACHE
+        
         # 创建32x32的像素图
         pixmap = QPixmap(32, 32)
         pixmap.fill(QColor(0, 0, 0, 0))  # 透明背景
@@ -133,7 +143,8 @@ class TrayApp(QObject):
         painter.end()
         
         logger.debug("已生成默认图标")
-        return QIcon(pixmap)
+        TrayApp._DEFAULT_ICON_CACHE = QIcon(pixmap)
+        return TrayApp._DEFAULT_ICON_CACHE
     
     def _create_context_menu(self) -> None:
         """创建右键菜单"""
@@ -199,13 +210,15 @@ class TrayApp(QObject):
         logger.info("退出菜单被点击")
         
         # 确认对话框
-        reply = QMessageBox.question(
-            None,
-            "确认退出",
-            "确定要退出 AutoVoiceType 吗？",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
-        )
+        if self._quit_confirm_box is None:
+            self._quit_confirm_box = QMessageBox(
+                QMessageBox.Question,
+                "确认退出",
+                "确定要退出 AutoVoiceType 吗？",
+                QMessageBox.Yes | QMessageBox.No
+            )
+            self._quit_confirm_box.setDefaultButton(QMessageBox.No)
+        reply = self._quit_confirm_box.exec_()
         
         if reply == QMessageBox.Yes:
             logger.info("用户确认退出")
@@ -220,11 +233,7 @@ class TrayApp(QObject):
                 except Exception as e:
                     logger.error(f"退出回调执行失败: {e}", exc_info=True)
             
-            # 隐藏托盘图标
-            if self.tray_icon:
-                self.tray_icon.hide()
-            
-            # 退出应用
+            # 退出应用（托盘图标由 aboutToQuit 触发的 cleanup 隐藏）
             QApplication.quit()
         else:
             logger.debug("用户取消退出")
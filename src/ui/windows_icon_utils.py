@@ -2,13 +2,23 @@
 Windows特定的图标工具模块
 使用Windows API来设置任务栏图标
 """
+import atexit
 import logging
+import os
 import sys
+import weakref
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# WM_SETICON 同步发送的超时时间（毫秒），目标窗口无响应时不阻塞调用线程
+SET_ICON_TIMEOUT_MS = 200
+
+# 已获取的窗口句柄：窗口对象 -> HWND
+# winId() 会强制创建原生窗口句柄，每个窗口只调用一次；窗口销毁后条目自动移除
+_HWND_CACHE: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
 # 尝试导入Windows API
 try:
     import win32gui
@@ -19,6 +29,73 @@ except ImportError:
     HAS_WIN32 = False
     logger.warning("win32api不可用，Windows特定图标功能将不可用")
 
+# 已加载的图标句柄：(图标路径, 修改时间, 宽, 高) -> HICON，多个窗口共用同一个句柄，进程退出时统一释放
+# 不使用 LR_SHARED：系统文档要求从文件加载的图标不要使用该标志，句柄复用由此缓存负责
+_ICON_HANDLE_CACHE: Dict[Tuple[str, float, int, int], int] = {}
+
+
+@atexit.register
+def _destroy_icon_handles() -> None:
+    """释放缓存的图标句柄"""
+    if not HAS_WIN32:
+        return
+    for icon_handle in _ICON_HANDLE_CACHE.values():
+        try:
+            win32gui.DestroyIcon(icon_handle)
+        except Exception as e:
+            logger.debug(f"释放图标句柄失败: {e}")
+    _ICON_HANDLE_CACHE.clear()
+
+
+def _load_icon_handle(icon_path: str, width: int, height: int) -> int:
+    """
+    按指定尺寸加载图标句柄（同一文件同一尺寸只解码一次；文件被修改后重新加载）
+    
+    Args:
+        icon_path: 图标文件路径
+        width: 图标宽度（像素）
+        height: 图标高度（像素）
+        
+    Returns:
+        int: 图标句柄，加载失败时返回0
+    """
+    cache_key = (icon_path, os.path.getmtime(icon_path), width, height)
+    icon_handle = _ICON_HANDLE_CACHE.get(cache_key)
+    if icon_handle is None:
+        icon_handle = win32gui.LoadImage(
+            0,  # hInst: 0表示从文件加载
+            icon_path,
+            win32con.IMAGE_ICON,  # 类型：图标
+            width,
+            height,
+            win32con.LR_LOADFROMFILE  # 从文件加载，从ICO中选取最接近该尺寸的图像
+        )
+        if icon_handle == 0:
+            error_code = win32api.GetLastError()
+            logger.error(f"加载图标失败: {icon_path} ({width}x{height}), 错误代码: {error_code}")
+            return 0
+        _ICON_HANDLE_CACHE[cache_key] = icon_handle
+    return icon_handle
+
+
+def _send_set_icon(hwnd: int, icon_type: int, icon_handle: int) -> None:
+    """
+    发送 WM_SETICON 消息，窗口无响应时改为异步投递，避免阻塞调用线程
+    
+    Args:
+        hwnd: 窗口句柄
+        icon_type: ICON_SMALL 或 ICON_BIG
+        icon_handle: 图标句柄
+    """
+    try:
+        win32gui.SendMessageTimeout(
+            hwnd, win32con.WM_SETICON, icon_type, icon_handle,
+            win32con.SMTO_ABORTIFHUNG, SET_ICON_TIMEOUT_MS
+        )
+    except Exception as e:
+        logger.warning(f"WM_SETICON 同步发送超时或失败，改为异步投递: {e}")
+        win32gui.PostMessage(hwnd, win32con.WM_SETICON, icon_type, icon_handle)
+
 
 def set_window_icon_win32(hwnd: int, icon_path: str) -> bool:
     """
@@ -36,30 +113,26 @@ def set_window_icon_win32(hwnd: int, icon_path: str) -> bool:
         return False
     
     try:
-        # 加载图标
-        icon_handle = win32gui.LoadImage(
-            0,  # hInst: 0表示从文件加载
+        # 按系统度量分别加载小图标和大图标，在当前DPI下直接取ICO中对应尺寸的图像而不是缩放
+        small_icon = _load_icon_handle(
             icon_path,
-            win32con.IMAGE_ICON,  # 类型：图标
-            0,  # 宽度：0表示使用默认大小
-            0,  # 高度：0表示使用默认大小
-            win32con.LR_LOADFROMFILE | win32con.LR_DEFAULTSIZE  # 从文件加载，使用默认大小
+            win32api.GetSystemMetrics(win32con.SM_CXSMICON),
+            win32api.GetSystemMetrics(win32con.SM_CYSMICON)
         )
-        
-        if icon_handle == 0:
-            error_code = win32api.GetLastError()
-            logger.error(f"加载图标失败: {icon_path}, 错误代码: {error_code}")
+        big_icon = _load_icon_handle(
+            icon_path,
+            win32api.GetSystemMetrics(win32con.SM_CXICON),
+            win32api.GetSystemMetrics(win32con.SM_CYICON)
+        )
+        if small_icon == 0 or big_icon == 0:
             return False
         
         # 设置窗口图标（小图标和大图标）
         # WM_SETICON消息用于设置窗口图标
         # ICON_SMALL = 0, ICON_BIG = 1
-        
-        # 设置小图标（16x16，用于任务栏）
-        win32gui.SendMessage(hwnd, win32con.WM_SETICON, win32con.ICON_SMALL, icon_handle)
-        
-        # 设置大图标（32x32，用于Alt+Tab等）
-        win32gui.SendMessage(hwnd, win32con.WM_SETICON, win32con.ICON_BIG, icon_handle)
+        # 小图标（用于任务栏）与大图标（用于Alt+Tab等）连续发送，中间不做其他工作
+        _send_set_icon(hwnd, win32con.ICON_SMALL, small_icon)
+        _send_set_icon(hwnd, win32con.ICON_BIG, big_icon)
         
         logger.info(f"使用Windows API成功设置窗口图标: {icon_path}")
         logger.debug(f"窗口句柄: {hwnd}")
@@ -91,26 +164,29 @@ def set_qt_window_icon_win32(window, icon_path: str) -> bool:
             logger.debug("窗口未显示，无法获取窗口句柄")
             return False
         
-        # 获取窗口的Win32句柄
-        # PyQt5的winId()返回一个整数句柄
-        hwnd = window.winId()
-        
-        if hwnd is None:
-            logger.warning("窗口句柄为None，跳过Windows API图标设置")
-            return False
-        
-        # 转换为整数（PyQt5可能返回不同的类型）
-        try:
-            hwnd_int = int(hwnd)
-        except (ValueError, TypeError):
-            logger.warning(f"无法将窗口句柄转换为整数: {hwnd}, 类型: {type(hwnd)}")
-            return False
-        
-        if hwnd_int == 0:
-            logger.warning("窗口句柄为0，跳过Windows API图标设置")
-            return False
-        
-        logger.debug(f"获取到窗口句柄: {hwnd_int} (原始值: {hwnd})")
+        hwnd_int = _HWND_CACHE.get(window)
+        if hwnd_int is None:
+            # 获取窗口的Win32句柄
+            # PyQt5的winId()返回一个整数句柄
+            hwnd = window.winId()
+            
+            if hwnd is None:
+                logger.warning("窗口句柄为None，跳过Windows API图标设置")
+                return False
+            
+            # 转换为整数（PyQt5可能返回不同的类型）
+            try:
+                hwnd_int = int(hwnd)
+            except (ValueError, TypeError):
+                logger.warning(f"无法将窗口句柄转换为整数: {hwnd}, 类型: {type(hwnd)}")
+                return False
+            
+            if hwnd_int == 0:
+                logger.warning("窗口句柄为0，跳过Windows API图标设置")
+                return False
+            
+            _HWND_CACHE[window] = hwnd_int
+            logger.debug(f"获取到窗口句柄: {hwnd_int} (原始值: {hwnd})")
         
         # 使用Windows API设置图标
         return set_window_icon_win32(hwnd_int, icon_path)
@@ -3,6 +3,8 @@
 集中管理应用程序的版本信息
 """
 import datetime
+import functools
+from typing import Any
 
 # 版本号
 __version__ = "1.0.0"
@@ -15,26 +17,52 @@ APP_AUTHOR = "AutoVoiceType Team"
 APP_COPYRIGHT = f"Copyright © 2025 {APP_AUTHOR}. All rights reserved."
 APP_URL = "https://github.com/yourusername/AutoVoiceType"
 
-# 构建信息
-BUILD_DATE = datetime.datetime.now().strftime("%Y-%m-%d")
-BUILD_YEAR = datetime.datetime.now().year
+# 构建信息（BUILD_DATE、BUILD_YEAR）与版本历史（VERSION_HISTORY）在首次访问时才计算，见模块级 __getattr__
 
-# 版本历史
-VERSION_HISTORY = {
-    "1.0.0": {
-        "date": "2025-12-28",
-        "changes": [
-            "✅ 全局快捷键监听（右Ctrl键）",
-            "✅ 实时语音识别（阿里云DashScope API）",
-            "✅ 自动文本输入（三级降级策略）",
-            "✅ 系统托盘应用",
-            "✅ 录音动画提示",
-            "✅ 配置管理界面",
-            "✅ 首次运行向导",
-            "✅ 开机自启动支持",
-        ]
+
+@functools.lru_cache(maxsize=None)
+def _build_date() -> datetime.date:
+    """获取构建日期（首次访问时取当天日期，之后保持不变）"""
+    return datetime.date.today()
+
+
+@functools.lru_cache(maxsize=None)
+def _version_history() -> dict:
+    """获取版本历史"""
+    return {
+        "1.0.0": {
+            "date": "2025-12-28",
+            "changes": [
+                "✅ 全局快捷键监听（右Ctrl键）",
+                "✅ 实时语音识别（阿里云DashScope API）",
+                "✅ 自动文本输入（三级降级策略）",
+                "✅ 系统托盘应用",
+                "✅ 录音动画提示",
+                "✅ 配置管理界面",
+                "✅ 首次运行向导",
+                "✅ 开机自启动支持",
+            ]
+        }
     }
-}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    按需计算的模块属性（PEP 562），仅在访问时计算
+    
+    Args:
+        name: 属性名
+        
+    Returns:
+        Any: 属性值
+    """
+    if name == "BUILD_DATE":
+        return _build_date().isoformat()
+    if name == "BUILD_YEAR":
+        return _build_date().year
+    if name == "VERSION_HISTORY":
+        return _version_history()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def get_version_string() -> str:
     """
@@ -55,7 +83,7 @@ def get_full_info() -> str:
     return (
         f"{APP_NAME} - {APP_NAME_ZH}\n"
         f"版本: {__version__}\n"
-        f"构建日期: {BUILD_DATE}\n"
+        f"构建日期: {_build_date().isoformat()}\n"
         f"{APP_COPYRIGHT}\n"
         f"网址: {APP_URL}"
     )
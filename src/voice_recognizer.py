@@ -3,12 +3,62 @@
 负责根据配置创建适当的语音识别器
 """
 import logging
-from typing import Callable, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional, Tuple
 
 from recognizers import BaseRecognizer, RecognitionConfig, RecognitionResult, RecognizerFactory
 
 logger = logging.getLogger(__name__)
 
+# 各提供商的配置投影：(识别器中的键名, api配置中的键名, 默认值)
+_PROVIDER_CONFIG_FIELDS = {
+    'dashscope': (
+        ('model', 'dashscope_model', 'qwen3-asr-flash-realtime'),
+        ('base_websocket_url', 'dashscope_base_websocket_url', 'wss://dashscope.aliyuncs.com/api-ws/v1/inference'),
+        ('send_batch_chunks', 'dashscope_send_batch_chunks', 2),
+        ('send_batch_max_ms', 'dashscope_send_batch_max_ms', 400),
+    ),
+    'doubao': (
+        ('url', 'doubao_url', 'wss://openspeech.bytedance.com/api/v3/sauc/bigmodel_async'),
+        ('resource_id', 'doubao_resource_id', 'volc.seedasr.sauc.duration'),
+        ('segment_duration', 'doubao_segment_duration', 200),
+    ),
+}
+
+# 各提供商的凭证投影：(凭证中的键名, api配置中的键名, 默认值)
+_CREDENTIAL_FIELDS = {
+    'dashscope': (
+        ('api_key', 'dashscope_api_key', ''),
+    ),
+    'doubao': (
+        ('app_id', 'doubao_app_id', ''),
+        ('access_token', 'doubao_access_token', ''),
+    ),
+}
+
+
+def _project_provider_configs(
+    provider: str,
+    api_config: Mapping[str, Any]
+) -> Tuple[Mapping[str, Any], Mapping[str, Any]]:
+    """
+    按投影表从API配置中取出提供商配置与凭证
+
+    Args:
+        provider: 提供商名称
+        api_config: API配置字典
+
+    Returns:
+        Tuple[Mapping[str, Any], Mapping[str, Any]]: 只读的(提供商配置, 凭证)，未知提供商时均为空
+    """
+    provider_config = {
+        name: api_config.get(key, default) for name, key, default in _PROVIDER_CONFIG_FIELDS.get(provider, ())
+    }
+    credentials = {
+        name: api_config.get(key, default) for name, key, default in _CREDENTIAL_FIELDS.get(provider, ())
+    }
+    return MappingProxyType(provider_config), MappingProxyType(credentials)
+
 
 class VoiceRecognizer:
     """
@@ -40,20 +90,20 @@ class VoiceRecognizer:
             provider = self.api_config.get('provider', 'dashscope')
             logger.info(f"创建语音识别器，提供商: {provider}")
 
+            provider_config, credentials = _project_provider_configs(provider, self.api_config)
+
             # 构建RecognitionConfig
             recognition_config = RecognitionConfig(
                 sample_rate=self.audio_config.get('sample_rate', 16000),
                 channels=self.audio_config.get('channels', 1),
                 chunk_size=self.audio_config.get('chunk_size', 3200),
                 audio_format=self.audio_config.get('format', 'pcm'),
+                capture_at_native_rate=self.audio_config.get('capture_at_native_rate', False),
                 semantic_punctuation_enabled=self.api_config.get('semantic_punctuation_enabled', False),
                 timeout=self.api_config.get('timeout', 30),
-                provider_config=self._build_provider_config(provider)
+                provider_config=provider_config
             )
 
-            # 构建凭证
-            credentials = self._build_credentials(provider)
-
             # 创建识别器
             self._recognizer = RecognizerFactory.create_recognizer(
                 provider=provider,
@@ -71,61 +121,6 @@ class VoiceRecognizer:
             logger.error(f"创建语音识别器失败: {e}", exc_info=True)
             raise
 
-    def _build_provider_config(self, provider: str) -> dict:
-        """
-        构建提供商特定配置
-
-        Args:
-            provider: 提供商名称
-
-        Returns:
-            dict: 提供商配置
-        """
-        if provider == 'dashscope':
-            return {
-                'model': self.api_config.get('dashscope_model', 'qwen3-asr-flash-realtime'),
-                'base_websocket_url': self.api_config.get(
-                    'dashscope_base_websocket_url',
-                    'wss://dashscope.aliyuncs.com/api-ws/v1/inference'
-                )
-            }
-        elif provider == 'doubao':
-            return {
-                'url': self.api_config.get(
-                    'doubao_url',
-                    'wss://openspeech.bytedance.com/api/v3/sauc/bigmodel_async'
-                ),
-                'resource_id': self.api_config.get(
-                    'doubao_resource_id',
-                    'volc.seedasr.sauc.duration'
-                ),
-                'segment_duration': self.api_config.get('doubao_segment_duration', 200)
-            }
-        else:
-            return {}
-
-    def _build_credentials(self, provider: str) -> dict:
-        """
-        构建提供商凭证
-
-        Args:
-            provider: 提供商名称
-
-        Returns:
-            dict: 凭证字典
-        """
-        if provider == 'dashscope':
-            return {
-                'api_key': self.api_config.get('dashscope_api_key', '')
-            }
-        elif provider == 'doubao':
-            return {
-                'app_id': self.api_config.get('doubao_app_id', ''),
-                'access_token': self.api_config.get('doubao_access_token', '')
-            }
-        else:
-            return {}
-
     def set_result_callback(self, callback: Callable) -> None:
         """
         设置识别结果回调函数
@@ -0,0 +1,8 @@
+"""
+pytest配置
+应用以 src 为工作目录运行（见 CLAUDE.md），测试同样把 src 加入模块搜索路径
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
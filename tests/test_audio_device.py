@@ -0,0 +1,113 @@
+"""
+Tests for the hardware-independent helpers in recognizers.audio_device
+"""
+import numpy as np
+import pytest
+
+from recognizers.audio_device import aligned_frames_per_buffer, decimate_int16, native_rate_factor
+
+
+class _FakePyAudio:
+    """Minimal stand-in exposing only the default input device query"""
+
+    def __init__(self, device_info=None, error=None):
+        self._device_info = device_info
+        self._error = error
+
+    def get_default_input_device_info(self):
+        if self._error is not None:
+            raise self._error
+        return self._device_info
+
+
+def _pcm(*samples):
+    return np.array(samples, dtype=np.int16).tobytes()
+
+
+def _samples(data):
+    return np.frombuffer(data, dtype=np.int16).tolist()
+
+
+class TestDecimateInt16:
+    def test_averages_each_group(self):
+        assert _samples(decimate_int16(_pcm(10, 20, 30, 50, 100, 200), 2, 1)) == [15, 40, 150]
+
+    def test_drops_trailing_partial_group(self):
+        # 7 mono frames at factor 3: the last frame does not complete a group
+        data = _pcm(3, 3, 3, 6, 6, 6, 1000)
+        assert _samples(decimate_int16(data, 3, 1)) == [3, 6]
+
+    def test_interleaved_stereo_channels_are_averaged_separately(self):
+        # L/R pairs: (0, 100), (10, 200), (20, 300), (30, 400)
+        data = _pcm(0, 100, 10, 200, 20, 300, 30, 400)
+        assert _samples(decimate_int16(data, 2, 2)) == [5, 150, 25, 350]
+
+    def test_stereo_trailing_partial_group(self):
+        data = _pcm(0, 100, 10, 200, 20, 300)
+        assert _samples(decimate_int16(data, 2, 2)) == [5, 150]
+
+    def test_negative_sums_round_down(self):
+        # Floor division: (-1 + -2) // 2 == -2, not -1
+        assert _samples(decimate_int16(_pcm(-1, -2, 1, 2), 2, 1)) == [-2, 1]
+
+    def test_full_scale_does_not_overflow(self):
+        data = _pcm(32767, 32767, -32768, -32768)
+        assert _samples(decimate_int16(data, 2, 1)) == [32767, -32768]
+
+    def test_shorter_than_one_group_returns_empty(self):
+        assert decimate_int16(_pcm(1, 2), 3, 1) == b''
+
+
+class TestNativeRateFactor:
+    @pytest.mark.parametrize("native_rate, expected", [
+        (48000.0, 3),
+        (32000.0, 2),
+        (44100.0, 1),  # not an integer multiple of 16 kHz
+        (22050.0, 1),
+        (16000.0, 1),
+        (8000.0, 1),   # below the target rate
+    ])
+    def test_factor(self, native_rate, expected):
+        pa = _FakePyAudio({'defaultSampleRate': native_rate})
+        assert native_rate_factor(pa, 16000) == expected
+
+    def test_query_failure_returns_one(self):
+        pa = _FakePyAudio(error=OSError("No Default Input Device Available"))
+        assert native_rate_factor(pa, 16000) == 1
+
+
+class TestAlignedFramesPerBuffer:
+    @staticmethod
+    def _pa(latency_seconds):
+        return _FakePyAudio({'defaultLowInputLatency': latency_seconds})
+
+    def test_rounds_down_to_whole_periods(self):
+        # 0.09 s at 16 kHz = 1440-frame period
+        assert aligned_frames_per_buffer(self._pa(0.09), 16000, 3200) == 2880
+
+    def test_already_aligned_is_unchanged(self):
+        assert aligned_frames_per_buffer(self._pa(0.01), 16000, 3200) == 3200
+
+    def test_period_larger_than_request_returns_one_period(self):
+        assert aligned_frames_per_buffer(self._pa(0.25), 16000, 3200) == 4000
+
+    def test_aligns_to_lcm_of_period_and_multiple(self):
+        # 0.0087 s at 48 kHz = 417-frame period; lcm(417, 3) = 417, lcm(417, 2) = 834
+        assert aligned_frames_per_buffer(self._pa(0.0087), 48000, 9600, multiple=3) == 9591
+        assert aligned_frames_per_buffer(self._pa(0.0087), 48000, 9600, multiple=2) == 9174
+
+    def test_lcm_result_is_divisible_by_multiple(self):
+        frames = aligned_frames_per_buffer(self._pa(0.0101), 48000, 9600, multiple=3)
+        assert frames % 3 == 0
+        assert frames % 484 == 0
+
+    def test_unknown_latency_keeps_requested_size(self):
+        pa = _FakePyAudio(error=OSError("No Default Input Device Available"))
+        assert aligned_frames_per_buffer(pa, 16000, 3200) == 3200
+
+    def test_unknown_latency_still_rounds_to_multiple(self):
+        pa = _FakePyAudio(error=OSError("No Default Input Device Available"))
+        assert aligned_frames_per_buffer(pa, 48000, 9601, multiple=3) == 9600
+
+    def test_zero_latency_keeps_requested_size(self):
+        assert aligned_frames_per_buffer(self._pa(0.0), 16000, 3200) == 3200
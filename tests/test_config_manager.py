@@ -0,0 +1,67 @@
+"""
+ConfigManager.update 批量设置测试
+"""
+import copy
+
+import pytest
+
+from config_manager import ConfigManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return ConfigManager(config_dir=str(tmp_path))
+
+
+def _apply_with_set(manager: ConfigManager, changes: dict) -> None:
+    for key_path, value in changes.items():
+        assert manager.set(key_path, value)
+
+
+class TestUpdate:
+    def test_root_level_keys(self, manager):
+        assert manager.update({"first_run_done": True, "theme": "dark"})
+        assert manager.get("first_run_done") is True
+        assert manager.get("theme") == "dark"
+
+    def test_several_keys_in_one_section(self, manager):
+        assert manager.update({
+            "api.provider": "doubao",
+            "api.doubao_app_id": "app",
+            "api.doubao_access_token": "token",
+        })
+        assert manager.get("api.provider") == "doubao"
+        assert manager.get("api.doubao_app_id") == "app"
+        assert manager.get("api.doubao_access_token") == "token"
+        # 同一配置节中未涉及的键保持不变
+        assert manager.get("api.dashscope_model") == ConfigManager.DEFAULT_CONFIG["api"]["dashscope_model"]
+
+    def test_creates_missing_sections(self, manager):
+        assert manager.update({"plugins.demo.enabled": True})
+        assert manager.get("plugins.demo.enabled") is True
+
+    def test_matches_repeated_set(self, tmp_path):
+        changes = {
+            "api.provider": "doubao",
+            "api.doubao_segment_duration": 100,
+            "audio.chunk_size": 1600,
+            "audio.capture_at_native_rate": True,
+            "general.log_level": "DEBUG",
+            "plugins.demo.enabled": True,
+            "theme": "dark",
+        }
+        batched = ConfigManager(config_dir=str(tmp_path / "batched"))
+        repeated = ConfigManager(config_dir=str(tmp_path / "repeated"))
+
+        assert batched.update(changes)
+        _apply_with_set(repeated, changes)
+
+        assert batched.config == repeated.config
+
+    def test_does_not_modify_default_config(self, manager):
+        defaults = copy.deepcopy(ConfigManager.DEFAULT_CONFIG)
+        manager.update({"api.provider": "doubao", "audio.chunk_size": 1600})
+        assert ConfigManager.DEFAULT_CONFIG == defaults
+
+    def test_reports_failure_for_non_dict_parent(self, manager):
+        assert not manager.update({"api.provider.name": "doubao"})
@@ -0,0 +1,72 @@
+"""
+_send_unicode_input 的UTF-16打包测试（替换 _user32.SendInput，无需Windows）
+"""
+import ctypes
+
+import pytest
+
+import text_simulator
+from text_simulator import INPUT_KEYBOARD, KEYEVENTF_KEYUP, KEYEVENTF_UNICODE, _INPUT, _send_unicode_input
+
+
+class _FakeUser32:
+    """记录SendInput调用参数，返回预设的注入事件数"""
+
+    def __init__(self, result=None):
+        self.result = result
+        self.calls = []
+
+    def SendInput(self, count, inputs, size):
+        self.calls.append((count, inputs, size))
+        return count if self.result is None else self.result
+
+
+@pytest.fixture
+def user32(monkeypatch):
+    fake = _FakeUser32()
+    monkeypatch.setattr(text_simulator, "_user32", fake)
+    return fake
+
+
+def _records(inputs):
+    return [(item.type, item.ki.wScan, item.ki.dwFlags) for item in inputs]
+
+
+def test_bmp_characters_one_pair_per_character(user32):
+    assert _send_unicode_input("中a") == 4
+
+    count, inputs, size = user32.calls[0]
+    assert count == 4
+    assert size == ctypes.sizeof(_INPUT)
+    assert _records(inputs) == [
+        (INPUT_KEYBOARD, ord("中"), KEYEVENTF_UNICODE),
+        (INPUT_KEYBOARD, ord("中"), KEYEVENTF_UNICODE | KEYEVENTF_KEYUP),
+        (INPUT_KEYBOARD, ord("a"), KEYEVENTF_UNICODE),
+        (INPUT_KEYBOARD, ord("a"), KEYEVENTF_UNICODE | KEYEVENTF_KEYUP),
+    ]
+
+
+def test_non_bmp_character_sent_as_surrogate_pair(user32):
+    # U+1F600 -> UTF-16 代理对 D83D DE00，共4个INPUT记录
+    assert _send_unicode_input("\U0001F600") == 4
+
+    count, inputs, _ = user32.calls[0]
+    assert count == 4
+    assert [item.ki.wScan for item in inputs] == [0xD83D, 0xD83D, 0xDE00, 0xDE00]
+
+
+def test_keyup_flag_only_on_odd_entries(user32):
+    _send_unicode_input("a\U0001F600中")
+
+    count, inputs, _ = user32.calls[0]
+    assert count == 8
+    for index, item in enumerate(inputs):
+        assert item.type == INPUT_KEYBOARD
+        assert item.ki.dwFlags & KEYEVENTF_UNICODE
+        assert bool(item.ki.dwFlags & KEYEVENTF_KEYUP) == (index % 2 == 1)
+
+
+def test_returns_injected_count(monkeypatch):
+    fake = _FakeUser32(result=3)
+    monkeypatch.setattr(text_simulator, "_user32", fake)
+    assert _send_unicode_input("ab") == 3
@@ -10,9 +10,9 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
-from PyQt5.QtGui import QIcon, QPixmap, QPainter
+from PyQt5.QtGui import QImage, QPainter
 from PyQt5.QtSvg import QSvgRenderer
-from PyQt5.QtCore import QSize
+from PyQt5.QtCore import Qt
 
 logging.basicConfig(
     level=logging.INFO,
@@ -50,62 +50,42 @@ def svg_to_ico(svg_path: Path, ico_path: Path, sizes: list = None) -> bool:
             logger.error(f"SVG 文件无效: {svg_path}")
             return False
         
-        # 创建 QIcon 对象
-        icon = QIcon()
+        # 只在最大尺寸渲染一次 SVG，其余尺寸由 PIL 在生成多尺寸 ICO 时重采样得到
+        # 直接渲染为 RGBA8888，像素布局与 PIL 的 'RGBA' 模式一致，可在内存中交给 PIL
+        max_size = max(sizes)
+        image = QImage(max_size, max_size, QImage.Format_RGBA8888)
+        image.fill(Qt.transparent)  # 填充透明背景
         
-        # 为每个尺寸创建像素图并添加到图标
-        for size in sizes:
-            pixmap = QPixmap(size, size)
-            pixmap.fill()  # 填充透明背景
-            
-            # 渲染 SVG 到像素图
-            painter = QPainter(pixmap)
-            painter.setRenderHint(QPainter.Antialiasing)
-            renderer.render(painter)
-            painter.end()
-            
-            # 添加到图标
-            icon.addPixmap(pixmap)
-            logger.debug(f"已添加 {size}x{size} 尺寸的图标")
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing)
+        renderer.render(painter)
+        painter.end()
+        logger.debug(f"已渲染 {max_size}x{max_size} 尺寸的图像")
         
-        # 保存为 ICO 文件
-        # 注意：QIcon 不能直接保存为 ICO，需要使用其他方法
-        # 这里我们使用 QIcon 的 save 方法，但需要确保格式正确
-        # 实际上，PyQt5 的 QIcon 不支持直接保存为 ICO
-        # 我们需要使用 PIL/Pillow 或其他库
+        # 使用 PIL 生成多尺寸 ICO（QImage 不能直接保存为 ICO），不经过临时 PNG 文件
+        try:
+            from PIL import Image
+        except ImportError:
+            logger.warning("PIL/Pillow 未安装，无法创建 ICO 文件")
+            logger.info("请安装 Pillow: pip install Pillow")
+            return False
         
-        # 临时方案：保存为 PNG，然后使用 PIL 转换为 ICO
-        # 或者，直接使用最大的尺寸作为 ICO（Windows 会缩放）
-        temp_png = ico_path.with_suffix('.png')
-        largest_pixmap = icon.pixmap(max(sizes), max(sizes))
-        if largest_pixmap.save(str(temp_png), 'PNG'):
-            logger.info(f"已保存临时 PNG 文件: {temp_png}")
+        try:
+            bits = image.constBits()
+            bits.setsize(image.sizeInBytes())
+            img = Image.frombuffer(
+                'RGBA', (image.width(), image.height()), bytes(bits),
+                'raw', 'RGBA', image.bytesPerLine(), 1
+            )
+            
+            # 创建包含多个尺寸的 ICO 文件
+            ico_sizes = [(s, s) for s in sizes]
+            img.save(str(ico_path), format='ICO', sizes=ico_sizes)
+            logger.info(f"成功创建 ICO 文件: {ico_path}")
             
-            # 尝试使用 PIL 转换为 ICO
-            try:
-                from PIL import Image
-                img = Image.open(temp_png)
-                
-                # 创建包含多个尺寸的 ICO 文件
-                ico_sizes = [(s, s) for s in sizes]
-                img.save(str(ico_path), format='ICO', sizes=ico_sizes)
-                logger.info(f"成功创建 ICO 文件: {ico_path}")
-                
-                # 删除临时 PNG 文件
-                temp_png.unlink()
-                logger.debug(f"已删除临时文件: {temp_png}")
-                
-                return True
-            except ImportError:
-                logger.warning("PIL/Pillow 未安装，无法创建 ICO 文件")
-                logger.info("请安装 Pillow: pip install Pillow")
-                logger.info(f"或者手动将 {temp_png} 转换为 ICO 文件")
-                return False
-            except Exception as e:
-                logger.error(f"转换 PNG 到 ICO 时出错: {e}", exc_info=True)
-                return False
-        else:
-            logger.error("保存 PNG 文件失败")
+            return True
+        except Exception as e:
+            logger.error(f"生成 ICO 文件时出错: {e}", exc_info=True)
             return False
             
     except Exception as e: